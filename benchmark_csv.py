@@ -0,0 +1,202 @@
+"""
+Benchmark the COVID-19 CSV processing engines.
+
+Builds a synthetic OWID-style file by repeating the rows of
+data/covid_19_data.csv and reports the throughput of each
+analyze_covid_data engine in rows per second, how the
+parallel mode scales from 1 to N worker processes, how
+checkpointed runs compare with full recomputes as daily rows
+are appended, how K metrics in one aggregate_covid_data
+pass compare with K separate passes, and cold versus warm
+runs with the typed column cache.
+
+Run this script directly:
+    py benchmark_csv.py
+"""
+
+#####################################
+# Import Modules at the Top
+#####################################
+
+# Import from Python Standard Library
+import os
+import pathlib
+import tempfile
+import time
+
+# Import from local project modules
+from utils_logger import logger
+import vrtachnik_process_csv
+
+#####################################
+# Declare Global Variables
+#####################################
+
+covid_sample_file = pathlib.Path(__file__).parent / "data" / "covid_19_data.csv"
+
+# Size of the synthetic file (raise to several GB for a full run)
+synthetic_size_bytes: int = 200 * 1024 * 1024
+
+# Largest worker count in the scaling benchmark
+max_benchmark_workers: int = os.cpu_count() or 1
+
+# Number of daily appends in the checkpoint benchmark
+append_cycles: int = 7
+
+# Metrics computed in the group-by benchmark
+benchmark_metrics: tuple = (
+    ("sum", "total_cases"),
+    ("sum", "total_deaths"),
+    ("max", "total_cases"),
+    ("mean", "total_cases_per_million"),
+    ("min", "new_cases"),
+    ("count", "icu_patients"),
+)
+
+#####################################
+# Define Functions
+#####################################
+
+def make_covid_file(folder: pathlib.Path, filename: str, size: int) -> tuple:
+    """
+    Write an OWID-style CSV of roughly size bytes by repeating the sample rows.
+
+    Returns:
+        tuple: (path to the file, number of data rows)
+    """
+    lines = covid_sample_file.read_bytes().splitlines(keepends=True)
+    header, rows = lines[0], b"".join(lines[1:])
+    repeats = max(1, size // len(rows))
+    file_path = folder / filename
+    with file_path.open('wb') as file:
+        file.write(header)
+        for _ in range(repeats):
+            file.write(rows)
+    return file_path, repeats * (len(lines) - 1)
+
+
+def benchmark_engines(file_path: pathlib.Path, row_count: int) -> None:
+    """
+    Run every analyze_covid_data engine on the file and report rows per second.
+    """
+    baseline = None
+    for engine in vrtachnik_process_csv.csv_engines:
+        start = time.perf_counter()
+        stats = vrtachnik_process_csv.analyze_covid_data(file_path, engine=engine)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or stats
+        print(
+            f"engine={engine}: {row_count:,} rows in {elapsed:.2f}s "
+            f"({row_count / elapsed:,.0f} rows/s), same stats={stats == baseline}"
+        )
+
+
+def benchmark_workers(file_path: pathlib.Path, row_count: int, max_workers: int = None) -> None:
+    """
+    Run the parallel mode with 1, 2, 4, ... up to max_workers processes
+    (max_benchmark_workers by default) and report the speedup.
+    """
+    max_workers = max_workers or max_benchmark_workers
+    worker_counts = sorted({min(2 ** power, max_workers) for power in range(max_workers.bit_length() + 1)})
+    chunk_size = max(1, file_path.stat().st_size // (4 * max_workers))  # About four chunks per worker
+    baseline_seconds, baseline = None, None
+    for workers in worker_counts:
+        start = time.perf_counter()
+        stats = vrtachnik_process_csv.analyze_covid_data(file_path, workers=workers, chunk_size=chunk_size)
+        elapsed = time.perf_counter() - start
+        baseline_seconds, baseline = baseline_seconds or elapsed, baseline or stats
+        print(
+            f"workers={workers}: {row_count:,} rows in {elapsed:.2f}s "
+            f"({row_count / elapsed:,.0f} rows/s, {baseline_seconds / elapsed:.2f}x), same stats={stats == baseline}"
+        )
+
+
+def benchmark_append_cycles(file_path: pathlib.Path, cycles: int = None) -> None:
+    """
+    Append one day of rows per cycle and time a checkpointed run against a full recompute.
+    """
+    cycles = cycles or append_cycles
+    day_rows = b"".join(covid_sample_file.read_bytes().splitlines(keepends=True)[1:])
+    checkpoint_path = file_path.with_name("checkpoint.json")
+    vrtachnik_process_csv.analyze_covid_data_incremental(file_path, checkpoint_path)  # First run reads everything
+    for cycle in range(1, cycles + 1):
+        with file_path.open('ab') as file:
+            file.write(day_rows)
+
+        start = time.perf_counter()
+        incremental = vrtachnik_process_csv.analyze_covid_data_incremental(file_path, checkpoint_path)
+        incremental_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        full = vrtachnik_process_csv.analyze_covid_data(file_path)
+        full_seconds = time.perf_counter() - start
+        print(
+            f"append day {cycle}: checkpointed {incremental_seconds * 1000:.1f} ms, "
+            f"full recompute {full_seconds * 1000:.1f} ms, same stats={incremental == full}"
+        )
+
+
+def benchmark_group_by(file_path: pathlib.Path, metrics: tuple = benchmark_metrics) -> None:
+    """
+    Time all metrics in one aggregate_covid_data pass against one pass per metric.
+    """
+    start = time.perf_counter()
+    one_pass = vrtachnik_process_csv.aggregate_covid_data(file_path, metrics=metrics)
+    one_pass_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    separate = {}
+    for metric in metrics:
+        for key, values in vrtachnik_process_csv.aggregate_covid_data(file_path, metrics=(metric,)).items():
+            separate.setdefault(key, {}).update(values)
+    separate_seconds = time.perf_counter() - start
+
+    print(
+        f"{len(metrics)} metrics: one pass {one_pass_seconds:.2f}s, "
+        f"{len(metrics)} passes {separate_seconds:.2f}s, same results={one_pass == separate}"
+    )
+
+
+def benchmark_column_cache(file_path: pathlib.Path, metrics: tuple = benchmark_metrics) -> None:
+    """
+    Time text parsing against cold (cache filled) and warm (memory-mapped) column cache runs.
+    """
+    runs = (
+        ("analyze_covid_data", lambda use_cache: vrtachnik_process_csv.analyze_covid_data(file_path, use_column_cache=use_cache)),
+        ("aggregate_covid_data", lambda use_cache: vrtachnik_process_csv.aggregate_covid_data(
+            file_path, metrics=metrics, use_column_cache=use_cache)),
+    )
+    for name, run in runs:
+        timings = {}
+        for label, use_cache in (("text", False), ("cold cache", True), ("warm cache", True)):
+            start = time.perf_counter()
+            result = run(use_cache)
+            timings[label] = (time.perf_counter() - start, result)
+        same = timings["text"][1] == timings["cold cache"][1] == timings["warm cache"][1]
+        print(f"{name}: " + ", ".join(f"{label} {seconds:.2f}s" for label, (seconds, _) in timings.items()) + f", same results={same}")
+
+#####################################
+# Define main() function
+#####################################
+
+def main():
+    """
+    Run all CSV benchmarks.
+    """
+    logger.info("Starting CSV benchmarks...")
+    with tempfile.TemporaryDirectory() as folder:
+        file_path, row_count = make_covid_file(pathlib.Path(folder), "covid.csv", synthetic_size_bytes)
+        print(f"{file_path.stat().st_size:,} byte synthetic file, {row_count:,} rows")
+        benchmark_engines(file_path, row_count)
+        benchmark_workers(file_path, row_count)
+        benchmark_append_cycles(file_path)
+        benchmark_group_by(file_path)
+        benchmark_column_cache(file_path)
+    logger.info("CSV benchmarks complete.")
+
+#####################################
+# Conditional Execution
+#####################################
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,245 @@
+"""
+Benchmark the Excel processing paths.
+
+Builds a synthetic World Bank style population workbook (title rows,
+a header row, ranked countries, then regional totals and footnotes)
+and compares the old top 3 approach (collect every row, sort, slice)
+with the streaming heap-based top-K in vrtachnik_process_excel, and
+the openpyxl reader with the XML streaming reader (utils_xlsx) in rows/s.
+It also builds a large copy of the example feedback sheet and compares
+the old full-load word count with the column-projected scan, and runs
+the batch mode (vrtachnik_process_excel_batch) over a folder of
+multi-sheet workbooks with 1, 2, 4, ... worker processes.
+
+Run this script directly:
+    py benchmark_excel.py
+"""
+
+#####################################
+# Import Modules at the Top
+#####################################
+
+# Import from Python Standard Library
+import os
+import pathlib
+import random
+import tempfile
+import time
+import tracemalloc
+
+# Import from external packages
+import openpyxl
+
+# Import from local project modules
+from utils_logger import logger
+import example_process_excel
+import vrtachnik_process_excel
+import vrtachnik_process_excel_batch
+
+#####################################
+# Declare Global Variables
+#####################################
+
+# Number of ranked rows in the synthetic workbook
+synthetic_rows: int = 1_000_000
+
+# Number of rows in the synthetic feedback sheet
+feedback_rows: int = 500_000
+
+feedback_sample_file = pathlib.Path(__file__).parent / "example_data" / "feedback.xlsx"
+
+# Shape of the synthetic folder for the batch scaling benchmark
+batch_workbooks: int = 8
+batch_sheets: int = 4
+batch_rows_per_sheet: int = 25_000
+
+# Largest worker count in the scaling benchmark
+max_benchmark_workers: int = os.cpu_count() or 1
+
+#####################################
+# Define Functions
+#####################################
+
+def make_population_workbook(folder: pathlib.Path, filename: str, rows: int, sheets: int = 1, seed: int = 42) -> pathlib.Path:
+    """
+    Write a population workbook laid out like the World Bank POP.xlsx with rows ranked countries on each of sheets sheets.
+    """
+    generator = random.Random(seed)
+    workbook = openpyxl.Workbook(write_only=True)
+    for number in range(1, sheets + 1):
+        sheet = workbook.create_sheet("POP" if number == 1 else f"POP {number}")
+        sheet.append([None, "Population 2022"])
+        sheet.append([])
+        sheet.append([])
+        sheet.append([None, "Ranking", None, "Economy", "(thousands)"])
+        sheet.append([])
+        for ranking in range(1, rows + 1):
+            sheet.append([f"C{ranking:07d}", ranking, None, f"Country {ranking}", round(generator.uniform(10, 1_500_000), 3), ""])
+        sheet.append([])
+        sheet.append(["WLD", None, None, "World", 7951149.546])
+        sheet.append([None, "a. Footnote."])
+    file_path = folder / filename
+    workbook.save(file_path)
+    return file_path
+
+
+def make_feedback_workbook(folder: pathlib.Path, filename: str, rows: int) -> pathlib.Path:
+    """
+    Write a feedback workbook of rows answers by repeating the rows of the example feedback sheet.
+    """
+    sample = openpyxl.load_workbook(feedback_sample_file, read_only=True)
+    header, *answers = list(sample.active.iter_rows(values_only=True))
+    sample.close()
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet("Feedback")
+    sheet.append(header)
+    for row in range(rows):
+        sheet.append(answers[row % len(answers)])
+    file_path = folder / filename
+    workbook.save(file_path)
+    return file_path
+
+
+def count_word_in_column_full_load(file_path: pathlib.Path, column_letter: str, word: str) -> int:
+    """The old count_word_in_column: load every cell, index the column, lower() each value."""
+    workbook = openpyxl.load_workbook(file_path)
+    sheet = workbook.active
+    count = 0
+    for cell in sheet[column_letter]:
+        if cell.value and isinstance(cell.value, str):
+            count += cell.value.lower().count(word.lower())
+    return count
+
+
+def get_top_3_population_sorted(file_path: pathlib.Path) -> list:
+    """The old approach over the whole sheet: collect every (country, population) pair, sort, slice."""
+    workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    sheet = workbook.active
+    population_data = []
+    for row in sheet.iter_rows(min_row=6, values_only=True):
+        if row is None or len(row) < 5 or not isinstance(row[1], (int, float)):
+            continue
+        country, population = row[3], row[4]
+        if country and population is not None:
+            try:
+                population_data.append((country, int(float(str(population).replace(",", "").strip()))))
+            except (ValueError, TypeError):
+                continue
+    workbook.close()
+    return sorted(population_data, key=lambda x: x[1], reverse=True)[:3]
+
+
+def measure(function, file_path: pathlib.Path) -> tuple:
+    """
+    Run function(file_path) twice: once for wall time, once under tracemalloc.
+
+    Returns:
+        tuple: (result, seconds, peak traced MB)
+    """
+    start = time.perf_counter()
+    result = function(file_path)
+    seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    function(file_path)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return (result, seconds, peak / (1024 * 1024))
+
+
+def benchmark_top_population(file_path: pathlib.Path, rows: int) -> None:
+    """
+    Compare sort-everything with the streaming heap top-K on the same workbook.
+    """
+    baseline = None
+    for label, function in (
+        ("collect + sort", get_top_3_population_sorted),
+        ("streaming heap", lambda path: vrtachnik_process_excel.get_top_population(path, reader="openpyxl")),
+    ):
+        result, seconds, peak = measure(function, file_path)
+        baseline = baseline or result
+        print(
+            f"{label}: {rows:,} rows in {seconds:.2f}s ({rows / seconds:,.0f} rows/s), "
+            f"{peak:.1f} MB peak, same result={result == baseline}"
+        )
+
+
+def benchmark_readers(file_path: pathlib.Path, rows: int) -> None:
+    """
+    Compare the rows/s of get_top_population with each worksheet reader.
+    """
+    baseline = None
+    for reader in vrtachnik_process_excel.excel_readers:
+        start = time.perf_counter()
+        result = vrtachnik_process_excel.get_top_population(file_path, reader=reader)
+        seconds = time.perf_counter() - start
+        baseline = baseline or result
+        print(f"reader={reader}: {rows:,} rows in {seconds:.2f}s ({rows / seconds:,.0f} rows/s), same result={result == baseline}")
+
+
+def benchmark_word_count(file_path: pathlib.Path, rows: int, column_letter: str = "A", word: str = "GitHub") -> None:
+    """
+    Compare the full-load word count with the column-projected scan for time and peak memory.
+    """
+    baseline = None
+    for label, function in (
+        ("full load", count_word_in_column_full_load),
+        ("column scan", example_process_excel.count_word_in_column),
+    ):
+        count, seconds, peak = measure(lambda path: function(path, column_letter, word), file_path)
+        baseline = baseline if baseline is not None else count
+        print(f"{label}: {rows:,} rows in {seconds:.2f}s, {peak:.1f} MB peak, count={count:,}, same count={count == baseline}")
+
+
+def benchmark_batch_workers(pattern: str, row_count: int, max_workers: int = None) -> None:
+    """
+    Run the batch top population task with 1, 2, 4, ... up to max_workers processes
+    (max_benchmark_workers by default) and report the speedup.
+    """
+    max_workers = max_workers or max_benchmark_workers
+    worker_counts = sorted({min(2 ** power, max_workers) for power in range(max_workers.bit_length() + 1)})
+    baseline_seconds, baseline = None, None
+    for workers in worker_counts:
+        start = time.perf_counter()
+        _, top = vrtachnik_process_excel_batch.process_workbooks(pattern, "top_population", workers=workers)
+        elapsed = time.perf_counter() - start
+        baseline_seconds, baseline = baseline_seconds or elapsed, baseline or top
+        print(
+            f"workers={workers}: {row_count:,} rows in {elapsed:.2f}s "
+            f"({row_count / elapsed:,.0f} rows/s, {baseline_seconds / elapsed:.2f}x), same result={top == baseline}"
+        )
+
+#####################################
+# Define main() function
+#####################################
+
+def main():
+    """
+    Run all Excel benchmarks.
+    """
+    logger.info("Starting Excel benchmarks...")
+    with tempfile.TemporaryDirectory() as folder:
+        file_path = make_population_workbook(pathlib.Path(folder), "population.xlsx", synthetic_rows)
+        print(f"{file_path.stat().st_size:,} byte workbook, {synthetic_rows:,} rows")
+        benchmark_top_population(file_path, synthetic_rows)
+        benchmark_readers(file_path, synthetic_rows)
+
+        file_path = make_feedback_workbook(pathlib.Path(folder), "feedback.xlsx", feedback_rows)
+        print(f"{file_path.stat().st_size:,} byte workbook, {feedback_rows:,} rows")
+        benchmark_word_count(file_path, feedback_rows)
+
+        batch_folder = pathlib.Path(folder, "batch")
+        batch_folder.mkdir()
+        for number in range(batch_workbooks):
+            make_population_workbook(batch_folder, f"population_{number}.xlsx", batch_rows_per_sheet, batch_sheets, seed=number)
+        row_count = batch_workbooks * batch_sheets * batch_rows_per_sheet
+        print(f"{batch_workbooks} workbooks x {batch_sheets} sheets, {row_count:,} rows")
+        benchmark_batch_workers(str(batch_folder / "*.xlsx"), row_count)
+    logger.info("Excel benchmarks complete.")
+
+#####################################
+# Conditional Execution
+#####################################
+
+if __name__ == '__main__':
+    main()
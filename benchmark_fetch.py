@@ -0,0 +1,382 @@
+"""
+Benchmark the fetch layer against a local HTTP server.
+
+The server is a stand-in for the real upstream hosts. It counts the
+requests it receives and the body bytes it sends, so each benchmark can
+report how much network work a fetch strategy really costs.
+
+Run this script directly:
+    py benchmark_fetch.py
+"""
+
+#####################################
+# Import Modules at the Top
+#####################################
+
+# Import from Python Standard Library
+import gzip
+import http.server
+import os
+import pathlib
+import random
+import re
+import shutil
+import tempfile
+import threading
+import time
+
+# Import from external packages
+import requests
+
+# Import from local project modules
+from utils_logger import logger
+from utils_fetch import download_to_file, get_session
+from utils_hash import hash_file
+from utils_compress import find_data_file, get_compression, zstandard
+import vrtachnik_get_csv
+import vrtachnik_process_csv
+
+#####################################
+# Declare Global Variables
+#####################################
+
+payload_size_bytes: int = 5 * 1024 * 1024
+fetch_runs: int = 5
+small_file_count: int = 200
+small_file_size_bytes: int = 16 * 1024
+flaky_payload_size_bytes: int = 20 * 1024 * 1024
+flaky_drop_probability: float = 0.8
+covid_payload_size_bytes: int = 30 * 1024 * 1024
+covid_sample_file = pathlib.Path(__file__).parent / "data" / "covid_19_data.csv"
+
+#####################################
+# Define Local Test Server
+#####################################
+
+class CountingServer(http.server.ThreadingHTTPServer):
+    """Threaded HTTP server that keeps request and byte counters."""
+
+    daemon_threads = True
+
+    def __init__(self, server_address, handler_class):
+        super().__init__(server_address, handler_class)
+        self.lock = threading.Lock()
+        self.reset_counters()
+
+    def reset_counters(self) -> None:
+        """Set all counters back to zero."""
+        with self.lock:
+            self.connection_count = 0
+            self.request_count = 0
+            self.bytes_sent = 0
+            self.not_modified_count = 0
+            self.resumed_count = 0
+
+    def add(self, counter: str, amount: int = 1) -> None:
+        """Increase one of the counters in a thread-safe way."""
+        with self.lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+
+
+class CountingHandler(http.server.SimpleHTTPRequestHandler):
+    """Static file handler with ETag support that reports to a CountingServer."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        """Keep the benchmark output quiet."""
+
+    def setup(self):
+        """Count every new client connection (one handler per connection)."""
+        self.server.add("connection_count")
+        super().setup()
+
+    def get_etag(self, file_path: str) -> str:
+        """Return a weak validator built from the file size and modification time."""
+        stat = os.stat(file_path)
+        return f'"{stat.st_size:x}-{stat.st_mtime_ns:x}"'
+
+    def send_head(self):
+        """Answer 304 when If-None-Match matches, serve Range requests, otherwise serve the file."""
+        self.server.add("request_count")
+        self.etag = None
+        file_path = self.translate_path(self.path)
+        if os.path.isfile(file_path):
+            self.etag = self.get_etag(file_path)
+            if self.headers.get("If-None-Match") == self.etag:
+                self.server.add("not_modified_count")
+                self.send_response(304)
+                self.end_headers()
+                return None
+            if "gzip" in self.headers.get("Accept-Encoding", "") and os.path.isfile(file_path + ".gz"):
+                return self.send_precompressed_head(file_path)
+            range_header = self.headers.get("Range")
+            if_range = self.headers.get("If-Range")
+            if range_header and (if_range is None or if_range == self.etag):
+                return self.send_range_head(file_path, range_header)
+        return super().send_head()
+
+    def send_precompressed_head(self, file_path: str):
+        """Serve the .gz copy of file_path with Content-Encoding: gzip (like nginx gzip_static)."""
+        encoded_path = file_path + ".gz"
+        self.etag = self.get_etag(encoded_path)
+        file = open(encoded_path, 'rb')
+        self.send_response(200)
+        self.send_header("Content-Type", self.guess_type(file_path))
+        self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(os.path.getsize(encoded_path)))
+        self.end_headers()
+        return file
+
+    def send_range_head(self, file_path: str, range_header: str):
+        """Send a 206 (or 416) response for an open-ended "bytes=N-" range."""
+        match = re.fullmatch(r"bytes=(\d+)-", range_header.strip())
+        if not match:
+            return super().send_head()
+        size = os.path.getsize(file_path)
+        first_byte = int(match.group(1))
+        if first_byte >= size:
+            self.send_response(416)
+            self.send_header("Content-Range", f"bytes */{size}")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return None
+        file = open(file_path, 'rb')
+        file.seek(first_byte)
+        self.server.add("resumed_count")
+        self.send_response(206)
+        self.send_header("Content-Type", self.guess_type(file_path))
+        self.send_header("Content-Range", f"bytes {first_byte}-{size - 1}/{size}")
+        self.send_header("Content-Length", str(size - first_byte))
+        self.end_headers()
+        return file
+
+    def end_headers(self):
+        """Add the ETag header to every response for an existing file."""
+        if getattr(self, "etag", None):
+            self.send_header("ETag", self.etag)
+        super().end_headers()
+
+    def copyfile(self, source, outputfile):
+        """Copy the body to the client while counting bytes sent."""
+        while True:
+            chunk = source.read(64 * 1024)
+            if not chunk:
+                break
+            outputfile.write(chunk)
+            self.server.add("bytes_sent", len(chunk))
+
+
+class FlakyHandler(CountingHandler):
+    """CountingHandler that often drops the connection at a random offset in the body."""
+
+    drop_probability = flaky_drop_probability
+    random_source = random.Random(42)
+
+    def copyfile(self, source, outputfile):
+        """Copy the body, but sometimes stop at a random byte and close the connection."""
+        if self.random_source.random() >= self.drop_probability:
+            return super().copyfile(source, outputfile)
+        body_size = os.fstat(source.fileno()).st_size - source.tell()
+        remaining = self.random_source.randint(1, max(1, body_size // 2))
+        while remaining > 0:
+            chunk = source.read(min(64 * 1024, remaining))
+            if not chunk:
+                break
+            outputfile.write(chunk)
+            self.server.add("bytes_sent", len(chunk))
+            remaining -= len(chunk)
+        self.close_connection = True
+
+
+def start_server(folder: pathlib.Path, handler_class=CountingHandler):
+    """
+    Serve folder on a free local port in a background thread.
+
+    Args:
+        folder (pathlib.Path): Folder whose files are served.
+        handler_class: Request handler class to use.
+
+    Returns:
+        tuple: (server, base_url)
+    """
+    def make_handler(*args, **kwargs):
+        return handler_class(*args, directory=str(folder), **kwargs)
+
+    server = CountingServer(("127.0.0.1", 0), make_handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address
+    return server, f"http://{host}:{port}"
+
+
+def make_payload(folder: pathlib.Path, filename: str, size: int, seed: int = None) -> pathlib.Path:
+    """
+    Write a synthetic CSV payload of roughly size bytes into folder.
+
+    With a seed, the numbers vary from row to row, so the payload does not
+    compress to almost nothing.
+    """
+    file_path = folder / filename
+    row = b"OWID_XXX,Somewhere,Some Location,2024-08-04,123456.0,0.0,12.5\n"
+    numbers = random.Random(seed) if seed is not None else None
+    with file_path.open('wb') as file:
+        file.write(b"iso_code,continent,location,last_updated_date,total_cases,new_cases,new_cases_smoothed\n")
+        for _ in range(size // len(row)):
+            if numbers:
+                row = f"OWID_XXX,Somewhere,Some Location,2024-08-04,{numbers.randint(0, 10**8)}.0,{numbers.randint(0, 10**4)}.0,{numbers.random():.1f}\n".encode()
+            file.write(row)
+    return file_path
+
+def make_covid_payload(folder: pathlib.Path, filename: str, size: int) -> pathlib.Path:
+    """
+    Write an OWID-style CSV of roughly size bytes by repeating the rows of the
+    sample file, plus a gzip copy the server can send with Content-Encoding: gzip.
+    """
+    file_path = folder / filename
+    lines = covid_sample_file.read_bytes().splitlines(keepends=True)
+    header, rows = lines[0], b"".join(lines[1:])
+    with file_path.open('wb') as file:
+        file.write(header)
+        for _ in range(max(1, size // len(rows))):
+            file.write(rows)
+    with file_path.open('rb') as source, gzip.open(str(file_path) + ".gz", 'wb') as target:
+        for chunk in iter(lambda: source.read(1024 * 1024), b""):
+            target.write(chunk)
+    return file_path
+
+#####################################
+# Define Benchmarks
+#####################################
+
+def benchmark_conditional_get(served_folder: pathlib.Path, base_url: str, server: CountingServer) -> None:
+    """
+    Fetch the same unchanged file several times with and without the fetch cache
+    and report how many requests were made and how many body bytes were sent.
+    """
+    url = f"{base_url}/payload.csv"
+    with tempfile.TemporaryDirectory() as out_folder:
+        for use_cache in (False, True):
+            server.reset_counters()
+            for _ in range(fetch_runs):
+                vrtachnik_get_csv.fetch_csv_file(out_folder, f"payload_{use_cache}.csv", url, stream=True, use_cache=use_cache)
+            print(
+                f"conditional GET (use_cache={use_cache}): "
+                f"{server.request_count} requests, "
+                f"{server.not_modified_count} not modified, "
+                f"{server.bytes_sent:,} body bytes sent"
+            )
+
+def benchmark_session_reuse(served_folder: pathlib.Path, base_url: str, server: CountingServer) -> None:
+    """
+    Fetch many small files with a new connection per request (module-level
+    requests.get) and with the shared pooled session, and report the
+    connections opened and the wall time of each approach.
+    """
+    for index in range(small_file_count):
+        (served_folder / f"small_{index}.csv").write_bytes(b"x" * small_file_size_bytes)
+    urls = [f"{base_url}/small_{index}.csv" for index in range(small_file_count)]
+
+    for label, get in (("requests.get", requests.get), ("shared session", get_session().get)):
+        server.reset_counters()
+        start = time.perf_counter()
+        for url in urls:
+            response = get(url)
+            response.raise_for_status()
+            response.content
+        elapsed = time.perf_counter() - start
+        print(
+            f"{label}: {small_file_count} files, "
+            f"{server.connection_count} connections opened, "
+            f"{elapsed:.3f}s wall time"
+        )
+
+def benchmark_resume(precompressed: bool = False) -> None:
+    """
+    Download a large file from a server that drops connections at random
+    offsets, and report the attempts, the body bytes sent and whether the
+    saved file matches the original.
+
+    With precompressed, the server also has a .gz copy it sends to clients
+    that accept gzip, like most real hosts compress their responses.
+    """
+    with tempfile.TemporaryDirectory() as served, tempfile.TemporaryDirectory() as out_folder:
+        served_folder = pathlib.Path(served)
+        source = make_payload(served_folder, "large.csv", flaky_payload_size_bytes, seed=1 if precompressed else None)
+        if precompressed:
+            with source.open('rb') as plain, gzip.open(str(source) + ".gz", 'wb') as target:
+                shutil.copyfileobj(plain, target)
+        FlakyHandler.random_source.seed(42)
+        server, base_url = start_server(served_folder, FlakyHandler)
+        try:
+            target = pathlib.Path(out_folder, "large.csv")
+            start = time.perf_counter()
+            download_to_file(f"{base_url}/large.csv", target, max_resume_attempts=50)
+            elapsed = time.perf_counter() - start
+            print(
+                f"resumable download (precompressed copy={precompressed}): {server.request_count} requests "
+                f"({server.resumed_count} resumed with Range), "
+                f"{server.bytes_sent:,} body bytes sent for a {source.stat().st_size:,} byte file, "
+                f"{elapsed:.3f}s, hash match={hash_file(target) == hash_file(source)}"
+            )
+        finally:
+            server.shutdown()
+
+def benchmark_compressed_storage() -> None:
+    """
+    Fetch and process an OWID-style CSV stored plain, as .gz and as .zst, and
+    report body bytes sent, bytes on disk and end-to-end time for each.
+    """
+    compressions = [None, "gzip"] + (["zstd"] if zstandard else [])
+    with tempfile.TemporaryDirectory() as served:
+        served_folder = pathlib.Path(served)
+        make_covid_payload(served_folder, "covid.csv", covid_payload_size_bytes)
+        server, base_url = start_server(served_folder)
+        try:
+            for compression in compressions:
+                with tempfile.TemporaryDirectory() as out_folder:
+                    server.reset_counters()
+                    start = time.perf_counter()
+                    vrtachnik_get_csv.fetch_csv_file(out_folder, "covid.csv", f"{base_url}/covid.csv", stream=True, compression=compression)
+                    saved = find_data_file(pathlib.Path(out_folder, "covid.csv"))
+                    stats = vrtachnik_process_csv.analyze_covid_data(saved)
+                    elapsed = time.perf_counter() - start
+                    print(
+                        f"storage={get_compression(saved) or 'plain'}: "
+                        f"{server.bytes_sent:,} body bytes sent, "
+                        f"{saved.stat().st_size:,} bytes on disk, "
+                        f"{elapsed:.3f}s fetch + process, {len(stats)} continents"
+                    )
+        finally:
+            server.shutdown()
+
+#####################################
+# Define main() function
+#####################################
+
+def main():
+    """
+    Run all fetch benchmarks against a local server.
+    """
+    logger.info("Starting fetch benchmarks...")
+    with tempfile.TemporaryDirectory() as served:
+        served_folder = pathlib.Path(served)
+        make_payload(served_folder, "payload.csv", payload_size_bytes)
+        server, base_url = start_server(served_folder)
+        try:
+            benchmark_conditional_get(served_folder, base_url, server)
+            benchmark_session_reuse(served_folder, base_url, server)
+        finally:
+            server.shutdown()
+    benchmark_resume()
+    benchmark_resume(precompressed=True)
+    benchmark_compressed_storage()
+    logger.info("Fetch benchmarks complete.")
+
+#####################################
+# Conditional Execution
+#####################################
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,296 @@
+"""
+Benchmark the JSON fetch and processing paths.
+
+Compares the old fetch path (parse the response, then re-encode it with
+indent=4) against streaming the response bytes straight to disk, on the
+Premier League file and on a large synthetic league history, and
+get_manchester_united_table with json.load against the streaming reader
+(utils_json) for time and peak memory on the same history. Finally it
+reports every team's history with one scan per team against one pass
+building the team index and a lookup per team, the memory per record
+and average points time of text blobs against SeasonRecord objects, and
+league-wide analytics over SeasonRecord objects against the cached typed
+columns (cold and warm).
+
+Run this script directly:
+    py benchmark_json.py
+"""
+
+#####################################
+# Import Modules at the Top
+#####################################
+
+# Import from Python Standard Library
+import json
+import pathlib
+import re
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+# Import from local project modules
+from utils_logger import logger
+from utils_fetch import get_session
+from benchmark_fetch import start_server
+from utils_column_cache import get_column_cache_folder
+from utils_json import iter_json_array
+import vrtachnik_get_json
+import vrtachnik_process_json
+
+#####################################
+# Declare Global Variables
+#####################################
+
+league_sample_file = pathlib.Path(__file__).parent / "data" / "premier_league_table.json"
+
+# Size of the synthetic league history (raise to 500 MB or more for a full run)
+synthetic_size_bytes: int = 100 * 1024 * 1024
+
+# Patterns that read the season and points back out of a formatted season record
+record_season = re.compile(r"^Season: (.*)$", re.MULTILINE)
+record_points = re.compile(r"^Points: (-?\d+)$", re.MULTILINE)
+
+#####################################
+# Define Functions
+#####################################
+
+def make_league_history(folder: pathlib.Path, filename: str, size: int) -> pathlib.Path:
+    """
+    Write a synthetic league history of roughly size bytes by repeating the
+    seasons of the sample file, one JSON array written season by season.
+    """
+    with league_sample_file.open('r', encoding='utf-8') as file:
+        seasons = json.load(file)
+    file_path = folder / filename
+    written = 0
+    with file_path.open('w', encoding='utf-8') as file:
+        file.write("[")
+        first = True
+        while written < size:
+            for season in seasons:
+                text = json.dumps(season)
+                file.write(text if first else "," + text)
+                written += len(text) + 1
+                first = False
+        file.write("]")
+    return file_path
+
+
+def fetch_parse_and_reencode(out_folder: str, filename: str, url: str) -> None:
+    """The old fetch_json_file path: response.json() then json.dump(indent=4)."""
+    response = get_session().get(url)
+    response.raise_for_status()
+    vrtachnik_get_json.write_json_file(out_folder, filename, response.json())
+
+
+def fetch_pass_through(out_folder: str, filename: str, url: str) -> None:
+    """The new fetch_json_file path: stream the bytes to disk with a cheap check."""
+    vrtachnik_get_json.fetch_json_file(out_folder, filename, url, validate=True)
+
+
+def measure(fetch, url: str) -> tuple:
+    """
+    Run one fetch strategy twice: once for CPU time, once under tracemalloc.
+
+    Returns:
+        tuple: (CPU seconds, wall seconds, peak traced MB)
+    """
+    with tempfile.TemporaryDirectory() as out_folder:
+        cpu_start, wall_start = time.process_time(), time.perf_counter()
+        fetch(out_folder, "league.json", url)
+        cpu, wall = time.process_time() - cpu_start, time.perf_counter() - wall_start
+
+    with tempfile.TemporaryDirectory() as out_folder:
+        tracemalloc.start()
+        fetch(out_folder, "league.json", url)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return (cpu, wall, peak / (1024 * 1024))
+
+
+def benchmark_fetch_json() -> None:
+    """
+    Report CPU time, wall time and peak memory of both fetch strategies.
+    """
+    with tempfile.TemporaryDirectory() as served:
+        served_folder = pathlib.Path(served)
+        (served_folder / "premier_league_table.json").write_bytes(league_sample_file.read_bytes())
+        make_league_history(served_folder, "league_history.json", synthetic_size_bytes)
+        server, base_url = start_server(served_folder)
+        try:
+            for name in ("premier_league_table.json", "league_history.json"):
+                size = (served_folder / name).stat().st_size
+                for label, fetch in (("parse + re-encode", fetch_parse_and_reencode), ("pass-through", fetch_pass_through)):
+                    cpu, wall, peak = measure(fetch, f"{base_url}/{name}")
+                    print(f"{name} ({size:,} bytes) {label}: {cpu:.3f}s CPU, {wall:.3f}s wall, {peak:.1f} MB peak")
+        finally:
+            server.shutdown()
+
+
+def benchmark_team_table(file_path: pathlib.Path) -> None:
+    """
+    Report wall time and peak memory of get_manchester_united_table with each JSON reader.
+    """
+    size = file_path.stat().st_size
+    baseline = None
+    for reader in vrtachnik_process_json.json_readers:
+        start = time.perf_counter()
+        records = vrtachnik_process_json.get_manchester_united_table(file_path, reader=reader)
+        seconds = time.perf_counter() - start
+
+        tracemalloc.start()
+        vrtachnik_process_json.get_manchester_united_table(file_path, reader=reader)
+        peak = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+        tracemalloc.stop()
+
+        baseline = baseline or records
+        print(
+            f"reader={reader}: {size:,} bytes, {len(records):,} records in {seconds:.2f}s, "
+            f"{peak:.1f} MB peak, same records={records == baseline}"
+        )
+
+
+def benchmark_all_teams(file_path: pathlib.Path) -> None:
+    """
+    Report the time to build every team's table by scanning once per team and from the team index.
+    """
+    index_path = vrtachnik_process_json.get_team_index_path(file_path)
+    index_path.unlink(missing_ok=True)
+    start = time.perf_counter()
+    index = vrtachnik_process_json.get_team_index(file_path)
+    build_seconds = time.perf_counter() - start
+    teams = vrtachnik_process_json.list_teams(index)
+
+    start = time.perf_counter()
+    scanned = [vrtachnik_process_json.get_team_table(file_path, team) for team in teams]
+    scan_seconds = time.perf_counter() - start
+
+    vrtachnik_process_json.loaded_team_indexes.clear()  # Include loading the index from disk
+    start = time.perf_counter()
+    indexed = [vrtachnik_process_json.get_team_table(file_path, team, use_index=True) for team in teams]
+    index_seconds = time.perf_counter() - start
+
+    print(f"{len(teams)} teams, scan per team: {scan_seconds:.2f}s")
+    print(
+        f"{len(teams)} teams, index: {build_seconds:.2f}s build ({index_path.stat().st_size:,} bytes) "
+        f"+ {index_seconds:.2f}s load and lookups, same tables={indexed == scanned}"
+    )
+
+
+def read_season_records(file_path: pathlib.Path, as_text: bool) -> list:
+    """Read every team's row of every season as a SeasonRecord, or as its formatted text block."""
+    records = []
+    with file_path.open('r', encoding='utf-8') as file:
+        for season in iter_json_array(file):
+            for team_data in season.get("table", []):
+                record = vrtachnik_process_json.SeasonRecord.from_row(season.get("season"), team_data)
+                records.append(record.format() if as_text else record)
+    return records
+
+
+def average_points_from_text(records: list) -> dict:
+    """Average points per season, parsing the season and points back out of each text block."""
+    totals = {}
+    for record in records:
+        season = record_season.search(record).group(1)
+        points = int(record_points.search(record).group(1))
+        total = totals.setdefault(season, [0, 0])
+        total[0] += points
+        total[1] += 1
+    return {season: points / count for season, (points, count) in totals.items()}
+
+
+def average_points_from_records(records: list) -> dict:
+    """Average points per season, straight from the int fields."""
+    totals = {}
+    for record in records:
+        total = totals.setdefault(record.season, [0, 0])
+        total[0] += record.points
+        total[1] += 1
+    return {season: points / count for season, (points, count) in totals.items()}
+
+
+def benchmark_season_records(file_path: pathlib.Path) -> None:
+    """
+    Report the retained memory per record and the average points time of text blocks and SeasonRecord objects.
+    """
+    results = {}
+    for label, as_text, average in (
+        ("text blocks", True, average_points_from_text),
+        ("SeasonRecord", False, average_points_from_records),
+    ):
+        tracemalloc.start()
+        records = read_season_records(file_path, as_text)
+        retained = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        averages = average(records)
+        seconds = time.perf_counter() - start
+        results[label] = averages
+        print(
+            f"{label}: {len(records):,} records, {retained / len(records):.0f} bytes per record, "
+            f"average points in {seconds:.3f}s"
+        )
+        del records
+    print(f"same averages={results['text blocks'] == results['SeasonRecord']}")
+
+
+def league_analytics_from_records(records: list) -> tuple:
+    """Points per season and the best goal difference, looping over SeasonRecord objects."""
+    points, best = {}, None
+    for record in records:
+        points[record.season] = points.get(record.season, 0) + (record.points or 0)
+        if record.goal_difference is not None and (best is None or record.goal_difference > best[2]):
+            best = (record.season, record.team, record.goal_difference)
+    return points, best
+
+
+def league_analytics_from_columns(file_path: pathlib.Path) -> tuple:
+    """Points per season and the best goal difference, vectorized over the cached league columns."""
+    columns = vrtachnik_process_json.get_league_columns(file_path)
+    return vrtachnik_process_json.points_per_season(columns), vrtachnik_process_json.best_goal_difference(columns)
+
+
+def benchmark_league_columns(file_path: pathlib.Path) -> None:
+    """
+    Report the time of the league-wide analytics from records and from the column cache, cold and warm.
+    """
+    shutil.rmtree(get_column_cache_folder(file_path), ignore_errors=True)
+    baseline = None
+    for label, analytics in (
+        ("records (read + loop)", lambda: league_analytics_from_records(read_season_records(file_path, as_text=False))),
+        ("columns, cold cache", lambda: league_analytics_from_columns(file_path)),
+        ("columns, warm cache", lambda: league_analytics_from_columns(file_path)),
+    ):
+        start = time.perf_counter()
+        result = analytics()
+        seconds = time.perf_counter() - start
+        baseline = baseline or result
+        print(f"{label}: {seconds:.3f}s, best goal difference {result[1]}, same result={result == baseline}")
+
+#####################################
+# Define main() function
+#####################################
+
+def main():
+    """
+    Run all JSON benchmarks.
+    """
+    logger.info("Starting JSON benchmarks...")
+    benchmark_fetch_json()
+    with tempfile.TemporaryDirectory() as folder:
+        file_path = make_league_history(pathlib.Path(folder), "league_history.json", synthetic_size_bytes)
+        benchmark_team_table(file_path)
+        benchmark_all_teams(file_path)
+        benchmark_season_records(file_path)
+        benchmark_league_columns(file_path)
+    logger.info("JSON benchmarks complete.")
+
+#####################################
+# Conditional Execution
+#####################################
+
+if __name__ == '__main__':
+    main()
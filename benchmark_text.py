@@ -0,0 +1,180 @@
+"""
+Benchmark the text processing paths.
+
+Builds a synthetic corpus by repeating example_data/romeo.txt and
+compares counting a vocabulary of 1, 10 and 1,000 words with one
+count_word_occurrences call per word (one read, lower() and count per
+word) against one count_words_occurrences pass (utils_text automaton),
+the whole-file count_word_occurrences against the streaming
+whole-word scanner for time and peak memory, and the build time, size
+and query latency of the saved word index (utils_word_index).
+
+Run this script directly:
+    py benchmark_text.py
+"""
+
+#####################################
+# Import Modules at the Top
+#####################################
+
+# Import from Python Standard Library
+import pathlib
+import re
+import tempfile
+import time
+import tracemalloc
+from collections import Counter
+
+# Import from local project modules
+from utils_logger import logger
+import utils_word_index
+import vrtachnik_process_text
+
+#####################################
+# Declare Global Variables
+#####################################
+
+text_sample_file = pathlib.Path(__file__).parent / "example_data" / "romeo.txt"
+
+# Size of the synthetic corpus (raise to several GB for a full run)
+synthetic_size_bytes: int = 20 * 1024 * 1024
+
+# Vocabulary sizes compared in the multi-word benchmark
+vocabulary_sizes: tuple = (1, 10, 1000)
+
+# Word counted in the whole-word benchmark
+benchmark_word: str = "Romeo"
+
+# Number of queries timed per word index query type
+index_queries: int = 1000
+
+#####################################
+# Define Functions
+#####################################
+
+def make_text_corpus(folder: pathlib.Path, filename: str, size: int) -> pathlib.Path:
+    """
+    Write a corpus of roughly size bytes by repeating the sample text.
+    """
+    sample = text_sample_file.read_text(encoding='utf-8')
+    file_path = folder / filename
+    with file_path.open('w', encoding='utf-8') as file:
+        for _ in range(max(1, size // len(sample))):
+            file.write(sample)
+    return file_path
+
+
+def get_vocabulary(size: int) -> list:
+    """
+    Return the size most common words of the sample text, most common first.
+    """
+    words = Counter(re.findall(r"[a-z]+", text_sample_file.read_text(encoding='utf-8').lower()))
+    return [word for word, _ in words.most_common(size)]
+
+
+def count_words_repeatedly(file_path: pathlib.Path, words: list) -> dict:
+    """The old way to count a vocabulary: one count_word_occurrences call per word."""
+    return {word: vrtachnik_process_text.count_word_occurrences(file_path, word) for word in words}
+
+
+def benchmark_vocabulary(file_path: pathlib.Path) -> None:
+    """
+    Compare one pass per word with a single pass over the corpus for each vocabulary size.
+    """
+    size = file_path.stat().st_size
+    for vocabulary_size in vocabulary_sizes:
+        words = get_vocabulary(vocabulary_size)
+        baseline = None
+        for label, count in (
+            ("count per word", count_words_repeatedly),
+            ("single pass", vrtachnik_process_text.count_words_occurrences),
+        ):
+            start = time.perf_counter()
+            counts = count(file_path, words)
+            seconds = time.perf_counter() - start
+            baseline = baseline or counts
+            print(
+                f"{len(words):,} words, {label}: {size:,} bytes in {seconds:.2f}s "
+                f"({size / seconds / (1024 * 1024):.1f} MB/s), same counts={counts == baseline}"
+            )
+
+
+def benchmark_whole_word(file_path: pathlib.Path, word: str = benchmark_word) -> None:
+    """
+    Compare the whole-file substring count with the streaming whole-word scanner for time and peak memory.
+    """
+    size = file_path.stat().st_size
+    for label, whole_word in (("read + lower + count", False), ("streaming whole words", True)):
+        start = time.perf_counter()
+        count = vrtachnik_process_text.count_word_occurrences(file_path, word, whole_word=whole_word)
+        seconds = time.perf_counter() - start
+
+        tracemalloc.start()
+        vrtachnik_process_text.count_word_occurrences(file_path, word, whole_word=whole_word)
+        peak = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+        tracemalloc.stop()
+        print(f"{label}: {size:,} bytes in {seconds:.2f}s ({size / seconds / (1024 * 1024):.1f} MB/s), {peak:.1f} MB peak, count={count:,}")
+
+
+def time_query(query, repeat: int = index_queries) -> float:
+    """Return the mean seconds of query() over repeat calls."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        query()
+    return (time.perf_counter() - start) / repeat
+
+
+def benchmark_word_index(file_path: pathlib.Path, word: str = benchmark_word) -> None:
+    """
+    Report the word index build time, its size on disk, and the latency of each query type.
+    """
+    paths = utils_word_index.get_word_index_paths(file_path)
+    for positions in (False, True):
+        start = time.perf_counter()
+        utils_word_index.build_word_index(file_path, positions=positions)
+        build_seconds = time.perf_counter() - start
+        index_size = sum(path.stat().st_size for path in paths if path.exists())
+        print(
+            f"word index (positions={positions}): {file_path.stat().st_size:,} bytes indexed in {build_seconds:.2f}s, "
+            f"{index_size:,} bytes on disk"
+        )
+
+    start = time.perf_counter()
+    index = utils_word_index.get_word_index(file_path, positions=True)
+    load_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scanned = vrtachnik_process_text.count_word_occurrences(file_path, word, whole_word=True)
+    scan_seconds = time.perf_counter() - start
+
+    print(f"word index: {index.total:,} words, loaded in {load_seconds * 1000:.1f} ms")
+    print(f"count('{word}') rescan: {scan_seconds * 1000:.1f} ms, count={scanned:,}")
+    print(
+        f"count('{word}') index: {time_query(lambda: index.count(word)) * 1_000_000:.2f} us, "
+        f"same count={index.count(word) == scanned}"
+    )
+    print(f"top(10) index: {time_query(lambda: index.top(10)) * 1_000_000:.2f} us")
+    print(f"near('{word}') index: {time_query(lambda: index.near(word), repeat=10) * 1000:.1f} ms")
+
+#####################################
+# Define main() function
+#####################################
+
+def main():
+    """
+    Run all text benchmarks.
+    """
+    logger.info("Starting text benchmarks...")
+    with tempfile.TemporaryDirectory() as folder:
+        file_path = make_text_corpus(pathlib.Path(folder), "corpus.txt", synthetic_size_bytes)
+        benchmark_vocabulary(file_path)
+        benchmark_whole_word(file_path)
+        benchmark_word_index(file_path)
+    logger.info("Text benchmarks complete.")
+
+#####################################
+# Conditional Execution
+#####################################
+
+if __name__ == '__main__':
+    main()
@@ -16,6 +16,7 @@ import requests
 
 # Import from local project modules
 from utils_logger import logger
+from utils_fetch import DEFAULT_CHUNK_SIZE, download_to_file, get_session
 
 #####################################
 # Declare Global Variables
@@ -27,7 +28,7 @@ fetched_folder_name = "data"
 # Define Functions
 #####################################
 
-def fetch_excel_file(folder_name: str, filename: str, url: str) -> None:
+def fetch_excel_file(folder_name: str, filename: str, url: str, stream: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE, use_cache: bool = False) -> None:
     """
     Fetch Excel data from the given piURL and write it to a file.
 
@@ -35,6 +36,11 @@ def fetch_excel_file(folder_name: str, filename: str, url: str) -> None:
         folder_name (str): Name of the folder to save the file.
         filename (str): Name of the output file.
         url (str): URL of the Excel file to fetch.
+        stream (bool): If True, stream the response to disk in chunks
+            instead of holding the whole body in memory.
+        chunk_size (int): Number of bytes per chunk when streaming.
+        use_cache (bool): If True, skip the download when the server reports
+            the previously fetched file as not modified (implies streaming).
 
     Returns:
         None
@@ -48,14 +54,22 @@ def fetch_excel_file(folder_name: str, filename: str, url: str) -> None:
 
     try:
         logger.info(f"Fetching Excel data from {url}...")
-        response = requests.get(url)
-        response.raise_for_status()
-        write_excel_file(folder_name, filename, response.content)
+        if stream or use_cache:
+            file_path = pathlib.Path(folder_name).joinpath(filename)
+            if download_to_file(url, file_path, chunk_size, use_cache) is None:
+                logger.info(f"SUCCESS: {filename} is already up to date")
+                return
+        else:
+            response = get_session().get(url)
+            response.raise_for_status()
+            write_excel_file(folder_name, filename, response.content)
         logger.info(f"SUCCESS: Excel file fetched and saved as {filename}")
     except requests.exceptions.HTTPError as http_err:
         logger.error(f"HTTP error occurred: {http_err}")
     except requests.exceptions.RequestException as req_err:
         logger.error(f"Request error occurred: {req_err}")
+    except IOError as io_err:
+        logger.error(f"Error writing Excel data to {filename}: {io_err}")
 
 def write_excel_file(folder_name: str, filename: str, binary_data: bytes) -> None:
     """
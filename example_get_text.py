@@ -18,6 +18,8 @@ import requests
 
 # Import from local project modules
 from utils_logger import logger
+from utils_fetch import DEFAULT_CHUNK_SIZE, download_to_file, get_session
+from utils_compress import get_compressed_path
 
 #####################################
 # Declare Global Variables
@@ -29,7 +31,7 @@ fetched_folder_name = "example_data"
 # Define Functions
 #####################################
 
-def fetch_txt_file(folder_name: str, filename: str, url: str) -> None:
+def fetch_txt_file(folder_name: str, filename: str, url: str, stream: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE, use_cache: bool = False, compression: str = None) -> None:
     """
     Fetch text data from the given URL and write it to a file.
 
@@ -37,6 +39,13 @@ def fetch_txt_file(folder_name: str, filename: str, url: str) -> None:
         folder_name (str): Name of the folder to save the file.
         filename (str): Name of the output file.
         url (str): URL of the text file to fetch.
+        stream (bool): If True, stream the response to disk in chunks
+            instead of holding the whole body in memory.
+        chunk_size (int): Number of bytes per chunk when streaming.
+        use_cache (bool): If True, skip the download when the server reports
+            the previously fetched file as not modified (implies streaming).
+        compression (str): None, "gzip" or "zstd". If set, keep the file compressed
+            on disk as filename + ".gz" / ".zst" (implies streaming).
 
     Returns:
         None
@@ -50,14 +59,22 @@ def fetch_txt_file(folder_name: str, filename: str, url: str) -> None:
 
     try:
         logger.info(f"Fetching text data from {url}...")
-        response = requests.get(url)
-        response.raise_for_status()
-        write_txt_file(folder_name, filename, response.text)
+        if stream or use_cache or compression:
+            file_path = get_compressed_path(pathlib.Path(folder_name).joinpath(filename), compression)
+            if download_to_file(url, file_path, chunk_size, use_cache, compression=compression) is None:
+                logger.info(f"SUCCESS: {filename} is already up to date")
+                return
+        else:
+            response = get_session().get(url)
+            response.raise_for_status()
+            write_txt_file(folder_name, filename, response.text)
         logger.info(f"SUCCESS: Text file fetched and saved as {filename}")
     except requests.exceptions.HTTPError as http_err:
         logger.error(f"HTTP error occurred: {http_err}")
     except requests.exceptions.RequestException as req_err:
         logger.error(f"Request error occurred: {req_err}")
+    except IOError as io_err:
+        logger.error(f"Error writing text data to {filename}: {io_err}")
 
 def write_txt_file(folder_name: str, filename: str, string_data: str) -> None:
     """
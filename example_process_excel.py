@@ -9,12 +9,11 @@ Process an Excel file to count occurrences of a specific word in a column.
 
 # Import from Python Standard Library
 import pathlib
-
-# Import from external packages
-import openpyxl
+import re
 
 # Import from local project modules
 from utils_logger import logger
+from utils_xlsx import column_index, iter_sheet_rows
 
 #####################################
 # Declare Global Variables
@@ -27,15 +26,23 @@ processed_folder_name: str = "example_processed"
 # Define Functions
 #####################################
 
-def count_word_in_column(file_path: pathlib.Path, column_letter: str, word: str) -> int:
-    """Count the occurrences of a specific word in a given column of an Excel file."""
+def count_word_in_column(file_path: pathlib.Path, column_letter: str, word: str, sheet_name: str = None) -> int:
+    """
+    Count the occurrences of a specific word in a given column of an Excel file.
+
+    The sheet (the active one unless sheet_name is given) is streamed and
+    only the target column's cells are converted (see utils_xlsx). The word
+    is matched case-insensitively with one precompiled pattern instead of
+    lowering every cell.
+    """
     try:
-        workbook = openpyxl.load_workbook(file_path)
-        sheet = workbook.active
+        column = column_index(column_letter)
+        matcher = re.compile(re.escape(word), re.IGNORECASE)
         count = 0
-        for cell in sheet[column_letter]:
-            if cell.value and isinstance(cell.value, str):
-                count += cell.value.lower().count(word.lower())
+        for row in iter_sheet_rows(file_path, columns=[column], sheet_name=sheet_name):
+            value = row[column] if row else None
+            if value and isinstance(value, str):
+                count += len(matcher.findall(value))
         return count
     except Exception as e:
         logger.error(f"Error reading Excel file: {e}")
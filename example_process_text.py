@@ -11,6 +11,7 @@ import pathlib
 
 # Import from local project modules
 from utils_logger import logger
+from utils_text import count_terms, count_words
 
 #####################################
 # Declare Global Variables
@@ -23,22 +24,38 @@ processed_folder_name: str = "example_processed"
 # Define Functions
 #####################################
 
-def count_word_occurrences(file_path: pathlib.Path, word: str) -> int:
-    """Count the occurrences of a specific word in a text file (case-insensitive)."""
+def count_word_occurrences(file_path: pathlib.Path, word: str, whole_word: bool = False) -> int:
+    """
+    Count the occurrences of a specific word in a text file (case-insensitive).
+
+    With whole_word, the file is streamed and only whole-word, casefolded
+    matches count ("Romeo's" but not "Romeos").
+    """
     try:
         with file_path.open('r') as file:
+            if whole_word:
+                return count_words(file, [word])[word]
             content: str = file.read()
             return content.lower().count(word.lower())
     except Exception as e:
         logger.error(f"Error reading text file: {e}")
         return 0
 
+def count_words_occurrences(file_path: pathlib.Path, words: list, whole_word: bool = False) -> dict:
+    """Count the occurrences of many words in a text file in one pass (case-insensitive)."""
+    try:
+        with file_path.open('r') as file:
+            return count_words(file, words) if whole_word else count_terms(file, words)
+    except Exception as e:
+        logger.error(f"Error reading text file: {e}")
+        return {word: 0 for word in words}
+
 def process_text_file():
     """Read a text file, count occurrences of 'Romeo', and save the result."""
     input_file = pathlib.Path(fetched_folder_name, "romeo.txt")
     output_file = pathlib.Path(processed_folder_name, "text_romeo_word_count.txt")
     word_to_count: str = "Romeo"
-    word_count: int = count_word_occurrences(input_file, word_to_count)
+    word_count: int = count_word_occurrences(input_file, word_to_count, whole_word=True)
     output_file.parent.mkdir(parents=True, exist_ok=True)
     with output_file.open('w') as file:
         file.write(f"Occurrences of '{word_to_count}': {word_count}\n")
@@ -0,0 +1,219 @@
+"""
+Column Cache Helper Script
+File: utils_column_cache.py
+
+This script keeps parsed CSV columns in a typed binary cache next to the source file.
+
+Features:
+- Saves number columns as float64 .npy files (NaN for empty values) and text
+  columns as int32 codes into a small list of labels.
+- Remembers which rows held a value that is not a number, with the raw text,
+  so readers can skip and report them exactly like a text parse would.
+- Loads the columns memory-mapped, so later runs skip text parsing entirely.
+- Keys the cache by the source's size, modification time and SHA-256, and
+  drops it automatically when the source changes.
+
+The cache needs the optional numpy package:
+    py -m pip install numpy
+"""
+
+#####################################
+# Import Modules at the Top
+#####################################
+
+# Import from Python Standard Library
+import json
+import pathlib
+import re
+import shutil
+
+# Import from external packages (optional)
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Import from local project modules
+from utils_logger import logger
+from utils_hash import read_source_meta, write_json_atomically
+
+#####################################
+# Declare Global Variables
+#####################################
+
+# Suffix of the cache folder stored next to each source file
+COLUMN_CACHE_SUFFIX: str = ".columns"
+
+# Name of the file in the cache folder describing the source and the cached columns
+COLUMN_CACHE_META: str = "meta.json"
+
+# Column kinds the cache can hold
+COLUMN_KINDS: tuple = ("number", "text")
+
+#####################################
+# Define Functions
+#####################################
+
+def get_column_cache_folder(file_path: pathlib.Path) -> pathlib.Path:
+    """Return the cache folder for file_path (data.csv -> data.csv.columns)."""
+    file_path = pathlib.Path(file_path)
+    return file_path.with_name(file_path.name + COLUMN_CACHE_SUFFIX)
+
+
+def get_column_file_stem(column: str) -> str:
+    """Return a file-name-safe stem for a column name."""
+    return re.sub(r"[^\w.-]", "_", column)
+
+
+def read_column_cache_meta(file_path: pathlib.Path) -> dict:
+    """
+    Read the cache description for file_path if it still matches the source.
+
+    See utils_hash.read_source_meta; a refreshed modification time is
+    saved back to the cache description.
+
+    Args:
+        file_path (pathlib.Path): Path of the source file.
+
+    Returns:
+        dict: The cache description, or an empty dict if there is no valid cache.
+    """
+    meta_path = get_column_cache_folder(file_path) / COLUMN_CACHE_META
+    return read_source_meta(meta_path, file_path, warn=logger.warning, indent=4)
+
+
+def write_column_cache_meta(file_path: pathlib.Path, meta: dict) -> None:
+    """Write the cache description, replacing the old one in a single rename."""
+    write_json_atomically(get_column_cache_folder(file_path) / COLUMN_CACHE_META, meta, indent=4)
+
+
+def parse_column_values(values: list, kind: str) -> dict:
+    """
+    Turn the raw text values of one column into typed arrays.
+
+    Args:
+        values (list): The column's text value for every row.
+        kind (str): "number" or "text".
+
+    Returns:
+        dict: For "number", values (float64, NaN when empty), invalid_rows
+            (int64 row numbers) and invalid_values (their raw text). For
+            "text", codes (int32) and labels (list of distinct values in
+            first-seen order).
+    """
+    if kind == "text":
+        code_of = {}
+        codes = numpy.fromiter(
+            (code_of.setdefault(value, len(code_of)) for value in values), dtype=numpy.int32, count=len(values)
+        )
+        return {"kind": kind, "codes": codes, "labels": list(code_of)}
+
+    parsed = numpy.full(len(values), numpy.nan)
+    invalid_rows, invalid_values = [], []
+    for row, value in enumerate(values):
+        if value:
+            try:
+                parsed[row] = float(value)
+            except ValueError:
+                invalid_rows.append(row)
+                invalid_values.append(value)
+    return {
+        "kind": kind,
+        "values": parsed,
+        "invalid_rows": numpy.array(invalid_rows, dtype=numpy.int64),
+        "invalid_values": invalid_values,
+    }
+
+
+def save_columns(file_path: pathlib.Path, columns: dict, row_count: int, stamp: dict) -> None:
+    """
+    Save parsed columns to the cache of file_path, keeping those already cached.
+
+    Take the stamp before reading the source. If the file is replaced while
+    it is parsed, the cache then describes the version that was read, and
+    is dropped on the next read instead of being trusted.
+
+    Args:
+        file_path (pathlib.Path): Path of the source file.
+        columns (dict): Column name to parse_column_values() result.
+        row_count (int): Number of rows in every column.
+        stamp (dict): The source's utils_hash.get_source_stamp(), taken
+            before the columns were read.
+
+    Returns:
+        None
+    """
+    file_path = pathlib.Path(file_path)
+    folder = get_column_cache_folder(file_path)
+    meta = read_column_cache_meta(file_path)
+    if not meta or meta.get("sha256") != stamp["sha256"] or meta.get("rows") != row_count:
+        shutil.rmtree(folder, ignore_errors=True)
+        meta = {
+            **stamp,
+            "rows": row_count,
+            "columns": {},
+        }
+
+    try:
+        folder.mkdir(parents=True, exist_ok=True)
+        for column, data in columns.items():
+            stem = get_column_file_stem(column)
+            if data["kind"] == "text":
+                numpy.save(folder / f"{stem}.codes.npy", data["codes"])
+                with (folder / f"{stem}.labels.json").open('w', encoding='utf-8') as file:
+                    json.dump(data["labels"], file)
+            else:
+                numpy.save(folder / f"{stem}.npy", data["values"])
+                numpy.save(folder / f"{stem}.invalid.npy", data["invalid_rows"])
+                with (folder / f"{stem}.invalid.json").open('w', encoding='utf-8') as file:
+                    json.dump(data["invalid_values"], file)
+            meta["columns"][column] = {"kind": data["kind"], "stem": stem}
+        write_column_cache_meta(file_path, meta)  # Written last, so it only lists complete columns
+        logger.info(f"Cached {len(columns)} columns of {file_path} in {folder}")
+    except IOError as io_err:
+        logger.warning(f"Could not write column cache {folder}: {io_err}")
+
+
+def load_columns(file_path: pathlib.Path, columns: dict) -> dict:
+    """
+    Load cached columns of file_path, memory-mapped.
+
+    Args:
+        file_path (pathlib.Path): Path of the source file.
+        columns (dict): Column name to kind ("number" or "text").
+
+    Returns:
+        dict: Column name to the same structure parse_column_values() returns,
+            or None if the cache is stale or misses any of the columns.
+    """
+    meta = read_column_cache_meta(file_path)
+    cached = meta.get("columns", {})
+    if any(cached.get(column, {}).get("kind") != kind for column, kind in columns.items()):
+        return None
+
+    folder = get_column_cache_folder(file_path)
+    loaded = {}
+    try:
+        for column, kind in columns.items():
+            stem = cached[column]["stem"]
+            if kind == "text":
+                with (folder / f"{stem}.labels.json").open('r', encoding='utf-8') as file:
+                    labels = json.load(file)
+                loaded[column] = {
+                    "kind": kind,
+                    "codes": numpy.load(folder / f"{stem}.codes.npy", mmap_mode='r'),
+                    "labels": labels,
+                }
+            else:
+                with (folder / f"{stem}.invalid.json").open('r', encoding='utf-8') as file:
+                    invalid_values = json.load(file)
+                loaded[column] = {
+                    "kind": kind,
+                    "values": numpy.load(folder / f"{stem}.npy", mmap_mode='r'),
+                    "invalid_rows": numpy.load(folder / f"{stem}.invalid.npy"),
+                    "invalid_values": invalid_values,
+                }
+    except (IOError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable column cache {folder}: {e}")
+        return None
+    return loaded
@@ -0,0 +1,154 @@
+"""
+Compression Helper Script
+File: utils_compress.py
+
+This script provides the compression functions shared by the fetchers and processors.
+
+Features:
+- Compresses a stream of byte chunks on the fly (gzip, or zstd when installed).
+- Opens .gz and .zst data files as text through a streaming decompressor,
+  so processors can read them without unpacking them to disk first.
+- Finds the most recently fetched (plain or compressed) copy of a data file.
+
+zstd support needs the optional zstandard package:
+    py -m pip install zstandard
+"""
+
+#####################################
+# Import Modules at the Top
+#####################################
+
+# Import from Python Standard Library
+import gzip
+import io
+import pathlib
+import zlib
+
+# Import from external packages (optional)
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+#####################################
+# Declare Global Variables
+#####################################
+
+# File suffix used for each supported at-rest compression
+COMPRESSION_SUFFIXES: dict = {
+    "gzip": ".gz",
+    "zstd": ".zst",
+}
+
+# HTTP Content-Encoding token matching each compression
+CONTENT_ENCODINGS: dict = {
+    "gzip": "gzip",
+    "zstd": "zstd",
+}
+
+#####################################
+# Define Functions
+#####################################
+
+def check_compression(compression: str) -> None:
+    """
+    Make sure a compression name is supported and its library is installed.
+
+    Args:
+        compression (str): "gzip" or "zstd".
+
+    Raises:
+        ValueError: If the compression is unknown or zstandard is missing.
+    """
+    if compression not in COMPRESSION_SUFFIXES:
+        raise ValueError(f"Unknown compression '{compression}'; expected one of {sorted(COMPRESSION_SUFFIXES)}")
+    if compression == "zstd" and zstandard is None:
+        raise ValueError("zstd compression needs the zstandard package (py -m pip install zstandard)")
+
+
+def get_compressed_path(file_path: pathlib.Path, compression: str) -> pathlib.Path:
+    """Return file_path with the suffix for compression added (data.csv -> data.csv.gz)."""
+    if not compression:
+        return file_path
+    check_compression(compression)
+    return file_path.with_name(file_path.name + COMPRESSION_SUFFIXES[compression])
+
+
+def get_compression(file_path: pathlib.Path) -> str:
+    """Return the compression of a file from its suffix, or None for a plain file."""
+    for compression, suffix in COMPRESSION_SUFFIXES.items():
+        if file_path.name.endswith(suffix):
+            return compression
+    return None
+
+
+def iter_compressed(chunks, compression: str):
+    """
+    Compress a stream of byte chunks on the fly.
+
+    Args:
+        chunks: Iterable of bytes.
+        compression (str): "gzip" or "zstd".
+
+    Yields:
+        bytes: Compressed chunks that together form a complete .gz or .zst file.
+    """
+    check_compression(compression)
+    if compression == "gzip":
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # 31 = gzip container
+    else:
+        compressor = zstandard.ZstdCompressor().compressobj()
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def open_text(file_path: pathlib.Path, encoding: str = 'utf-8', newline: str = None):
+    """
+    Open a plain, .gz or .zst file for reading text.
+
+    Compressed files are decompressed as they are read, never unpacked to disk.
+
+    Args:
+        file_path (pathlib.Path): Path to the file.
+        encoding (str): Text encoding of the (uncompressed) content.
+        newline (str): Passed to the text wrapper (use '' for the csv module).
+
+    Returns:
+        A text file object. Use it in a with block.
+    """
+    file_path = pathlib.Path(file_path)
+    compression = get_compression(file_path)
+    if compression == "gzip":
+        return gzip.open(file_path, 'rt', encoding=encoding, newline=newline)
+    if compression == "zstd":
+        check_compression(compression)
+        raw = zstandard.ZstdDecompressor().stream_reader(file_path.open('rb'), closefd=True)
+        return io.TextIOWrapper(io.BufferedReader(raw), encoding=encoding, newline=newline)
+    return file_path.open('r', encoding=encoding, newline=newline)
+
+
+def find_data_file(file_path: pathlib.Path) -> pathlib.Path:
+    """
+    Return the most recently modified of file_path and its compressed copies.
+
+    A fetch with compression leaves any older plain copy in place (and the
+    other way round), so the newest copy is the one fetched last.
+
+    Args:
+        file_path (pathlib.Path): Path to the plain data file.
+
+    Returns:
+        pathlib.Path: The path to read (file_path itself if no copy exists).
+    """
+    file_path = pathlib.Path(file_path)
+    candidates = [file_path] + [
+        file_path.with_name(file_path.name + suffix) for suffix in COMPRESSION_SUFFIXES.values()
+    ]
+    existing = [candidate for candidate in candidates if candidate.exists()]
+    if not existing:
+        return file_path
+    # max() keeps the first of equally new copies, so the plain file wins a tie
+    return max(existing, key=lambda candidate: candidate.stat().st_mtime_ns)
@@ -0,0 +1,498 @@
+"""
+Fetch Helper Script
+File: utils_fetch.py
+
+This script provides the shared download functions used by the get_* fetchers.
+
+Features:
+- Streams a response to disk in fixed-size chunks instead of holding it in memory.
+- Writes to a temporary .part file and renames it into place only when complete.
+- Logs the byte count and throughput of every download.
+- Keeps a small fetch cache (ETag, Last-Modified, content hash) next to each
+  downloaded file and skips the download when the server answers 304 Not Modified.
+- Shares one pooled, keep-alive HTTP session with a default timeout and
+  exponential-backoff retries on 429 and 5xx responses.
+- Keeps interrupted downloads as .part files and resumes them with HTTP Range
+  requests, checking the final size (and optionally the hash) before renaming.
+- Can keep downloads compressed on disk (.gz, .zst), saving the compressed
+  transfer bytes as they arrive when the server already sends that encoding.
+
+Put a copy in your root project folder (next to utils_logger.py)
+and import in your scripts as shown in the get_* examples.
+"""
+
+#####################################
+# Import Modules at the Top
+#####################################
+
+# Import from Python Standard Library
+import hashlib
+import json
+import os
+import pathlib
+import re
+import threading
+import time
+
+# Import from external packages
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Import from local project modules
+from utils_logger import logger
+from utils_compress import CONTENT_ENCODINGS, check_compression, iter_compressed
+from utils_hash import hash_file
+
+#####################################
+# Declare Global Variables
+#####################################
+
+# Default number of bytes read from the network and written to disk at a time
+DEFAULT_CHUNK_SIZE: int = 256 * 1024
+
+# Suffix of the temporary file a download is written to before it is renamed
+PART_SUFFIX: str = ".part"
+
+# Suffix of the fetch cache file stored next to each downloaded file
+CACHE_SUFFIX: str = ".fetch.json"
+
+# Default (connect, read) timeout in seconds for every request
+DEFAULT_TIMEOUT: tuple = (10, 60)
+
+# Number of host pools kept, and connections kept alive per host
+POOL_CONNECTIONS: int = 10
+POOL_MAXSIZE: int = 10
+
+# Retries with exponential backoff (0.5s, 1s, 2s, ...) on these status codes
+RETRY_TOTAL: int = 5
+RETRY_BACKOFF_FACTOR: float = 0.5
+RETRY_STATUS_CODES: tuple = (429, 500, 502, 503, 504)
+
+# Number of times an interrupted download is resumed before giving up
+RESUME_ATTEMPTS: int = 5
+
+# Network errors after which a partial download is kept and resumed
+RESUMABLE_ERRORS: tuple = (
+    requests.exceptions.ChunkedEncodingError,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+)
+
+# The shared session, created on first use by get_session()
+_shared_session = None
+_shared_session_lock = threading.Lock()
+
+#####################################
+# Define Functions
+#####################################
+
+class DownloadError(IOError):
+    """Raised when a finished download fails its size or hash check."""
+
+
+class TimeoutSession(requests.Session):
+    """A requests.Session that applies a default timeout to every request."""
+
+    def __init__(self, timeout: tuple = DEFAULT_TIMEOUT):
+        super().__init__()
+        self.timeout = timeout
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        return super().request(method, url, **kwargs)
+
+
+def create_session(
+    pool_connections: int = POOL_CONNECTIONS,
+    pool_maxsize: int = POOL_MAXSIZE,
+    retries: int = RETRY_TOTAL,
+    backoff_factor: float = RETRY_BACKOFF_FACTOR,
+    timeout: tuple = DEFAULT_TIMEOUT,
+) -> requests.Session:
+    """
+    Create a pooled HTTP session with retries and a default timeout.
+
+    Connections are kept alive and reused for later requests to the same host.
+    Requests that fail to connect, or that get a 429 or 5xx response, are
+    retried with exponential backoff (honoring any Retry-After header).
+
+    Args:
+        pool_connections (int): Number of per-host connection pools to keep.
+        pool_maxsize (int): Maximum connections kept alive per host.
+        retries (int): Maximum number of retries per request.
+        backoff_factor (float): Base delay in seconds for the backoff.
+        timeout (tuple): Default (connect, read) timeout in seconds.
+
+    Returns:
+        requests.Session: The configured session.
+    """
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=("GET", "HEAD"),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry)
+    session = TimeoutSession(timeout)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """Return the session shared by all fetchers, creating it on first use."""
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is None:
+            _shared_session = create_session()
+        return _shared_session
+
+
+def get_part_path(file_path: pathlib.Path) -> pathlib.Path:
+    """Return the temporary .part path used while downloading to file_path."""
+    return file_path.with_name(file_path.name + PART_SUFFIX)
+
+
+def get_cache_path(file_path: pathlib.Path) -> pathlib.Path:
+    """Return the path of the fetch cache file kept next to file_path."""
+    return file_path.with_name(file_path.name + CACHE_SUFFIX)
+
+
+def read_fetch_cache(file_path: pathlib.Path) -> dict:
+    """
+    Read the fetch cache entry stored next to file_path.
+
+    Args:
+        file_path (pathlib.Path): Path of the downloaded file.
+
+    Returns:
+        dict: The cache entry, or an empty dict if there is none or it is unreadable.
+    """
+    cache_path = get_cache_path(file_path)
+    try:
+        with cache_path.open('r', encoding='utf-8') as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return {}
+    except (IOError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable fetch cache {cache_path}: {e}")
+        return {}
+
+
+def write_fetch_cache(file_path: pathlib.Path, entry: dict) -> None:
+    """
+    Write the fetch cache entry for file_path.
+
+    Args:
+        file_path (pathlib.Path): Path of the downloaded file.
+        entry (dict): Cache entry with url, etag, last_modified, sha256 and size.
+
+    Returns:
+        None
+    """
+    cache_path = get_cache_path(file_path)
+    try:
+        with cache_path.open('w', encoding='utf-8') as file:
+            json.dump(entry, file, indent=4)
+    except IOError as io_err:
+        logger.warning(f"Could not write fetch cache {cache_path}: {io_err}")
+
+
+def refresh_fetch_cache(file_path: pathlib.Path) -> None:
+    """
+    Re-record the size and hash of file_path after it was changed in place.
+
+    Use this when a fetched file is post-processed (for example, a cleaned
+    Excel workbook) so the cache still recognizes it on the next run.
+
+    Args:
+        file_path (pathlib.Path): Path of the downloaded file.
+
+    Returns:
+        None
+    """
+    entry = read_fetch_cache(file_path)
+    if entry and file_path.exists():
+        entry["size"] = file_path.stat().st_size
+        entry["sha256"] = hash_file(file_path)
+        write_fetch_cache(file_path, entry)
+
+
+def get_conditional_headers(url: str, file_path: pathlib.Path) -> dict:
+    """
+    Build If-None-Match / If-Modified-Since headers for a cached download.
+
+    Headers are only sent when the cache entry is for the same URL and the
+    file on disk still has the size recorded in the cache.
+
+    Args:
+        url (str): URL about to be fetched.
+        file_path (pathlib.Path): Path the file is saved to.
+
+    Returns:
+        dict: Request headers (empty if the cache cannot be used).
+    """
+    entry = read_fetch_cache(file_path)
+    if not entry or entry.get("url") != url or not file_path.exists():
+        return {}
+    if file_path.stat().st_size != entry.get("size"):
+        logger.info(f"Cached file {file_path} changed on disk; fetching it again.")
+        return {}
+
+    headers = {}
+    if entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+
+def log_transfer(file_path: pathlib.Path, byte_count: int, elapsed: float) -> None:
+    """
+    Log the size and throughput of a completed download.
+
+    Args:
+        file_path (pathlib.Path): Path of the saved file.
+        byte_count (int): Number of bytes written.
+        elapsed (float): Seconds spent on the transfer.
+
+    Returns:
+        None
+    """
+    megabytes = byte_count / (1024 * 1024)
+    throughput = megabytes / elapsed if elapsed > 0 else 0.0
+    logger.info(
+        f"Downloaded {byte_count:,} bytes to {file_path} "
+        f"in {elapsed:.2f}s ({throughput:.2f} MB/s)"
+    )
+
+
+def parse_content_range(value: str) -> tuple:
+    """
+    Parse a Content-Range header such as "bytes 100-199/1000".
+
+    Args:
+        value (str): The header value.
+
+    Returns:
+        tuple: (first byte, total size). Either may be None if not present.
+    """
+    match = re.match(r"bytes\s+(\d+)-\d+/(\d+|\*)", value or "")
+    if not match:
+        return (None, None)
+    total = match.group(2)
+    return (int(match.group(1)), None if total == "*" else int(total))
+
+
+def download_part(url: str, file_path: pathlib.Path, chunk_size: int, use_cache: bool, compression: str = None):
+    """
+    Make one attempt at completing the .part file for file_path.
+
+    If a .part file from an earlier attempt at the same URL exists, only the
+    missing bytes are requested with "Range: bytes=N-" (guarded by If-Range, so
+    a changed upstream file is downloaded again from the start). Otherwise the
+    whole body is requested, conditionally when use_cache is set.
+
+    Without compression, "Accept-Encoding: identity" is sent, so servers that
+    would otherwise compress the response send the plain bytes and the
+    download stays resumable. With compression, the body is stored
+    compressed: the raw transfer bytes are written as-is when the server
+    used the same Content-Encoding, and compressed on the fly otherwise.
+    Compressed downloads are not resumed.
+
+    Args:
+        url (str): URL of the file to download.
+        file_path (pathlib.Path): Path the finished file will be saved to.
+        chunk_size (int): Number of bytes to read and write at a time.
+        use_cache (bool): If True, make a conditional request using the fetch cache.
+        compression (str): None to store the body as-is, or "gzip" / "zstd".
+
+    Returns:
+        dict: Entry with url, etag, last_modified, sha256 and size,
+            or None if the server reported the file as not modified.
+
+    Raises:
+        requests.exceptions.RequestException: If the request fails or is cut off.
+        DownloadError: If the finished .part file has the wrong size.
+    """
+    part_path = get_part_path(file_path)
+    partial = read_fetch_cache(part_path)
+    offset = 0
+    if part_path.exists():
+        if partial.get("url") == url:
+            offset = part_path.stat().st_size
+        else:
+            part_path.unlink()
+
+    headers = {}
+    if offset:
+        headers["Range"] = f"bytes={offset}-"
+        validator = partial.get("etag") or partial.get("last_modified")
+        if validator:
+            headers["If-Range"] = validator
+    elif use_cache:
+        headers = get_conditional_headers(url, file_path)
+    if compression and not offset:
+        headers["Accept-Encoding"] = CONTENT_ENCODINGS[compression]
+    else:
+        # Ask for the body as-is, so Range offsets count the bytes in the .part file
+        headers["Accept-Encoding"] = "identity"
+
+    with get_session().get(url, headers=headers, stream=True) as response:
+        if response.status_code == 304:
+            return None
+        if response.status_code == 416:
+            logger.warning(f"Server rejected resume of {part_path}; starting over.")
+            part_path.unlink(missing_ok=True)
+            return download_part(url, file_path, chunk_size, use_cache, compression)
+        response.raise_for_status()
+
+        content_encoding = response.headers.get("Content-Encoding", "identity").lower()
+        passthrough = compression is not None and content_encoding == CONTENT_ENCODINGS[compression]
+        encoded = content_encoding != "identity"
+        if passthrough:
+            # Keep the compressed transfer bytes exactly as they arrive
+            chunks = response.raw.stream(chunk_size, decode_content=False)
+        elif compression:
+            chunks = iter_compressed(response.iter_content(chunk_size=chunk_size), compression)
+        else:
+            chunks = response.iter_content(chunk_size=chunk_size)
+
+        if response.status_code == 206:
+            first_byte, total = parse_content_range(response.headers.get("Content-Range"))
+            if first_byte != offset:
+                raise DownloadError(f"Server resumed {url} at byte {first_byte}, expected {offset}")
+            logger.info(f"Resuming {file_path} from byte {offset:,}")
+            mode = 'ab'
+        else:
+            offset = 0
+            content_length = response.headers.get("Content-Length")
+            sized = passthrough or not (encoded or compression)
+            total = int(content_length) if content_length and sized else None
+            mode = 'wb'
+
+        entry = {
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+        if encoded or compression:
+            # Range offsets count transfer bytes, which do not line up with
+            # what is written here, so this download cannot be resumed;
+            # make sure no stale entry says otherwise.
+            get_cache_path(part_path).unlink(missing_ok=True)
+        else:
+            write_fetch_cache(part_path, dict(entry, size=total))
+
+        digest = hashlib.sha256()
+        if offset:
+            with part_path.open('rb') as file:
+                for chunk in iter(lambda: file.read(chunk_size), b""):
+                    digest.update(chunk)
+
+        with part_path.open(mode) as file:
+            for chunk in chunks:
+                file.write(chunk)
+                digest.update(chunk)
+
+    size = part_path.stat().st_size
+    if total is not None and size != total:
+        raise DownloadError(f"Download of {url} has {size:,} bytes, expected {total:,}")
+    entry["sha256"] = digest.hexdigest()
+    entry["size"] = size
+    return entry
+
+
+def download_to_file(
+    url: str,
+    file_path: pathlib.Path,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    use_cache: bool = False,
+    max_resume_attempts: int = RESUME_ATTEMPTS,
+    expected_sha256: str = None,
+    compression: str = None,
+    check_file=None,
+):
+    """
+    Stream the body at url to file_path without holding it all in memory.
+
+    The body is written chunk by chunk to a .part file next to the target.
+    If the connection drops, the .part file is kept and the download resumes
+    from where it stopped with an HTTP Range request (also on a later run).
+    Once complete, the size (and expected_sha256, if given) is checked and
+    the .part file is atomically renamed to file_path, so a failed transfer
+    never replaces the previous file_path.
+
+    With use_cache, the ETag, Last-Modified and SHA-256 of the download are
+    saved next to the file, and later calls send If-None-Match /
+    If-Modified-Since so an unchanged file is not downloaded again.
+
+    Args:
+        url (str): URL of the file to download.
+        file_path (pathlib.Path): Path to save the file to.
+        chunk_size (int): Number of bytes to read and write at a time.
+        use_cache (bool): If True, make a conditional request using the fetch cache.
+        max_resume_attempts (int): How many times to resume after a dropped connection.
+        expected_sha256 (str): Optional SHA-256 hex digest the file must match.
+        compression (str): None to store the body as-is, or "gzip" / "zstd" to keep
+            it compressed on disk (file_path should then end in .gz / .zst).
+        check_file: Optional function called with the finished .part path before
+            the rename; it should raise DownloadError if the content is invalid.
+
+    Returns:
+        int: Number of bytes written, or None if the server reported
+            the cached file as not modified.
+
+    Raises:
+        requests.exceptions.RequestException: If the request fails.
+        DownloadError: If the finished file fails its size or hash check.
+        IOError: If the file cannot be written.
+    """
+    file_path = pathlib.Path(file_path)
+    part_path = get_part_path(file_path)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    if compression:
+        check_compression(compression)
+
+    start = time.perf_counter()
+    for attempt in range(max_resume_attempts + 1):
+        try:
+            entry = download_part(url, file_path, chunk_size, use_cache, compression)
+            break
+        except RESUMABLE_ERRORS as err:
+            kept = part_path.stat().st_size if part_path.exists() else 0
+            if attempt == max_resume_attempts:
+                logger.error(f"Giving up on {url} after {attempt + 1} attempts; kept {kept:,} bytes in {part_path}")
+                raise
+            logger.warning(f"Download of {url} interrupted at {kept:,} bytes ({err}); resuming...")
+        except DownloadError:
+            part_path.unlink(missing_ok=True)
+            get_cache_path(part_path).unlink(missing_ok=True)
+            raise
+
+    if entry is None:
+        logger.info(f"Not modified since last fetch, keeping {file_path}")
+        return None
+
+    if expected_sha256 and entry["sha256"] != expected_sha256.lower():
+        part_path.unlink(missing_ok=True)
+        get_cache_path(part_path).unlink(missing_ok=True)
+        raise DownloadError(f"Download of {url} has SHA-256 {entry['sha256']}, expected {expected_sha256}")
+    if check_file is not None:
+        try:
+            check_file(part_path)
+        except DownloadError:
+            part_path.unlink(missing_ok=True)
+            get_cache_path(part_path).unlink(missing_ok=True)
+            raise
+
+    os.replace(part_path, file_path)
+    get_cache_path(part_path).unlink(missing_ok=True)
+
+    log_transfer(file_path, entry["size"], time.perf_counter() - start)
+    if use_cache:
+        write_fetch_cache(file_path, entry)
+    return entry["size"]
@@ -0,0 +1,148 @@
+"""
+File Hash Helper Script
+File: utils_hash.py
+
+This script provides the file hashing and freshness checks shared by the
+fetchers and by the caches and indexes kept next to data files.
+
+Features:
+- Hashes a file with SHA-256, read in chunks.
+- Records a source file's size, modification time and SHA-256 when a
+  cache is built, and checks later whether the file is still the same.
+- Reads a cache's JSON description only if its source is unchanged.
+- Writes JSON files through a temporary file and a single rename, so a
+  reader never sees a half-written file.
+
+Only the Python Standard Library is used, so the offline processors can
+import it without loading the HTTP stack.
+"""
+
+#####################################
+# Import Modules at the Top
+#####################################
+
+# Import from Python Standard Library
+import hashlib
+import json
+import os
+import pathlib
+
+#####################################
+# Declare Global Variables
+#####################################
+
+# Default number of bytes read at a time while hashing
+DEFAULT_HASH_CHUNK_SIZE: int = 256 * 1024
+
+#####################################
+# Define Functions
+#####################################
+
+def hash_file(file_path: pathlib.Path, chunk_size: int = DEFAULT_HASH_CHUNK_SIZE) -> str:
+    """Return the SHA-256 hex digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with pathlib.Path(file_path).open('rb') as file:
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def get_source_stamp(file_path: pathlib.Path) -> dict:
+    """
+    Return the size, modification time and SHA-256 of a source file.
+
+    Store these in a cache's description so is_source_unchanged can
+    check it later.
+    """
+    file_path = pathlib.Path(file_path)
+    stat = file_path.stat()
+    return {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": hash_file(file_path),
+    }
+
+
+def is_source_unchanged(meta: dict, file_path: pathlib.Path) -> bool:
+    """
+    Return True if file_path still matches the stamp recorded in meta.
+
+    A matching size and modification time are trusted. If only the
+    modification time changed (for example, the same file was fetched
+    again), the SHA-256 decides and meta["mtime_ns"] is updated, so the
+    caller can save meta and skip the hash next time.
+
+    Args:
+        meta (dict): Cache description holding size, mtime_ns and sha256
+            (see get_source_stamp).
+        file_path (pathlib.Path): Path of the source file.
+
+    Returns:
+        bool: True if the file is unchanged.
+    """
+    file_path = pathlib.Path(file_path)
+    stat = file_path.stat()
+    if stat.st_size != meta.get("size"):
+        return False
+    if stat.st_mtime_ns != meta.get("mtime_ns"):
+        if hash_file(file_path) != meta.get("sha256"):
+            return False
+        meta["mtime_ns"] = stat.st_mtime_ns
+    return True
+
+
+def write_json_atomically(file_path: pathlib.Path, data, **dump_options) -> None:
+    """
+    Write data as JSON to file_path, replacing the old file in a single rename.
+
+    Args:
+        file_path (pathlib.Path): Path of the JSON file.
+        data: The data to write.
+        **dump_options: Passed to json.dump (indent, separators, ...).
+
+    Raises:
+        IOError: If the file cannot be written.
+    """
+    file_path = pathlib.Path(file_path)
+    tmp_path = file_path.with_name(file_path.name + ".tmp")
+    with tmp_path.open('w', encoding='utf-8') as file:
+        json.dump(data, file, **dump_options)
+    os.replace(tmp_path, file_path)
+
+
+def read_source_meta(meta_path: pathlib.Path, file_path: pathlib.Path, warn=print, **dump_options) -> dict:
+    """
+    Read a cache's JSON description if the source it describes is unchanged.
+
+    The description must hold the source's stamp (see get_source_stamp).
+    When only the source's modification time changed, the refreshed time
+    is saved back with write_json_atomically.
+
+    Args:
+        meta_path (pathlib.Path): Path of the JSON description.
+        file_path (pathlib.Path): Path of the source file.
+        warn: Called with a message if the description cannot be read or saved.
+        **dump_options: Passed to json.dump when the description is saved.
+
+    Returns:
+        dict: The description, or an empty dict if it is missing, unreadable
+            or describes another version of the source.
+    """
+    try:
+        with pathlib.Path(meta_path).open('r', encoding='utf-8') as file:
+            meta = json.load(file)
+    except FileNotFoundError:
+        return {}
+    except (IOError, ValueError) as e:
+        warn(f"Ignoring unreadable {meta_path}: {e}")
+        return {}
+
+    mtime_ns = meta.get("mtime_ns")
+    if not is_source_unchanged(meta, file_path):
+        return {}
+    if meta["mtime_ns"] != mtime_ns:
+        try:
+            write_json_atomically(meta_path, meta, **dump_options)
+        except IOError as io_err:
+            warn(f"Could not update {meta_path}: {io_err}")
+    return meta
@@ -0,0 +1,110 @@
+"""
+JSON Reader Helper Script
+File: utils_json.py
+
+This script reads large JSON files one top-level array element at a time.
+
+Features:
+- Reads the file in chunks and decodes each element of the top-level
+  array with json.JSONDecoder.raw_decode as soon as it is complete.
+- Only the element being decoded and the unread part of the current
+  chunk are held in memory, never the whole document.
+- Raises json.JSONDecodeError for malformed input, like json.load.
+"""
+
+#####################################
+# Import Modules at the Top
+#####################################
+
+# Import from Python Standard Library
+import json
+
+#####################################
+# Declare Global Variables
+#####################################
+
+# Number of characters read at a time
+DEFAULT_READ_SIZE: int = 64 * 1024
+
+# Characters that can continue a JSON number
+NUMBER_CHARACTERS: str = "0123456789.eE+-"
+
+#####################################
+# Define Functions
+#####################################
+
+def iter_json_array(file, read_size: int = DEFAULT_READ_SIZE):
+    """
+    Yield the elements of a top-level JSON array one at a time.
+
+    Args:
+        file: Open text file holding a JSON array.
+        read_size (int): Number of characters read at a time. It doubles
+            while an element larger than the buffer is being read.
+
+    Yields:
+        The decoded elements (dicts, lists, strings, numbers, ...), in order.
+
+    Raises:
+        json.JSONDecodeError: If the file is not a well-formed JSON array.
+    """
+    decoder = json.JSONDecoder()
+    buffer = file.read(read_size)
+    position = 0
+    at_end = not buffer
+    expect_comma = False
+    started = False
+
+    while True:
+        # Skip whitespace (and the comma between elements), reading more as needed
+        while True:
+            while position < len(buffer) and buffer[position] in " \t\r\n":
+                position += 1
+            if position < len(buffer) or at_end:
+                break
+            buffer, position = file.read(read_size), 0
+            at_end = not buffer
+
+        if position >= len(buffer):
+            raise json.JSONDecodeError("Unexpected end of JSON array", buffer, position)
+        character = buffer[position]
+        if not started:
+            if character != "[":
+                raise json.JSONDecodeError("Expecting '['", buffer, position)
+            started = True
+            position += 1
+            continue
+        if character == "]" and not (expect_comma is None):
+            # Only whitespace may follow the array, as with json.load
+            rest = buffer[position + 1:]
+            while rest.strip(" \t\r\n") == "" and not at_end:
+                rest = file.read(read_size)
+                at_end = not rest
+            if rest.strip(" \t\r\n"):
+                raise json.JSONDecodeError("Extra data", rest, 0)
+            return
+        if expect_comma:
+            if character != ",":
+                raise json.JSONDecodeError("Expecting ',' delimiter", buffer, position)
+            position += 1
+            expect_comma = None  # An element must follow the comma
+            continue
+
+        # Decode the next element, reading more until it is complete
+        size = read_size
+        while True:
+            try:
+                element, end = decoder.raw_decode(buffer, position)
+                if at_end or (end < len(buffer) and buffer[end] not in NUMBER_CHARACTERS):
+                    break  # Complete (a number cut off by the end of the buffer is not)
+            except json.JSONDecodeError:
+                if at_end:
+                    raise
+            more = file.read(size)
+            at_end = not more
+            buffer, position = buffer[position:] + more, 0
+            size *= 2
+
+        yield element
+        position = end
+        expect_comma = True
@@ -0,0 +1,239 @@
+"""
+Text Counting Helper Script
+File: utils_text.py
+
+This script counts many words in a text in a single pass.
+
+Features (substring matching, count_terms):
+- Builds an Aho-Corasick automaton over the vocabulary, so each character
+  of the text is looked at once however many terms there are.
+- Completes the automaton's transitions lazily as characters are seen,
+  so the scan is one dictionary lookup per character.
+- Reads the text in fixed-size blocks and carries the automaton state
+  across them, so matches that cross a block boundary are still found.
+- Counts like str.lower().count(term.lower()) for every term: case-insensitive,
+  substrings included, and non-overlapping matches of each term.
+
+Features (whole-word matching, count_words):
+- Splits the text into words (runs of Unicode letters, digits and
+  underscores) and compares them casefolded, so "Ahab" matches "AHAB"
+  and "Ahab's" but not "Ahabs".
+- Searches lowered blocks of plain ASCII text for a few words directly,
+  and tokenizes other blocks (or many words) instead.
+- Reads fixed-size blocks and holds back a word cut off at the end of a
+  block until the next one, so memory stays flat whatever the file size.
+"""
+
+#####################################
+# Import Modules at the Top
+#####################################
+
+# Import from Python Standard Library
+import re
+from collections import Counter, deque
+
+#####################################
+# Declare Global Variables
+#####################################
+
+# Number of characters read at a time
+DEFAULT_BLOCK_SIZE: int = 1024 * 1024
+
+# A word: a run of Unicode letters, digits and underscores
+WORD_PATTERN = re.compile(r"\w+")
+
+# Largest number of words searched for one by one in ASCII blocks (more are found by tokenizing)
+SCAN_WORD_LIMIT: int = 16
+
+#####################################
+# Define Classes
+#####################################
+
+class TermCounter:
+    """
+    Count every term of a vocabulary in one pass over a text.
+
+    Feed the text in blocks with feed(); counts() returns the totals so far.
+    Matching is case-insensitive (both sides are lowered), and each term's
+    matches are counted without overlapping each other, like str.count.
+    """
+
+    def __init__(self, terms):
+        self.terms = list(terms)
+        patterns = {}  # Lowered term -> pattern number (terms differing only in case share one)
+        self.pattern_of = []
+        for term in self.terms:
+            if not term:
+                raise ValueError("Terms must not be empty")
+            self.pattern_of.append(patterns.setdefault(term.lower(), len(patterns)))
+
+        # The trie of all patterns; state 0 is the root
+        self.transitions = [{}]
+        self.outputs = [()]
+        for pattern, number in patterns.items():
+            state = 0
+            for character in pattern:
+                next_state = self.transitions[state].get(character)
+                if next_state is None:
+                    next_state = self.transitions[state][character] = len(self.transitions)
+                    self.transitions.append({})
+                    self.outputs.append(())
+                state = next_state
+            self.outputs[state] += ((number, len(pattern)),)
+
+        # Failure links, breadth first; each state also reports its failure state's matches
+        self.failures = [0] * len(self.transitions)
+        queue = deque(self.transitions[0].values())
+        while queue:
+            state = queue.popleft()
+            for character, child in self.transitions[state].items():
+                queue.append(child)
+                failure = self.failures[state]
+                while failure and character not in self.transitions[failure]:
+                    failure = self.failures[failure]
+                self.failures[child] = self.transitions[failure].get(character, 0)
+                self.outputs[child] += self.outputs[self.failures[child]]
+
+        self.pattern_total = len(patterns)
+        self.reset()
+
+    def reset(self) -> None:
+        """Start counting a new text."""
+        self.state = 0
+        self.position = 0
+        self.pattern_counts = [0] * self.pattern_total
+        self.match_ends = [0] * self.pattern_total  # Where each pattern's last counted match ended
+
+    def find_transition(self, state: int, character: str) -> int:
+        """Follow failure links to the next state for character, and remember the answer."""
+        failure = state
+        while failure and character not in self.transitions[failure]:
+            failure = self.failures[failure]
+        next_state = self.transitions[failure].get(character, 0)
+        self.transitions[state][character] = next_state
+        return next_state
+
+    def feed(self, text: str) -> None:
+        """Scan the next block of the text."""
+        transitions = self.transitions
+        outputs = self.outputs
+        counts = self.pattern_counts
+        match_ends = self.match_ends
+        state = self.state
+        text = text.lower()
+        for position, character in enumerate(text, self.position + 1):
+            next_state = transitions[state].get(character)
+            if next_state is None:
+                next_state = self.find_transition(state, character)
+            state = next_state
+            for number, length in outputs[state]:
+                if position - length >= match_ends[number]:  # Does not overlap the last match
+                    counts[number] += 1
+                    match_ends[number] = position
+        self.state = state
+        self.position += len(text)
+
+    def counts(self) -> dict:
+        """Return each term's number of matches so far, in vocabulary order."""
+        return {term: self.pattern_counts[number] for term, number in zip(self.terms, self.pattern_of)}
+
+#####################################
+# Define Functions
+#####################################
+
+def count_terms(file, terms, block_size: int = DEFAULT_BLOCK_SIZE) -> dict:
+    """
+    Count every term in an open text file in one pass.
+
+    Args:
+        file: Open text file.
+        terms: The words (or phrases) to count.
+        block_size (int): Number of characters read at a time.
+
+    Returns:
+        dict: Term to its number of case-insensitive, non-overlapping
+            matches, in the order the terms were given.
+
+    Raises:
+        ValueError: If a term is empty.
+    """
+    counter = TermCounter(terms)
+    for block in iter(lambda: file.read(block_size), ""):
+        counter.feed(block)
+    return counter.counts()
+
+
+def is_word_character(character: str) -> bool:
+    """Return True if character can be part of a word (what \\w matches)."""
+    return character.isalnum() or character == "_"
+
+
+def iter_word_blocks(file, block_size: int = DEFAULT_BLOCK_SIZE):
+    """
+    Yield the text of an open file in blocks that never end inside a word.
+
+    A word cut off at the end of a block is held back and yielded at the
+    start of the next block, so the held-back text is at most one word.
+
+    Args:
+        file: Open text file.
+        block_size (int): Number of characters read at a time.
+
+    Yields:
+        str: The next block of the text.
+    """
+    carry = ""
+    for block in iter(lambda: file.read(block_size), ""):
+        block = carry + block
+        end = len(block)
+        while end and is_word_character(block[end - 1]):
+            end -= 1  # Step back over the word cut off at the end
+        carry = block[end:]
+        if end:
+            yield block[:end]
+    if carry:
+        yield carry
+
+
+def count_words(file, words, block_size: int = DEFAULT_BLOCK_SIZE) -> dict:
+    """
+    Count whole-word, casefolded matches of every word in an open text file in one pass.
+
+    Args:
+        file: Open text file.
+        words: The words to count (each a single word, such as "Ahab").
+        block_size (int): Number of characters read at a time.
+
+    Returns:
+        dict: Word to its number of whole-word matches, in the order the
+            words were given.
+
+    Raises:
+        ValueError: If a word is empty or is not a single word.
+    """
+    wanted = {}
+    for word in words:
+        if not WORD_PATTERN.fullmatch(word):
+            raise ValueError(f"'{word}' is not a single word")
+        wanted[word] = word.casefold()
+
+    totals = dict.fromkeys(wanted.values(), 0)
+    # Word-end patterns start with the word itself, so the regex engine can search for it quickly
+    word_ends = {folded: re.compile(re.escape(folded) + r"(?!\w)") for folded in totals if folded.isascii()}
+    scan_ascii = len(totals) <= SCAN_WORD_LIMIT
+    for block in iter_word_blocks(file, block_size):
+        if scan_ascii and block.isascii():
+            # In ASCII text casefolding is lowercasing, so search the lowered block for each word
+            block = block.lower()
+            for folded, word_end in word_ends.items():
+                for match in word_end.finditer(block):
+                    start = match.start()
+                    if start == 0 or not is_word_character(block[start - 1]):
+                        totals[folded] += 1
+            continue
+        # Count the block's words as written, then fold each distinct word once
+        for token, count in Counter(WORD_PATTERN.findall(block)).items():
+            folded = token.casefold()
+            if folded in totals:
+                totals[folded] += count
+    return {word: totals[folded] for word, folded in wanted.items()}
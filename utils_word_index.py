@@ -0,0 +1,260 @@
+"""
+Word Index Helper Script
+File: utils_word_index.py
+
+This script keeps a word frequency index of a text file next to the file.
+
+Features:
+- Tokenizes the text once, the way utils_text.count_words does (whole
+  words, Unicode casefolded), and saves every word's count.
+- Optionally also saves where each word occurs, so questions such as
+  "which words appear near 'whale'" need no rescan either.
+- Stores the words and counts as JSON (most frequent first, so top-N is
+  a slice) and the positions as packed 32-bit integers read through mmap.
+- Keys the index by the source's size, modification time and SHA-256, and
+  rebuilds it automatically when the source changes.
+"""
+
+#####################################
+# Import Modules at the Top
+#####################################
+
+# Import from Python Standard Library
+import itertools
+import mmap
+import os
+import pathlib
+from array import array
+from collections import Counter
+
+# Import from local project modules
+from utils_logger import logger
+from utils_compress import open_text
+from utils_hash import get_source_stamp, read_source_meta, write_json_atomically
+from utils_text import WORD_PATTERN, iter_word_blocks
+
+#####################################
+# Declare Global Variables
+#####################################
+
+# Suffixes of the index files stored next to each source file
+WORD_INDEX_SUFFIX: str = ".words.json"
+WORD_POSITIONS_SUFFIX: str = ".words.bin"
+
+# json.dump options of the saved index (compact, words kept as written)
+WORD_INDEX_JSON_OPTIONS: dict = {"ensure_ascii": False, "separators": (",", ":")}
+
+# Array type code of the stored positions (unsigned 32-bit)
+POSITION_TYPE: str = "I"
+
+#####################################
+# Define Classes
+#####################################
+
+class WordIndex:
+    """
+    A loaded word index: word counts, and word positions if they were saved.
+
+    Words are looked up casefolded. Positions count words, not characters
+    (the first word of the text is at position 0). With positions, the
+    binary file holds the text's word sequence (as word numbers) followed
+    by every word's positions, grouped by word.
+    """
+
+    def __init__(self, meta: dict, positions=None):
+        self.meta = meta
+        self.words = meta["words"]
+        self.counts = meta["counts"]
+        self.total = meta["total"]
+        self.number_of = {word: number for number, word in enumerate(self.words)}
+        self.offsets = [0, *itertools.accumulate(self.counts)]
+        self.positions = positions  # memoryview of the binary file, or None
+
+    def count(self, word: str) -> int:
+        """Return the number of times word occurs."""
+        number = self.number_of.get(word.casefold())
+        return 0 if number is None else self.counts[number]
+
+    def top(self, n: int) -> list:
+        """Return the n most frequent (word, count) pairs, most frequent first."""
+        return list(zip(self.words[:n], self.counts[:n]))
+
+    def find(self, word: str) -> list:
+        """
+        Return the positions of word, in text order.
+
+        Raises:
+            ValueError: If the index was built without positions.
+        """
+        if self.positions is None:
+            raise ValueError("This word index was built without positions")
+        number = self.number_of.get(word.casefold())
+        if number is None:
+            return []
+        start = self.total + self.offsets[number]
+        return self.positions[start:start + self.counts[number]].tolist()
+
+    def near(self, word: str, distance: int = 5, n: int = 10) -> list:
+        """
+        Return the n words seen most often within distance words of word.
+
+        Raises:
+            ValueError: If the index was built without positions.
+        """
+        neighbors = Counter()
+        for position in self.find(word):
+            start, end = max(0, position - distance), min(self.total, position + distance + 1)
+            neighbors.update(self.positions[start:position])
+            neighbors.update(self.positions[position + 1:end])
+        return [(self.words[number], count) for number, count in neighbors.most_common(n)]
+
+#####################################
+# Define Functions
+#####################################
+
+def get_word_index_paths(file_path: pathlib.Path) -> tuple:
+    """Return the index and positions paths for file_path (moby_dick.txt -> moby_dick.txt.words.json, .words.bin)."""
+    file_path = pathlib.Path(file_path)
+    return (
+        file_path.with_name(file_path.name + WORD_INDEX_SUFFIX),
+        file_path.with_name(file_path.name + WORD_POSITIONS_SUFFIX),
+    )
+
+
+def read_word_index_meta(file_path: pathlib.Path) -> dict:
+    """
+    Read the saved index of file_path if it still matches the source.
+
+    See utils_hash.read_source_meta; a refreshed modification time is
+    saved back to the index.
+
+    Returns:
+        dict: The saved index, or an empty dict if there is no valid index.
+    """
+    meta_path, _ = get_word_index_paths(file_path)
+    return read_source_meta(meta_path, file_path, warn=logger.warning, **WORD_INDEX_JSON_OPTIONS)
+
+
+def write_word_index_meta(file_path: pathlib.Path, meta: dict) -> None:
+    """Write the saved index, replacing the old one in a single rename."""
+    meta_path, _ = get_word_index_paths(file_path)
+    write_json_atomically(meta_path, meta, **WORD_INDEX_JSON_OPTIONS)
+
+
+def build_word_index(file_path: pathlib.Path, positions: bool = False) -> dict:
+    """
+    Tokenize file_path once and save its word index next to it.
+
+    Args:
+        file_path (pathlib.Path): Path to the text file (plain, .gz or .zst).
+        positions (bool): Also save where every word occurs.
+
+    Returns:
+        dict: The saved index (source size, modification time and SHA-256,
+            total words, and the words and their counts, most frequent first).
+    """
+    file_path = pathlib.Path(file_path)
+    stamp = get_source_stamp(file_path)  # Taken first, so a file replaced meanwhile never matches the index
+    number_of = {}  # Casefolded word -> number in first-seen order (positions only)
+    sequence = array(POSITION_TYPE)  # First-seen number of every word of the text (positions only)
+    token_counts = Counter()  # Words as written (without positions)
+    with open_text(file_path) as file:
+        for block in iter_word_blocks(file):
+            tokens = WORD_PATTERN.findall(block)
+            if positions:
+                folded = {token: token.casefold() for token in set(tokens)}
+                sequence.extend(number_of.setdefault(folded[token], len(number_of)) for token in tokens)
+            else:
+                token_counts.update(tokens)
+
+    totals = Counter()
+    if positions:
+        seen = list(number_of)
+        for number, count in Counter(sequence).items():
+            totals[seen[number]] = count
+    else:
+        for token, count in token_counts.items():
+            totals[token.casefold()] += count
+
+    ranked = sorted(totals.items(), key=lambda item: (-item[1], item[0]))
+    meta = {
+        **stamp,
+        "total": sum(totals.values()),
+        "positions": positions,
+        "words": [word for word, _ in ranked],
+        "counts": [count for _, count in ranked],
+    }
+
+    meta_path, positions_path = get_word_index_paths(file_path)
+    try:
+        if positions:
+            write_word_positions(positions_path, sequence, [number_of[word] for word in meta["words"]], meta["counts"])
+        else:
+            positions_path.unlink(missing_ok=True)
+        write_word_index_meta(file_path, meta)  # Written last, so it never describes missing positions
+        logger.info(f"Indexed {meta['total']:,} words ({len(ranked):,} distinct) of {file_path} in {meta_path}")
+    except IOError as io_err:
+        logger.warning(f"Could not write word index {meta_path}: {io_err}")
+    return meta
+
+
+def write_word_positions(positions_path: pathlib.Path, sequence: array, seen_numbers: list, counts: list) -> None:
+    """
+    Write the word sequence renumbered by rank, then every word's positions grouped by rank.
+
+    Args:
+        positions_path (pathlib.Path): Path of the binary file.
+        sequence (array): First-seen word number of every word of the text.
+        seen_numbers (list): First-seen number of the word at each rank.
+        counts (list): Count of the word at each rank.
+    """
+    rank_of = [0] * len(seen_numbers)
+    for rank, number in enumerate(seen_numbers):
+        rank_of[number] = rank
+    ranked_sequence = array(POSITION_TYPE, (rank_of[number] for number in sequence))
+
+    postings = array(POSITION_TYPE, bytes(4 * len(sequence)))
+    next_slot = [0, *itertools.accumulate(counts)][:-1]
+    for position, rank in enumerate(ranked_sequence):
+        postings[next_slot[rank]] = position
+        next_slot[rank] += 1
+
+    tmp_path = positions_path.with_name(positions_path.name + ".tmp")
+    with tmp_path.open('wb') as file:
+        ranked_sequence.tofile(file)
+        postings.tofile(file)
+    os.replace(tmp_path, positions_path)
+
+
+def load_word_positions(positions_path: pathlib.Path):
+    """Memory-map the positions file and return it as a memoryview of unsigned ints."""
+    with positions_path.open('rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return memoryview(array(POSITION_TYPE))
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    return memoryview(mapped).cast(POSITION_TYPE)
+
+
+def get_word_index(file_path: pathlib.Path, positions: bool = False) -> WordIndex:
+    """
+    Return the word index of file_path, building it first if it is missing or stale.
+
+    Args:
+        file_path (pathlib.Path): Path to the text file (plain, .gz or .zst).
+        positions (bool): Make sure word positions are available (an index
+            saved without them is rebuilt).
+
+    Returns:
+        WordIndex: The loaded index.
+    """
+    meta = read_word_index_meta(file_path)
+    if not meta or (positions and not meta.get("positions")):
+        meta = build_word_index(file_path, positions=positions)
+    if not meta.get("positions"):
+        return WordIndex(meta)
+    _, positions_path = get_word_index_paths(file_path)
+    try:
+        return WordIndex(meta, load_word_positions(positions_path))
+    except (IOError, ValueError) as e:
+        logger.warning(f"Rebuilding word index of {file_path}: {e}")
+        return WordIndex(build_word_index(file_path, positions=True), load_word_positions(positions_path))
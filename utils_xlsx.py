@@ -0,0 +1,215 @@
+"""
+Excel Reader Helper Script
+File: utils_xlsx.py
+
+This script reads .xlsx worksheets by streaming their XML directly.
+
+Features:
+- Parses the worksheet XML with ElementTree.iterparse and clears each row
+  once it is read, so memory stays flat however long the sheet is.
+- Resolves shared strings, inline strings, booleans and numbers
+  (int when the stored value has no fraction or exponent, like openpyxl).
+- Can project the rows down to the requested columns, skipping the value
+  conversion of every other cell.
+- Builds no openpyxl Workbook, Worksheet or Cell objects.
+
+Values are the cached results stored in the file, like openpyxl's
+data_only=True. Cells with a date number format come back as plain
+numbers (Excel serial dates), not datetime objects.
+"""
+
+#####################################
+# Import Modules at the Top
+#####################################
+
+# Import from Python Standard Library
+import pathlib
+import posixpath
+import zipfile
+from xml.etree import ElementTree
+
+#####################################
+# Declare Global Variables
+#####################################
+
+# XML namespaces used by SpreadsheetML packages
+MAIN_NS: str = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+REL_NS: str = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PACKAGE_REL_NS: str = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+ROW_TAG: str = f"{{{MAIN_NS}}}row"
+CELL_TAG: str = f"{{{MAIN_NS}}}c"
+VALUE_TAG: str = f"{{{MAIN_NS}}}v"
+INLINE_STRING_TAG: str = f"{{{MAIN_NS}}}is"
+TEXT_TAG: str = f"{{{MAIN_NS}}}t"
+PHONETIC_TAG: str = f"{{{MAIN_NS}}}rPh"
+SHEET_DATA_TAG: str = f"{{{MAIN_NS}}}sheetData"
+
+#####################################
+# Define Functions
+#####################################
+
+def column_index(column_letter: str) -> int:
+    """Return the 0-based index of a column letter ("A" -> 0, "AA" -> 26)."""
+    index = 0
+    for letter in column_letter.upper():
+        index = index * 26 + ord(letter) - ord("A") + 1
+    return index - 1
+
+
+def read_string_item(element) -> str:
+    """Return the text of a shared string or inline string item, joining rich text runs."""
+    parts = []
+    for child in element.iter():
+        if child.tag == PHONETIC_TAG:
+            break  # Phonetic runs come after the text and are not part of the value
+        if child.tag == TEXT_TAG and child.text:
+            parts.append(child.text)
+    return "".join(parts)
+
+
+def read_shared_strings(archive: zipfile.ZipFile) -> list:
+    """Return the workbook's shared strings table (empty if it has none)."""
+    try:
+        file = archive.open("xl/sharedStrings.xml")
+    except KeyError:
+        return []
+    strings = []
+    with file:
+        for _, element in ElementTree.iterparse(file):
+            if element.tag == f"{{{MAIN_NS}}}si":
+                strings.append(read_string_item(element))
+                element.clear()
+    return strings
+
+
+def find_sheet_path(archive: zipfile.ZipFile, sheet_name: str = None) -> str:
+    """
+    Return the archive path of a worksheet's XML.
+
+    Args:
+        archive (zipfile.ZipFile): The open .xlsx package.
+        sheet_name (str): Name of the sheet, or None for the active sheet.
+
+    Returns:
+        str: Path such as "xl/worksheets/sheet1.xml".
+
+    Raises:
+        KeyError: If the sheet does not exist.
+    """
+    workbook = ElementTree.fromstring(archive.read("xl/workbook.xml"))
+    sheets = workbook.findall(f"{{{MAIN_NS}}}sheets/{{{MAIN_NS}}}sheet")
+    if sheet_name is None:
+        view = workbook.find(f"{{{MAIN_NS}}}bookViews/{{{MAIN_NS}}}workbookView")
+        active = int(view.get("activeTab", 0)) if view is not None else 0
+        sheet = sheets[active if active < len(sheets) else 0]
+    else:
+        matches = [sheet for sheet in sheets if sheet.get("name") == sheet_name]
+        if not matches:
+            raise KeyError(f"Worksheet '{sheet_name}' does not exist")
+        sheet = matches[0]
+
+    relationship_id = sheet.get(f"{{{REL_NS}}}id")
+    relationships = ElementTree.fromstring(archive.read("xl/_rels/workbook.xml.rels"))
+    for relationship in relationships.findall(f"{{{PACKAGE_REL_NS}}}Relationship"):
+        if relationship.get("Id") == relationship_id:
+            target = relationship.get("Target")
+            if target.startswith("/"):
+                return target.lstrip("/")
+            return posixpath.normpath(posixpath.join("xl", target))
+    raise KeyError(f"Worksheet part for '{sheet.get('name')}' not found")
+
+
+def list_sheet_names(file_path: pathlib.Path) -> list:
+    """Return the names of the worksheets in an .xlsx file, in workbook order."""
+    with zipfile.ZipFile(file_path) as archive:
+        workbook = ElementTree.fromstring(archive.read("xl/workbook.xml"))
+    return [sheet.get("name") for sheet in workbook.findall(f"{{{MAIN_NS}}}sheets/{{{MAIN_NS}}}sheet")]
+
+
+def convert_cell(cell, shared_strings: list):
+    """Return the typed value of a <c> element (None for an empty cell)."""
+    cell_type = cell.get("t", "n")
+    if cell_type == "inlineStr":
+        inline = cell.find(INLINE_STRING_TAG)
+        return read_string_item(inline) if inline is not None else None
+
+    value = cell.findtext(VALUE_TAG)
+    if value is None:
+        return None
+    if cell_type == "n":
+        if "." in value or "E" in value or "e" in value:
+            return float(value)
+        return int(value)
+    if cell_type == "s":
+        return shared_strings[int(value)]
+    if cell_type == "b":
+        return value == "1"
+    return value  # "str" (formula text), "e" (error) and "d" (ISO date) stay strings
+
+
+def iter_sheet_rows(file_path: pathlib.Path, columns: list = None, sheet_name: str = None):
+    """
+    Yield the rows of a worksheet as tuples of typed values, streaming its XML.
+
+    Rows are numbered from 1 as in Excel; a row missing from the XML is
+    yielded as an empty tuple so row positions match openpyxl's.
+
+    Args:
+        file_path (pathlib.Path): Path to the .xlsx file.
+        columns (list): 0-based indexes of the columns to read, or None for
+            all. Other columns are None in the yielded tuples, which end at
+            the last requested column.
+        sheet_name (str): Name of the sheet, or None for the active sheet.
+
+    Yields:
+        tuple: The values of one row (trailing empty cells are left off).
+    """
+    wanted = set(columns) if columns is not None else None
+    width = max(wanted) + 1 if wanted else None
+    index_of = {}  # Column letters -> index, filled as letters are seen
+
+    with zipfile.ZipFile(file_path) as archive:
+        shared_strings = read_shared_strings(archive)
+        sheet_path = find_sheet_path(archive, sheet_name)
+        with archive.open(sheet_path) as file:
+            sheet_data = None
+            next_row = 1
+            for event, element in ElementTree.iterparse(file, events=("start", "end")):
+                if event == "start":
+                    if element.tag == SHEET_DATA_TAG:
+                        sheet_data = element
+                    continue
+                if element.tag != ROW_TAG:
+                    continue
+
+                row_number = int(element.get("r", next_row))
+                while next_row < row_number:
+                    yield ()
+                    next_row += 1
+                next_row = row_number + 1
+
+                values = [None] * width if width else []
+                position = 0
+                for cell in element.iter(CELL_TAG):
+                    reference = cell.get("r")
+                    if reference is not None:
+                        letters = reference.rstrip("0123456789")
+                        position = index_of.get(letters)
+                        if position is None:
+                            position = index_of[letters] = column_index(letters)
+                    if wanted is None:
+                        if position >= len(values):
+                            values.extend([None] * (position + 1 - len(values)))
+                        values[position] = convert_cell(cell, shared_strings)
+                    elif position in wanted:
+                        values[position] = convert_cell(cell, shared_strings)
+                    position += 1
+
+                if wanted is None:
+                    while values and values[-1] is None:
+                        values.pop()
+                yield tuple(values)
+
+                if sheet_data is not None:
+                    sheet_data.clear()  # Drop the rows read so far
@@ -0,0 +1,158 @@
+"""
+This file fetches all of the project data files at the same time
+and saves them to the data folder.
+
+Each entry in the manifest is a (url, folder, filename, kind) tuple.
+The kind selects which vrtachnik_get_* fetcher handles the download.
+Downloads run in a thread pool with an overall concurrency cap and a
+per-host limit, and the latency of each file and the total wall time
+are logged.
+
+By default every file is saved through its write_*_file writer: the
+CSV, text and Excel fetchers read the whole response and save it with
+write_csv_file / write_txt_file / write_excel_file, and the JSON fetcher
+rewrites the downloaded file with write_json_file (pretty=True).
+Pass stream=True (or use_cache=True) to opt in to streaming every
+response straight to disk instead, which skips the writers.
+"""
+
+#####################################
+# Import Modules at the Top
+#####################################
+
+# Import from Python Standard Library
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+# Import from local project modules
+from utils_logger import logger
+import vrtachnik_get_csv
+import vrtachnik_get_excel
+import vrtachnik_get_json
+import vrtachnik_get_text
+
+#####################################
+# Declare Global Variables
+#####################################
+
+fetched_folder_name = "data"
+
+# Maximum number of downloads running at once, overall and per host
+max_concurrent_fetches: int = 8
+max_fetches_per_host: int = 4
+
+# Fetcher used for each kind of file in the manifest
+fetchers_by_kind = {
+    "csv": vrtachnik_get_csv.fetch_csv_file,
+    "excel": vrtachnik_get_excel.fetch_excel_file,
+    "json": vrtachnik_get_json.fetch_json_file,
+    "txt": vrtachnik_get_text.fetch_txt_file,
+}
+
+# Default manifest: the same files the individual vrtachnik_get_* scripts fetch
+fetch_manifest = [
+    ('https://raw.githubusercontent.com/owid/covid-19-data/refs/heads/master/public/data/latest/owid-covid-latest.csv',
+     fetched_folder_name, "covid_19_data.csv", "csv"),
+    ('https://databank.worldbank.org/data/download/POP.xlsx',
+     fetched_folder_name, vrtachnik_get_excel.cleaned_excel_file, "excel"),
+    ('https://raw.githubusercontent.com/sharmadhiraj/free-json-datasets/refs/heads/master/datasets/premier-league-points-table.json',
+     fetched_folder_name, "premier_league_table.json", "json"),
+    ('https://www.gutenberg.org/files/2701/2701-0.txt',
+     fetched_folder_name, "moby_dick.txt", "txt"),
+]
+
+#####################################
+# Define Functions
+#####################################
+
+def fetch_one(entry: tuple, host_limits: dict, stream: bool, use_cache: bool) -> tuple:
+    """
+    Fetch a single manifest entry while holding its host's slot.
+
+    Args:
+        entry (tuple): (url, folder, filename, kind) manifest entry.
+        host_limits (dict): Semaphore per host name limiting concurrent fetches.
+        stream (bool): Whether to stream the download straight to disk
+            instead of saving it with the kind's write_*_file writer.
+        use_cache (bool): Whether to use the conditional GET fetch cache.
+
+    Returns:
+        tuple: (filename, kind, succeeded, seconds)
+    """
+    url, folder_name, filename, kind = entry
+    fetcher = fetchers_by_kind.get(kind)
+    if fetcher is None:
+        logger.error(f"Unknown kind '{kind}' for {filename}; expected one of {sorted(fetchers_by_kind)}")
+        return (filename, kind, False, 0.0)
+
+    options = {"use_cache": use_cache}
+    if kind == "json":
+        # JSON is always streamed to disk, then rewritten by write_json_file unless streaming was asked for
+        options["pretty"] = not (stream or use_cache)
+    else:
+        options["stream"] = stream
+
+    with host_limits[urlparse(url).hostname]:
+        start = time.perf_counter()
+        succeeded = fetcher(folder_name, filename, url, **options)
+        seconds = time.perf_counter() - start
+
+    logger.info(f"Fetched {filename} ({kind}) in {seconds:.2f}s, success={succeeded}")
+    return (filename, kind, succeeded, seconds)
+
+
+def fetch_all(
+    manifest: list,
+    max_workers: int = max_concurrent_fetches,
+    per_host: int = max_fetches_per_host,
+    stream: bool = False,
+    use_cache: bool = False,
+) -> list:
+    """
+    Fetch every entry in the manifest concurrently.
+
+    Args:
+        manifest (list): List of (url, folder, filename, kind) tuples.
+        max_workers (int): Maximum number of downloads running at once.
+        per_host (int): Maximum number of downloads running at once against one host.
+        stream (bool): Whether to stream downloads straight to disk. Either
+            this or use_cache makes every fetcher skip its write_*_file writer.
+        use_cache (bool): Whether to use the conditional GET fetch cache.
+
+    Returns:
+        list: (filename, kind, succeeded, seconds) per entry, in manifest order.
+    """
+    host_limits = defaultdict(lambda: threading.BoundedSemaphore(per_host))
+    # Create every host's semaphore up front so worker threads never race to add one
+    for url, _, _, _ in manifest:
+        host_limits[urlparse(url).hostname]
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(lambda entry: fetch_one(entry, host_limits, stream, use_cache), manifest))
+    total_seconds = time.perf_counter() - start
+
+    succeeded = sum(1 for result in results if result[2])
+    logger.info(f"Fetched {succeeded} of {len(results)} files in {total_seconds:.2f}s total wall time")
+    return results
+
+#####################################
+# Define main() function
+#####################################
+
+def main():
+    """
+    Main function to fetch all project data files concurrently.
+    """
+    logger.info("Starting concurrent fetch of all data files...")
+    fetch_all(fetch_manifest)
+
+#####################################
+# Conditional Execution
+#####################################
+
+if __name__ == '__main__':
+    main()
@@ -9,7 +9,9 @@ and ensures it is saved in a standard .xlsx format for easy processing.
 #####################################
 
 # Import from Python Standard Library
+import os
 import pathlib
+import zipfile
 
 # Import from external packages
 import requests
@@ -17,6 +19,7 @@ import openpyxl  # Ensure we can process Excel files properly
 
 # Import from local project modules
 from utils_logger import logger
+from utils_fetch import DEFAULT_CHUNK_SIZE, download_to_file, get_session, refresh_fetch_cache
 
 #####################################
 # Declare Global Variables
@@ -25,11 +28,14 @@ from utils_logger import logger
 fetched_folder_name = "data"
 cleaned_excel_file = "world_population.xlsx"
 
+# Content type of the main workbook part in a standard .xlsx package
+xlsx_main_content_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"
+
 #####################################
 # Define Functions
 #####################################
 
-def fetch_excel_file(folder_name: str, filename: str, url: str) -> None:
+def fetch_excel_file(folder_name: str, filename: str, url: str, stream: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE, use_cache: bool = False) -> bool:
     """
     Fetch Excel data from the given URL and write it to a file.
 
@@ -37,28 +43,49 @@ def fetch_excel_file(folder_name: str, filename: str, url: str) -> None:
         folder_name (str): Name of the folder to save the file.
         filename (str): Name of the output file.
         url (str): URL of the Excel file to fetch.
+        stream (bool): If True, stream the response to disk in chunks
+            instead of holding the whole body in memory.
+        chunk_size (int): Number of bytes per chunk when streaming.
+        use_cache (bool): If True, skip the download when the server reports
+            the previously fetched file as not modified (implies streaming).
 
     Returns:
-        None
+        bool: True if the file was fetched (or is already up to date), False otherwise.
     """
     if not url:
         logger.error("The URL provided is empty. Please provide a valid URL.")
-        return
+        return False
 
     try:
         logger.info(f"Fetching Excel data from {url}...")
-        response = requests.get(url)
-        response.raise_for_status()
-        raw_file = write_excel_file(folder_name, filename, response.content)
+        if stream or use_cache:
+            raw_file = pathlib.Path(folder_name).joinpath(filename)
+            if download_to_file(url, raw_file, chunk_size, use_cache) is None:
+                logger.info(f"SUCCESS: {filename} is already up to date")
+                return True
+        else:
+            response = get_session().get(url)
+            response.raise_for_status()
+            raw_file = write_excel_file(folder_name, filename, response.content)
+            if raw_file is None:
+                return False
         
         # Convert to standard .xlsx format to ensure it's readable
         clean_excel_file(raw_file)
+        if use_cache:
+            refresh_fetch_cache(raw_file)
         
         logger.info(f"SUCCESS: Excel file fetched, cleaned, and saved as {filename}")
+        return True
     except requests.exceptions.HTTPError as http_err:
         logger.error(f"HTTP error occurred: {http_err}")
+        return False
     except requests.exceptions.RequestException as req_err:
         logger.error(f"Request error occurred: {req_err}")
+        return False
+    except IOError as io_err:
+        logger.error(f"Error writing Excel data to {filename}: {io_err}")
+        return False
 
 def write_excel_file(folder_name: str, filename: str, binary_data: bytes) -> pathlib.Path:
     """
@@ -84,9 +111,62 @@ def write_excel_file(folder_name: str, filename: str, binary_data: bytes) -> pat
         logger.error(f"Error writing Excel data to {file_path}: {io_err}")
         return None
 
+def is_standard_xlsx(file_path: pathlib.Path) -> bool:
+    """
+    Check whether a file is already a standard .xlsx package.
+
+    Only the zip directory and [Content_Types].xml are read, so this is
+    cheap even for very large workbooks.
+
+    Args:
+        file_path (pathlib.Path): Path to the downloaded Excel file.
+
+    Returns:
+        bool: True if the file is a zip package declaring an .xlsx main workbook part.
+    """
+    if not zipfile.is_zipfile(file_path):
+        return False
+    try:
+        with zipfile.ZipFile(file_path) as archive:
+            content_types = archive.read("[Content_Types].xml")
+    except (KeyError, zipfile.BadZipFile):
+        return False
+    return xlsx_main_content_type.encode() in content_types
+
+def rewrite_excel_file(file_path: pathlib.Path, cleaned_path: pathlib.Path) -> None:
+    """
+    Rewrite a workbook as a standard .xlsx by streaming its rows.
+
+    Rows are read with a read-only workbook and appended to a write-only
+    workbook, so the whole sheet is never built in memory. Only cell values
+    are kept (formatting is dropped).
+
+    Args:
+        file_path (pathlib.Path): Path to the downloaded Excel file.
+        cleaned_path (pathlib.Path): Path to save the cleaned workbook to.
+
+    Returns:
+        None
+    """
+    temp_path = cleaned_path.with_name(cleaned_path.name + ".tmp")
+    source = openpyxl.load_workbook(file_path, read_only=True)
+    try:
+        target = openpyxl.Workbook(write_only=True)
+        for source_sheet in source.worksheets:
+            target_sheet = target.create_sheet(title=source_sheet.title)
+            for row in source_sheet.iter_rows(values_only=True):
+                target_sheet.append(row)
+        target.save(temp_path)
+    finally:
+        source.close()
+    os.replace(temp_path, cleaned_path)
+
 def clean_excel_file(file_path: pathlib.Path):
     """
-    Open the downloaded Excel file and save it again in a standard .xlsx format.
+    Make sure the downloaded Excel file is saved in a standard .xlsx format.
+
+    A file that is already a standard .xlsx package is just renamed into
+    place. Anything else is rewritten row by row with rewrite_excel_file.
 
     Args:
         file_path (pathlib.Path): Path to the downloaded Excel file.
@@ -95,9 +175,13 @@ def clean_excel_file(file_path: pathlib.Path):
         None
     """
     try:
-        workbook = openpyxl.load_workbook(file_path)
         cleaned_path = file_path.parent / cleaned_excel_file
-        workbook.save(cleaned_path)  # Save in a cleaned format
+        if is_standard_xlsx(file_path):
+            if file_path != cleaned_path:
+                os.replace(file_path, cleaned_path)
+            logger.info(f"SUCCESS: {file_path.name} is already a standard .xlsx, saved as {cleaned_path}")
+            return
+        rewrite_excel_file(file_path, cleaned_path)
         logger.info(f"SUCCESS: Cleaned Excel file saved as {cleaned_path}")
     except Exception as e:
         logger.error(f"Error cleaning Excel file: {e}")
@@ -112,7 +196,7 @@ def main():
     """
     excel_url = 'https://databank.worldbank.org/data/download/POP.xlsx'
     logger.info("Starting Excel fetch demonstration...")
-    fetch_excel_file(fetched_folder_name, cleaned_excel_file, excel_url)
+    fetch_excel_file(fetched_folder_name, cleaned_excel_file, excel_url, stream=True, use_cache=True)
 
 #####################################
 # Conditional Execution
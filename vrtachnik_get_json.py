@@ -20,6 +20,7 @@ import requests
 
 # Import from local project modules
 from utils_logger import logger
+from utils_fetch import DEFAULT_CHUNK_SIZE, DownloadError, download_to_file, refresh_fetch_cache
 
 #####################################
 # Declare Global Variables
@@ -31,35 +32,95 @@ fetched_folder_name = "data"
 # Define Functions
 #####################################
 
-def fetch_json_file(folder_name: str, filename: str, url: str) -> None:
+def fetch_json_file(folder_name: str, filename: str, url: str, chunk_size: int = DEFAULT_CHUNK_SIZE, use_cache: bool = False, validate: bool = False, pretty: bool = False) -> bool:
     """
     Fetch JSON data from the given URL and write it to a file.
 
+    The response bytes are already valid JSON, so by default they are streamed
+    straight to disk without being parsed and re-encoded.
+
     Args:
         folder_name (str): Name of the folder to save the file.
         filename (str): Name of the output file.
         url (str): URL of the JSON file to fetch.
+        chunk_size (int): Number of bytes per chunk when streaming.
+        use_cache (bool): If True, skip the download when the server reports
+            the previously fetched file as not modified.
+        validate (bool): If True, run a cheap structural check (the file must
+            start with { or [ and end with the matching bracket) before saving.
+        pretty (bool): If True, parse the saved file and rewrite it indented.
 
     Returns:
-        None
-
+        bool: True if the file was fetched (or is already up to date), False otherwise.
     Example:
         fetch_json_file("data", "data.json", "https://example.com/data.json")
     """
     if not url:
         logger.error("The URL provided is empty. Please provide a valid URL.")
-        return
+        return False
 
     try:
         logger.info(f"Fetching JSON data from {url}...")
-        response = requests.get(url)
-        response.raise_for_status()
-        write_json_file(folder_name, filename, response.json())
+        file_path = pathlib.Path(folder_name).joinpath(filename)
+        check_file = check_json_file if validate else None
+        if download_to_file(url, file_path, chunk_size, use_cache, check_file=check_file) is None:
+            logger.info(f"SUCCESS: {filename} is already up to date")
+            return True
+        if pretty:
+            pretty_print_json_file(folder_name, filename)
+            if use_cache:
+                refresh_fetch_cache(file_path)
         logger.info(f"SUCCESS: JSON file fetched and saved as {filename}")
+        return True
     except requests.exceptions.HTTPError as http_err:
         logger.error(f"HTTP error occurred: {http_err}")
+        return False
     except requests.exceptions.RequestException as req_err:
         logger.error(f"Request error occurred: {req_err}")
+        return False
+    except IOError as io_err:
+        logger.error(f"Error writing JSON data to {filename}: {io_err}")
+        return False
+    except ValueError as json_err:
+        logger.error(f"Error parsing JSON data in {filename}: {json_err}")
+        return False
+
+def check_json_file(file_path: pathlib.Path) -> None:
+    """
+    Cheaply check that a file looks like a single JSON object or array.
+
+    Only the first and last bytes of the file are read, so this catches
+    truncated downloads and HTML error pages without parsing the whole file.
+
+    Args:
+        file_path (pathlib.Path): Path to the file to check.
+
+    Raises:
+        DownloadError: If the file does not start with { or [ and end with the matching bracket.
+    """
+    with file_path.open('rb') as file:
+        head = file.read(64).lstrip(b"\xef\xbb\xbf \t\r\n")
+        file.seek(max(0, file_path.stat().st_size - 64))
+        tail = file.read().rstrip(b" \t\r\n")
+    closing_brackets = {b"{": b"}", b"[": b"]"}
+    if not head or not tail or closing_brackets.get(head[:1]) != tail[-1:]:
+        raise DownloadError(f"{file_path} does not look like a JSON object or array")
+
+def pretty_print_json_file(folder_name: str, filename: str) -> None:
+    """
+    Parse a saved JSON file and rewrite it with indentation.
+
+    Args:
+        folder_name (str): Name of the folder the file is in.
+        filename (str): Name of the JSON file.
+
+    Returns:
+        None
+    """
+    file_path = pathlib.Path(folder_name).joinpath(filename)
+    with file_path.open('r', encoding='utf-8') as file:
+        json_data = json.load(file)
+    write_json_file(folder_name, filename, json_data)
 
 def write_json_file(folder_name: str, filename: str, json_data: dict) -> None:
     """
@@ -93,7 +154,7 @@ def main():
     """
     json_url = 'https://raw.githubusercontent.com/sharmadhiraj/free-json-datasets/refs/heads/master/datasets/premier-league-points-table.json'
     logger.info("Starting JSON fetch demonstration...")
-    fetch_json_file(fetched_folder_name, "premier_league_table.json", json_url)
+    fetch_json_file(fetched_folder_name, "premier_league_table.json", json_url, use_cache=True)
 
 #####################################
 # Conditional Execution
@@ -18,6 +18,8 @@ import requests
 
 # Import from local project modules
 from utils_logger import logger
+from utils_fetch import DEFAULT_CHUNK_SIZE, download_to_file, get_session
+from utils_compress import get_compressed_path
 
 #####################################
 # Declare Global Variables
@@ -29,7 +31,7 @@ fetched_folder_name = "data"
 # Define Functions
 #####################################
 
-def fetch_txt_file(folder_name: str, filename: str, url: str) -> None:
+def fetch_txt_file(folder_name: str, filename: str, url: str, stream: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE, use_cache: bool = False, compression: str = None) -> bool:
     """
     Fetch text data from the given URL and write it to a file.
 
@@ -37,27 +39,46 @@ def fetch_txt_file(folder_name: str, filename: str, url: str) -> None:
         folder_name (str): Name of the folder to save the file.
         filename (str): Name of the output file.
         url (str): URL of the text file to fetch.
+        stream (bool): If True, stream the response to disk in chunks
+            instead of holding the whole body in memory.
+        chunk_size (int): Number of bytes per chunk when streaming.
+        use_cache (bool): If True, skip the download when the server reports
+            the previously fetched file as not modified (implies streaming).
+        compression (str): None, "gzip" or "zstd". If set, keep the file compressed
+            on disk as filename + ".gz" / ".zst" (implies streaming).
 
     Returns:
-        None
+        bool: True if the file was fetched (or is already up to date), False otherwise.
 
     Example:
         fetch_txt_file("data", "romeo.txt", "https://example.com/romeo.txt")
     """
     if not url:
         logger.error("The URL provided is empty. Please provide a valid URL.")
-        return
+        return False
 
     try:
         logger.info(f"Fetching text data from {url}...")
-        response = requests.get(url)
-        response.raise_for_status()
-        write_txt_file(folder_name, filename, response.text)
+        if stream or use_cache or compression:
+            file_path = get_compressed_path(pathlib.Path(folder_name).joinpath(filename), compression)
+            if download_to_file(url, file_path, chunk_size, use_cache, compression=compression) is None:
+                logger.info(f"SUCCESS: {filename} is already up to date")
+                return True
+        else:
+            response = get_session().get(url)
+            response.raise_for_status()
+            write_txt_file(folder_name, filename, response.text)
         logger.info(f"SUCCESS: Text file fetched and saved as {filename}")
+        return True
     except requests.exceptions.HTTPError as http_err:
         logger.error(f"HTTP error occurred: {http_err}")
+        return False
     except requests.exceptions.RequestException as req_err:
         logger.error(f"Request error occurred: {req_err}")
+        return False
+    except IOError as io_err:
+        logger.error(f"Error writing text data to {filename}: {io_err}")
+        return False
 
 def write_txt_file(folder_name: str, filename: str, string_data: str) -> None:
     """
@@ -91,7 +112,7 @@ def main():
     """
     txt_url = 'https://www.gutenberg.org/files/2701/2701-0.txt'
     logger.info("Starting text fetch demonstration...")
-    fetch_txt_file(fetched_folder_name, "moby_dick.txt", txt_url)
+    fetch_txt_file(fetched_folder_name, "moby_dick.txt", txt_url, stream=True, use_cache=True)
 
 #####################################
 # Conditional Execution
@@ -8,10 +8,24 @@ Process a CSV file on COVID-19 data to calculate total cases and total cases per
 
 import pathlib
 import csv
-from collections import defaultdict
+import hashlib
+import io
+import json
+import operator
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+# Import from external packages (optional)
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 # Import from local project modules
 from utils_logger import logger  # Make sure this file exists in the same directory
+from utils_compress import find_data_file, get_compression, open_text
+from utils_column_cache import load_columns, parse_column_values, read_column_cache_meta, save_columns
+from utils_hash import get_source_stamp, write_json_atomically
 
 #####################################
 # Declare Global Variables
@@ -20,56 +34,903 @@ from utils_logger import logger  # Make sure this file exists in the same direct
 fetched_folder_name: str = "data"
 processed_folder_name: str = "data_processed"
 
+# The only columns analyze_covid_data needs
+group_column: str = "continent"
+sum_columns: tuple = ("total_cases", "total_cases_per_million")
+
+# Engines accepted by analyze_covid_data
+csv_engines: tuple = ("dictreader", "columnar", "numpy")
+
+# Approximate number of characters read per batch by the column-projected reader
+projection_batch_bytes: int = 4 * 1024 * 1024
+
+# Default byte range handed to each worker when analyze_covid_data runs in parallel
+csv_chunk_bytes: int = 64 * 1024 * 1024
+
+# Checkpoint of the continent totals kept by process_csv_file between runs
+checkpoint_file_name: str = "covid_cases_by_continent.checkpoint.json"
+
+# Number of bytes read at a time when scanning raw bytes (chunk split points, checkpoint hash)
+raw_scan_block_bytes: int = 1024 * 1024
+
+# Number of skipped rows quoted in the bad row summary
+bad_row_sample_limit: int = 5
+
+# Metrics accepted by aggregate_covid_data
+covid_aggregations: tuple = ("sum", "min", "max", "mean", "count")
+
+#####################################
+# Define Classes
+#####################################
+
+class BadRowTally:
+    """
+    Count skipped rows by error and column instead of logging each one.
+
+    Only the first few rows are kept as samples for the summary. If
+    keep_rejects is set, every skipped row is also kept so it can be
+    written to a rejects file in one go at the end. columns names the
+    fields recorded for each row (the group and sum columns by default).
+    """
+
+    def __init__(self, max_samples: int = None, keep_rejects: bool = False, columns: tuple = None):
+        self.columns = (group_column,) + sum_columns if columns is None else columns
+        self.counts = Counter()
+        self.samples = []
+        self.max_samples = bad_row_sample_limit if max_samples is None else max_samples
+        self.rejects = [] if keep_rejects else None
+
+    def add(self, error: str, column: str, values: tuple) -> None:
+        """Record one skipped row (values are its fields for self.columns)."""
+        self.counts[(error, column)] += 1
+        if len(self.samples) < self.max_samples:
+            self.samples.append((error, column, values))
+        if self.rejects is not None:
+            self.rejects.append((error, column or "", *values))
+
+    def update(self, other: "BadRowTally") -> None:
+        """Add the rows recorded by another tally, which come after this one's."""
+        self.counts.update(other.counts)
+        self.samples.extend(other.samples[:self.max_samples - len(self.samples)])
+        if self.rejects is not None and other.rejects is not None:
+            self.rejects.extend(other.rejects)
+
+    def total(self) -> int:
+        """Return the number of skipped rows."""
+        return sum(self.counts.values())
+
+    def log_summary(self, source) -> None:
+        """Log one warning summarizing the skipped rows, if there were any."""
+        if not self.counts:
+            return
+        by_error = ", ".join(
+            f"{error} in {column}: {count:,}" if column else f"{error}: {count:,}"
+            for (error, column), count in self.counts.most_common()
+        )
+        samples = "; ".join(f"{values} ({error})" for error, _, values in self.samples)
+        logger.warning(f"Skipped {self.total():,} invalid rows in {source} ({by_error}). First rows: {samples}")
+
+    def write_rejects(self, rejects_path: pathlib.Path) -> None:
+        """Write the kept rejects to a CSV file with a single writerows call."""
+        rejects_path = pathlib.Path(rejects_path)
+        try:
+            rejects_path.parent.mkdir(parents=True, exist_ok=True)
+            with rejects_path.open('w', encoding='utf-8', newline='') as file:
+                writer = csv.writer(file)
+                writer.writerow(("error", "column") + self.columns)
+                writer.writerows(self.rejects or [])
+            logger.info(f"Wrote {len(self.rejects or []):,} rejected rows to {rejects_path}")
+        except IOError as io_err:
+            logger.error(f"Error writing rejects file {rejects_path}: {io_err}")
+
 #####################################
 # Define Functions
 #####################################
 
-def analyze_covid_data(file_path: pathlib.Path) -> dict:
+def iter_projected_batches(file, columns: tuple, batch_bytes: int = projection_batch_bytes, header: list = None):
+    """
+    Yield lists of rows holding only the requested columns, in the order asked for.
+
+    The header is used to find each column's index. It is read from the
+    first line of the file unless it is passed in. Lines are read in
+    batches of about batch_bytes and split only up to the last needed
+    column, so the remaining columns are never parsed. Batches with quoted
+    fields (including line breaks inside quotes) go through the csv module.
+
+    Args:
+        file: Open text file positioned at the header line.
+        columns (tuple): Names of the columns to keep.
+        batch_bytes (int): Approximate number of characters read per batch.
+        header (list): Column names, for a file positioned past its header line.
+
+    Yields:
+        list: One tuple of field values (strings) per row. Fields missing
+            from a short row are empty strings, as with csv.DictReader.
+
+    Raises:
+        ValueError: If a column is missing from the header.
+    """
+    if header is None:
+        header = next(csv.reader([file.readline()]))
+    indexes = [header.index(column) for column in columns]
+    pick = operator.itemgetter(*indexes) if len(indexes) > 1 else lambda fields: (fields[indexes[0]],)
+    max_split = max(indexes) + 1
+
+    while True:
+        lines = file.readlines(batch_bytes)
+        if not lines:
+            break
+        if '"' not in "".join(lines):
+            split_lines = [line.rstrip("\r\n").split(",", max_split) for line in lines]
+            if min(map(len, split_lines)) >= max_split:
+                yield list(map(pick, split_lines))
+                continue
+
+        # Slow path: quoted fields, blank lines or short rows
+        rows = []
+        lines = iter(lines)
+        for line in lines:
+            if '"' in line:
+                while line.count('"') % 2:  # A quoted field continues on the next line
+                    next_line = next(lines, None) or file.readline()
+                    if not next_line:
+                        break
+                    line += next_line
+                fields = next(csv.reader([line]))
+            else:
+                fields = line.rstrip("\r\n").split(",", max_split)
+            if len(fields) >= max_split:
+                rows.append(pick(fields))
+            elif fields != [""]:  # Blank lines are skipped silently
+                rows.append(pick(fields + [""] * (max_split - len(fields))))
+        yield rows
+
+
+def find_bad_column(values: tuple, columns: tuple = sum_columns) -> str:
+    """Return the first of columns whose value in values is not a number, or None."""
+    for column, value in zip(columns, values):
+        try:
+            float(value) if value else 0
+        except (TypeError, ValueError):
+            return column
+    return None
+
+
+def sum_by_continent_dictreader(file, header: list = None, bad_rows: BadRowTally = None) -> tuple:
+    """Sum cases by continent with csv.DictReader (one dict per row)."""
+    continent_cases = defaultdict(float)
+    continent_cases_per_million = defaultdict(float)
+    bad_rows = BadRowTally() if bad_rows is None else bad_rows
+
+    dict_reader = csv.DictReader(file, fieldnames=header, restval="")
+    for row in dict_reader:
+        try:
+            continent = row["continent"].strip()
+            if not continent:
+                continue
+
+            total_cases = float(row["total_cases"]) if row["total_cases"] else 0
+            cases_per_million = float(row["total_cases_per_million"]) if row["total_cases_per_million"] else 0
+
+            continent_cases[continent] += total_cases
+            continent_cases_per_million[continent] += cases_per_million
+
+        except ValueError as e:
+            values = tuple(row.get(column) for column in (group_column,) + sum_columns)
+            bad_rows.add(type(e).__name__, find_bad_column(values[1:]), values)
+
+    return continent_cases, continent_cases_per_million
+
+
+def sum_by_continent_columnar(file, header: list = None, bad_rows: BadRowTally = None) -> tuple:
+    """Sum cases by continent reading only the three needed columns of each row."""
+    continent_cases = defaultdict(float)
+    continent_cases_per_million = defaultdict(float)
+    bad_rows = BadRowTally() if bad_rows is None else bad_rows
+
+    for rows in iter_projected_batches(file, (group_column,) + sum_columns, header=header):
+        for fields in rows:
+            continent, total_cases, cases_per_million = fields
+            try:
+                continent = continent.strip()
+                if not continent:
+                    continue
+
+                total_cases = float(total_cases) if total_cases else 0
+                cases_per_million = float(cases_per_million) if cases_per_million else 0
+
+                continent_cases[continent] += total_cases
+                continent_cases_per_million[continent] += cases_per_million
+
+            except ValueError as e:
+                bad_rows.add(type(e).__name__, find_bad_column(fields[1:]), fields)
+
+    return continent_cases, continent_cases_per_million
+
+
+def parse_float_batch(values: tuple):
     """
-    Analyze the COVID-19 dataset.
+    Convert a batch of numeric strings to a float64 array ('' counts as 0).
+
+    Returns:
+        numpy.ndarray: The parsed values, or None if any value is not a number.
     """
     try:
-        continent_cases = defaultdict(float)
-        continent_cases_per_million = defaultdict(float)
+        return numpy.array([value or "0" for value in values], dtype=numpy.float64)
+    except ValueError:
+        return None
 
-        with file_path.open('r', encoding='utf-8') as file:
-            dict_reader = csv.DictReader(file)
-            for row in dict_reader:
-                try:
-                    continent = row["continent"].strip()
-                    if not continent:
-                        continue
 
-                    total_cases = float(row["total_cases"]) if row["total_cases"] else 0
-                    cases_per_million = float(row["total_cases_per_million"]) if row["total_cases_per_million"] else 0
+def sum_by_continent_numpy(file, header: list = None, bad_rows: BadRowTally = None) -> tuple:
+    """
+    Sum cases by continent with a NumPy group-by.
+
+    Rows are read column-projected in batches. Each batch's continents are
+    turned into integer codes, its numbers are parsed in one call per column,
+    and the sums per continent come from numpy.bincount. A batch containing an
+    invalid number is parsed row by row instead so only the bad rows are skipped.
+    """
+    continent_codes = {}
+    bad_rows = BadRowTally() if bad_rows is None else bad_rows
+    sums = {column: numpy.zeros(0) for column in sum_columns + ("rows",)}
+
+    def code_of(continent: str) -> int:
+        """Return the code of a raw continent value (-1 if blank), assigning new codes in file order."""
+        name = continent.strip()
+        code = continent_codes.setdefault(name, len(continent_codes)) if name else -1
+        raw_codes[continent] = code
+        return code
+
+    raw_codes = {}
 
-                    continent_cases[continent] += total_cases
-                    continent_cases_per_million[continent] += cases_per_million
+    def add_batch(rows: list) -> None:
+        continents, *columns = zip(*rows)
+        codes = numpy.fromiter(
+            (raw_codes[continent] if continent in raw_codes else code_of(continent) for continent in continents),
+            dtype=numpy.int64,
+            count=len(rows),
+        )
 
+        parsed = {column: parse_float_batch(values) for column, values in zip(sum_columns, columns)}
+        keep = codes >= 0  # Rows without a continent are skipped
+        if any(values is None for values in parsed.values()):
+            parsed = {column: numpy.zeros(len(rows)) for column in sum_columns}
+            for row in numpy.flatnonzero(keep):
+                try:
+                    for column, values in zip(sum_columns, columns):
+                        parsed[column][row] = float(values[row]) if values[row] else 0
                 except ValueError as e:
-                    logger.warning(f"Skipping invalid row: {row} ({e})")
-
-        stats = {
-            continent: {
-                "total_cases": "{:,}".format(continent_cases[continent]),  # Format with commas here
-                "total_cases_per_million": "{:,.2f}".format(continent_cases_per_million[continent])  # Format with commas and 2 decimals
-            }
-            for continent in continent_cases
+                    keep[row] = False
+                    bad_rows.add(type(e).__name__, column, rows[row])
+        parsed["rows"] = numpy.ones(len(rows))
+
+        # The running totals go in first so bincount adds in file order, like the other engines
+        previous = numpy.arange(len(sums["rows"]))
+        for column, values in parsed.items():
+            sums[column] = numpy.bincount(
+                numpy.concatenate((previous, codes[keep])),
+                weights=numpy.concatenate((sums[column], values[keep])),
+                minlength=len(continent_codes),
+            )
+
+    for rows in iter_projected_batches(file, (group_column,) + sum_columns, header=header):
+        if rows:
+            add_batch(rows)
+
+    # Leave out continents whose rows were all invalid, like the other engines
+    found = [(continent, code) for continent, code in continent_codes.items() if sums["rows"][code] > 0]
+    continent_cases = {continent: float(sums["total_cases"][code]) for continent, code in found}
+    continent_cases_per_million = {continent: float(sums["total_cases_per_million"][code]) for continent, code in found}
+    return continent_cases, continent_cases_per_million
+
+
+# Sum function used by each engine; each takes an open text file positioned at the
+# header line, or past it when the column names are passed as header
+sum_functions_by_engine: dict = {
+    "dictreader": sum_by_continent_dictreader,
+    "columnar": sum_by_continent_columnar,
+    "numpy": sum_by_continent_numpy,
+}
+
+
+def find_chunk_ranges(file_path: pathlib.Path, chunk_size: int) -> tuple:
+    """
+    Split a plain CSV file into byte ranges of about chunk_size that start and end on a row break.
+
+    A chunk is only cut at a newline with an even number of quote characters
+    before it, so a quoted field containing a line break is never split
+    (escaped quotes come in pairs and do not change the count's parity).
+    Counting the quotes reads the whole file once, which is much cheaper
+    than parsing it.
+
+    Args:
+        file_path (pathlib.Path): Path to an uncompressed CSV file.
+        chunk_size (int): Approximate number of bytes per chunk.
+
+    Returns:
+        tuple: (header line as bytes, list of (start, end) byte offsets of the data rows)
+    """
+    with pathlib.Path(file_path).open('rb') as file:
+        header = file.readline()
+        start = file.tell()
+        file_size = file.seek(0, io.SEEK_END)
+        file.seek(start)
+        ranges = []
+        quotes = 0  # Quote characters seen in the data rows so far
+        while start < file_size:
+            remaining = min(start + chunk_size, file_size) - file.tell()
+            while remaining > 0:
+                block = file.read(min(remaining, raw_scan_block_bytes))
+                if not block:
+                    break
+                quotes += block.count(b'"')
+                remaining -= len(block)
+            while True:  # Move on to the end of the row the cut fell in
+                line = file.readline()
+                quotes += line.count(b'"')
+                if not line or quotes % 2 == 0:
+                    break
+            end = file.tell()
+            ranges.append((start, end))
+            start = end
+    return header, ranges
+
+
+def sum_chunk(file_path: pathlib.Path, header: bytes, start: int, end: int, engine: str, keep_rejects: bool) -> tuple:
+    """
+    Sum one byte range of the CSV file with the given engine (runs in a worker process).
+
+    Args:
+        file_path (pathlib.Path): Path to the uncompressed CSV file.
+        header (bytes): The file's header line.
+        start (int): Offset of the first byte of the chunk.
+        end (int): Offset just past the last byte of the chunk.
+        engine (str): Name of the engine summing the chunk.
+        keep_rejects (bool): Whether to keep every skipped row for a rejects file.
+
+    Returns:
+        tuple: (cases by continent, cases per million by continent, BadRowTally) for the chunk.
+    """
+    with pathlib.Path(file_path).open('rb') as file:
+        file.seek(start)
+        data = file.read(end - start)
+    chunk = io.StringIO((header + data).decode('utf-8'), newline=None)
+    bad_rows = BadRowTally(keep_rejects=keep_rejects)
+    continent_cases, continent_cases_per_million = sum_functions_by_engine[engine](chunk, bad_rows=bad_rows)
+    return dict(continent_cases), dict(continent_cases_per_million), bad_rows
+
+
+def sum_by_continent_parallel(
+    file_path: pathlib.Path,
+    engine: str,
+    workers: int,
+    chunk_size: int,
+    bad_rows: BadRowTally,
+) -> tuple:
+    """
+    Sum cases by continent with the file split into chunks summed in a process pool.
+
+    The partial sums and bad row tallies are merged in chunk order, so
+    continents and samples come out in file order, as with a single pass.
+
+    Returns:
+        tuple: (cases by continent, cases per million by continent)
+    """
+    header, ranges = find_chunk_ranges(file_path, chunk_size)
+    logger.info(f"Summing {file_path} in {len(ranges)} chunks with {workers} workers")
+
+    with ProcessPoolExecutor(max_workers=min(workers, max(len(ranges), 1))) as executor:
+        futures = [
+            executor.submit(sum_chunk, file_path, header, start, end, engine, bad_rows.rejects is not None)
+            for start, end in ranges
+        ]
+        partial_sums = [future.result() for future in futures]
+
+    continent_cases = defaultdict(float)
+    continent_cases_per_million = defaultdict(float)
+    for chunk_cases, chunk_cases_per_million, chunk_bad_rows in partial_sums:
+        bad_rows.update(chunk_bad_rows)
+        for continent, total_cases in chunk_cases.items():
+            continent_cases[continent] += total_cases
+        for continent, cases_per_million in chunk_cases_per_million.items():
+            continent_cases_per_million[continent] += cases_per_million
+    return continent_cases, continent_cases_per_million
+
+
+def resolve_engine(engine: str) -> str:
+    """
+    Check an engine name, swapping "numpy" for "columnar" if NumPy is not installed.
+
+    Raises:
+        ValueError: If the engine is unknown.
+    """
+    if engine not in csv_engines:
+        raise ValueError(f"Unknown engine '{engine}'; expected one of {csv_engines}")
+    if engine == "numpy" and numpy is None:
+        logger.warning("NumPy is not installed; using the columnar engine instead.")
+        return "columnar"
+    return engine
+
+
+def report_bad_rows(bad_rows: BadRowTally, source, rejects_path: pathlib.Path = None) -> None:
+    """Log the bad row summary and write the rejects file, if one was asked for."""
+    bad_rows.log_summary(source)
+    if rejects_path is not None:
+        bad_rows.write_rejects(rejects_path)
+
+
+def format_covid_stats(continent_cases: dict, continent_cases_per_million: dict) -> dict:
+    """Format the continent totals for the report."""
+    stats = {
+        continent: {
+            "total_cases": "{:,}".format(continent_cases[continent]),  # Format with commas here
+            "total_cases_per_million": "{:,.2f}".format(continent_cases_per_million[continent])  # Format with commas and 2 decimals
         }
-        return stats
+        for continent in continent_cases
+    }
+    return stats
+
+
+def analyze_covid_data(
+    file_path: pathlib.Path,
+    engine: str = "columnar",
+    workers: int = 1,
+    chunk_size: int = csv_chunk_bytes,
+    rejects_path: pathlib.Path = None,
+    use_column_cache: bool = False,
+) -> dict:
+    """
+    Analyze the COVID-19 dataset (a plain, .gz or .zst CSV file).
+
+    engine picks how the file is read: "dictreader" (a dict per row),
+    "columnar" (only the needed columns, the default) or "numpy"
+    (columnar with a vectorized group-by sum; falls back to "columnar"
+    if NumPy is not installed). All engines return the same stats.
+
+    With workers above 1, a plain CSV file is split into row-aligned
+    chunks of about chunk_size bytes that are summed in a process pool.
+    Compressed files cannot be split and are read in a single pass.
+    Integer counts match the single-pass totals exactly; sums of
+    fractional values can differ from them in the last bits only,
+    which the formatted stats do not show.
+
+    Rows that cannot be parsed are skipped and counted by error and
+    column; one warning sums them up at the end. If rejects_path is
+    given, the skipped rows are also written there as CSV.
+
+    With use_column_cache, the columns are read from the typed column
+    cache instead (see get_cached_columns; needs NumPy), and engine and
+    workers only matter if the cache cannot be used.
+    """
+    bad_rows = BadRowTally(keep_rejects=rejects_path is not None)
+    try:
+        if use_column_cache:
+            groups = scan_groups_cached(file_path, (group_column,), sum_columns, bad_rows)
+            if groups is not None:
+                report_bad_rows(bad_rows, file_path, rejects_path)
+                continent_cases = {key[0]: accumulators[0][1] for key, accumulators in groups.items()}
+                continent_cases_per_million = {key[0]: accumulators[1][1] for key, accumulators in groups.items()}
+                return format_covid_stats(continent_cases, continent_cases_per_million)
+            logger.info("The column cache cannot be used; parsing the CSV text instead.")
+
+        engine = resolve_engine(engine)
+        if workers > 1 and get_compression(pathlib.Path(file_path)):
+            logger.info(f"{file_path} is compressed and cannot be split; reading it with one worker.")
+            workers = 1
+
+        if workers > 1:
+            continent_cases, continent_cases_per_million = sum_by_continent_parallel(
+                file_path, engine, workers, chunk_size, bad_rows
+            )
+        else:
+            with open_text(file_path) as file:
+                continent_cases, continent_cases_per_million = sum_functions_by_engine[engine](file, bad_rows=bad_rows)
+
+        report_bad_rows(bad_rows, file_path, rejects_path)
+        return format_covid_stats(continent_cases, continent_cases_per_million)
+
+    except Exception as e:
+        logger.error(f"Error processing CSV file: {e}")
+        return {}
+
+
+def hash_file_range(digest, file, start: int, end: int) -> None:
+    """
+    Feed the bytes from start to end of a binary file to a hashlib digest.
+
+    Hashing is far cheaper than parsing, so the whole checkpointed part of
+    the file is hashed on every run and any change in it is noticed.
+
+    Args:
+        digest: hashlib object to update.
+        file: Binary file object.
+        start (int): First byte to hash.
+        end (int): Byte after the last one to hash.
+    """
+    file.seek(start)
+    remaining = end - start
+    while remaining > 0:
+        chunk = file.read(min(remaining, raw_scan_block_bytes))
+        if not chunk:
+            break
+        digest.update(chunk)
+        remaining -= len(chunk)
+
+
+def read_checkpoint(checkpoint_path: pathlib.Path) -> dict:
+    """
+    Read a continent totals checkpoint.
+
+    Returns:
+        dict: The checkpoint, or an empty dict if there is none or it is unreadable.
+    """
+    try:
+        with pathlib.Path(checkpoint_path).open('r', encoding='utf-8') as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return {}
+    except (IOError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable checkpoint {checkpoint_path}: {e}")
+        return {}
+
+
+def write_checkpoint(checkpoint_path: pathlib.Path, checkpoint: dict) -> None:
+    """
+    Write a continent totals checkpoint, replacing the old one in a single rename.
+    """
+    checkpoint_path = pathlib.Path(checkpoint_path)
+    try:
+        checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        write_json_atomically(checkpoint_path, checkpoint, indent=4)
+    except IOError as io_err:
+        logger.warning(f"Could not write checkpoint {checkpoint_path}: {io_err}")
+
+
+def update_covid_totals(
+    file_path: pathlib.Path,
+    checkpoint_path: pathlib.Path,
+    engine: str = "columnar",
+    bad_rows: BadRowTally = None,
+) -> tuple:
+    """
+    Sum cases by continent, reading only the rows added since the last checkpoint.
+
+    The checkpoint stores the totals, the byte offset they cover and the
+    SHA-256 of every byte before that offset (header included). If the file
+    only grew, the rows past the offset are summed and added to the stored
+    totals. If the source or any byte before the offset changed (or the last
+    checkpointed row had no line break yet), the whole file is read again.
+
+    Args:
+        file_path (pathlib.Path): Path to an uncompressed CSV file.
+        checkpoint_path (pathlib.Path): Path of the checkpoint file.
+        engine (str): Engine summing the new rows.
+        bad_rows (BadRowTally): Tally of the new rows that were skipped.
+
+    Returns:
+        tuple: (cases by continent, cases per million by continent)
+    """
+    file_path = pathlib.Path(file_path)
+    checkpoint = read_checkpoint(checkpoint_path)
+    continent_cases = defaultdict(float)
+    continent_cases_per_million = defaultdict(float)
+
+    with file_path.open('rb') as binary_file:
+        header = binary_file.readline()
+        header_end = binary_file.tell()
+        file_size = binary_file.seek(0, io.SEEK_END)
+
+        offset = checkpoint.get("offset", 0)
+        digest = hashlib.sha256()
+        can_resume = checkpoint.get("source") == str(file_path) and header_end <= offset <= file_size
+        if can_resume:
+            hash_file_range(digest, binary_file, 0, offset)
+            can_resume = checkpoint.get("fingerprint") == digest.hexdigest()
+        if can_resume and offset > header_end:
+            binary_file.seek(offset - 1)
+            can_resume = binary_file.read(1) == b"\n"
+
+        if can_resume:
+            continent_cases.update(checkpoint["continent_cases"])
+            continent_cases_per_million.update(checkpoint["continent_cases_per_million"])
+            logger.info(f"Resuming {file_path} from checkpoint at byte {offset:,}; {file_size - offset:,} new bytes")
+        else:
+            if checkpoint:
+                logger.info(f"Checkpoint does not match {file_path}; reading the whole file")
+            offset = header_end
+            digest = hashlib.sha256()
+            hash_file_range(digest, binary_file, 0, offset)
+
+        if offset < file_size:
+            binary_file.seek(offset)
+            new_rows = io.TextIOWrapper(binary_file, encoding='utf-8', newline=None)
+            columns = next(csv.reader([header.decode('utf-8')]))
+            new_cases, new_cases_per_million = sum_functions_by_engine[engine](
+                new_rows, header=columns, bad_rows=bad_rows
+            )
+            new_rows.detach()  # Keep binary_file open to hash the new rows below
+            for continent, total_cases in new_cases.items():
+                continent_cases[continent] += total_cases
+            for continent, cases_per_million in new_cases_per_million.items():
+                continent_cases_per_million[continent] += cases_per_million
+
+        hash_file_range(digest, binary_file, offset, file_size)
+
+    write_checkpoint(checkpoint_path, {
+        "source": str(file_path),
+        "offset": file_size,
+        "fingerprint": digest.hexdigest(),
+        "continent_cases": continent_cases,
+        "continent_cases_per_million": continent_cases_per_million,
+    })
+    return continent_cases, continent_cases_per_million
+
+
+def analyze_covid_data_incremental(
+    file_path: pathlib.Path,
+    checkpoint_path: pathlib.Path,
+    engine: str = "columnar",
+    rejects_path: pathlib.Path = None,
+) -> dict:
+    """
+    Analyze the COVID-19 dataset, folding in only rows appended since the last run.
+
+    Returns the same stats as analyze_covid_data. Compressed files cannot be
+    read from an offset, so they are always analyzed in full. The bad row
+    summary and rejects file cover the rows read in this run.
+    """
+    if get_compression(pathlib.Path(file_path)):
+        logger.info(f"{file_path} is compressed; analyzing it in full without a checkpoint.")
+        return analyze_covid_data(file_path, engine=engine, rejects_path=rejects_path)
+
+    bad_rows = BadRowTally(keep_rejects=rejects_path is not None)
+    try:
+        engine = resolve_engine(engine)
+
+        continent_cases, continent_cases_per_million = update_covid_totals(file_path, checkpoint_path, engine, bad_rows)
+        report_bad_rows(bad_rows, file_path, rejects_path)
+        return format_covid_stats(continent_cases, continent_cases_per_million)
 
     except Exception as e:
         logger.error(f"Error processing CSV file: {e}")
         return {}
 
+
+def scan_groups(file_path: pathlib.Path, group_by: tuple, value_columns: tuple, bad_rows: BadRowTally) -> dict:
+    """
+    Read the CSV text once and fill a [count, sum, min, max] accumulator per group and value column.
+
+    Returns:
+        dict: Group key tuple to its list of accumulators (one per value column), in file order.
+    """
+    key_count = len(group_by)
+    groups = {}
+    with open_text(file_path) as file:
+        for rows in iter_projected_batches(file, group_by + value_columns):
+            for fields in rows:
+                key = tuple(value.strip() for value in fields[:key_count])
+                if "" in key:
+                    continue
+                try:
+                    values = [float(value) if value else None for value in fields[key_count:]]
+                except ValueError as e:
+                    bad_rows.add(type(e).__name__, find_bad_column(fields[key_count:], value_columns), fields)
+                    continue
+
+                accumulators = groups.get(key)
+                if accumulators is None:
+                    accumulators = groups[key] = [[0, 0.0, None, None] for _ in value_columns]
+                for value, accumulator in zip(values, accumulators):
+                    if value is None:
+                        continue
+                    accumulator[0] += 1
+                    accumulator[1] += value
+                    if accumulator[2] is None or value < accumulator[2]:
+                        accumulator[2] = value
+                    if accumulator[3] is None or value > accumulator[3]:
+                        accumulator[3] = value
+    return groups
+
+
+def get_cached_columns(file_path: pathlib.Path, columns: dict) -> dict:
+    """
+    Return typed columns of the CSV file from its column cache, filling the cache first if needed.
+
+    Columns that are not cached yet (or were cached from an older version
+    of the file) are parsed from the text in one pass and saved next to
+    the file (see utils_column_cache), so later calls only memory-map them.
+
+    Args:
+        file_path (pathlib.Path): Path to a plain, .gz or .zst CSV file.
+        columns (dict): Column name to kind, "number" or "text".
+
+    Returns:
+        dict: Column name to its cached arrays, or None if the cache could not be used.
+    """
+    cached = read_column_cache_meta(file_path).get("columns", {})
+    missing = {column: kind for column, kind in columns.items() if cached.get(column, {}).get("kind") != kind}
+    if missing:
+        logger.info(f"Parsing {len(missing)} columns of {file_path} into the column cache")
+        stamp = get_source_stamp(file_path)
+        values = {column: [] for column in missing}
+        with open_text(file_path) as file:
+            for rows in iter_projected_batches(file, tuple(missing)):
+                for column, column_values in zip(missing, zip(*rows)):
+                    values[column].extend(column_values)
+        row_count = len(values[next(iter(missing))])
+        save_columns(
+            file_path,
+            {column: parse_column_values(values[column], kind) for column, kind in missing.items()},
+            row_count,
+            stamp,
+        )
+    return load_columns(file_path, columns)
+
+
+def scan_groups_cached(file_path: pathlib.Path, group_by: tuple, value_columns: tuple, bad_rows: BadRowTally) -> dict:
+    """
+    Fill the same accumulators as scan_groups from the typed column cache, with NumPy.
+
+    Rows are skipped and tallied exactly as scan_groups does (the tallied
+    numbers are shown as parsed floats rather than their original text).
+    Sums are added in file order with numpy.bincount, so they match the
+    text path to the last bit.
+
+    Returns:
+        dict: Group key tuple to its list of accumulators, in file order,
+            or None if NumPy is missing or the cache could not be used.
+    """
+    if numpy is None or set(group_by) & set(value_columns):
+        return None
+    columns = get_cached_columns(
+        file_path, {**{column: "text" for column in group_by}, **{column: "number" for column in value_columns}}
+    )
+    if columns is None:
+        return None
+
+    # Encode the (stripped) group keys as one integer per row, -1 when a key is blank
+    names_by_column = []
+    keys = None
+    for column in group_by:
+        name_codes = {}
+        label_codes = numpy.array(
+            [name_codes.setdefault(label.strip(), len(name_codes)) if label.strip() else -1 for label in columns[column]["labels"]],
+            dtype=numpy.int64,
+        )
+        codes = label_codes[numpy.asarray(columns[column]["codes"])] if len(label_codes) else numpy.zeros(0, dtype=numpy.int64)
+        keys = codes if keys is None else numpy.where((keys >= 0) & (codes >= 0), keys * len(name_codes) + codes, -1)
+        names_by_column.append(list(name_codes))
+    keep = keys >= 0
+
+    # Skip rows with a value that is not a number, tallying the first bad column of each
+    bad_column_of, raw_values = {}, {}
+    for column in value_columns:
+        invalid = columns[column]
+        raw_values[column] = dict(zip(invalid["invalid_rows"].tolist(), invalid["invalid_values"]))
+        for row in invalid["invalid_rows"].tolist():
+            bad_column_of.setdefault(row, column)
+    for row in sorted(bad_column_of):
+        if not keep[row]:
+            continue  # Blank keys are skipped before the numbers are parsed
+        keep[row] = False
+        fields = tuple(columns[column]["labels"][columns[column]["codes"][row]] for column in group_by) + tuple(
+            raw_values[column].get(row, "" if numpy.isnan(columns[column]["values"][row]) else repr(float(columns[column]["values"][row])))
+            for column in value_columns
+        )
+        bad_rows.add("ValueError", bad_column_of[row], fields)
+
+    # Number the groups in order of their first kept row
+    unique_keys, first_rows, inverse = numpy.unique(keys[keep], return_index=True, return_inverse=True)
+    order = numpy.argsort(first_rows)
+    rank = numpy.empty(len(order), dtype=numpy.int64)
+    rank[order] = numpy.arange(len(order))
+    group_of_row = rank[inverse.reshape(-1)]
+    group_count = len(order)
+
+    accumulators_by_column = []
+    for column in value_columns:
+        values = numpy.asarray(columns[column]["values"])[keep]
+        present = ~numpy.isnan(values)
+        counts = numpy.bincount(group_of_row[present], minlength=group_count)
+        sums = numpy.bincount(group_of_row, weights=numpy.nan_to_num(values, nan=0.0), minlength=group_count)
+        minimums = numpy.full(group_count, numpy.inf)
+        maximums = numpy.full(group_count, -numpy.inf)
+        numpy.minimum.at(minimums, group_of_row[present], values[present])
+        numpy.maximum.at(maximums, group_of_row[present], values[present])
+        accumulators_by_column.append(zip(counts.tolist(), sums.tolist(), minimums.tolist(), maximums.tolist()))
+
+    groups = {}
+    for key_code, accumulators in zip(unique_keys[order].tolist(), zip(*accumulators_by_column)):
+        key = []
+        for names in reversed(names_by_column):
+            key_code, name_code = divmod(key_code, len(names))
+            key.append(names[name_code])
+        groups[tuple(reversed(key))] = [
+            [count, total, minimum if count else None, maximum if count else None]
+            for count, total, minimum, maximum in accumulators
+        ]
+    return groups
+
+
+def get_metric_name(aggregation: str, column: str) -> str:
+    """Return the result key of a metric, e.g. ("max", "total_cases") -> "max_total_cases"."""
+    return f"{aggregation}_{column}"
+
+
+def aggregate_covid_data(
+    file_path: pathlib.Path,
+    group_by: tuple = (group_column,),
+    metrics: tuple = (("sum", "total_cases"), ("sum", "total_cases_per_million")),
+    rejects_path: pathlib.Path = None,
+    use_column_cache: bool = False,
+) -> dict:
+    """
+    Compute any number of metrics per group in a single pass over the COVID-19 dataset.
+
+    Each metric is an (aggregation, column) pair where aggregation is one of
+    covid_aggregations. Every group keeps one small [count, sum, min, max]
+    accumulator per column, so all metrics on a column share one parse of
+    its value. Empty values are left out of count, min, max and mean (and
+    add nothing to sum). Rows with an empty group key are skipped, as are
+    rows with a value that is not a number (see BadRowTally).
+
+    Args:
+        file_path (pathlib.Path): Path to a plain, .gz or .zst CSV file.
+        group_by (tuple): Column names to group by, e.g. ("continent",) or ("iso_code",).
+        metrics (tuple): (aggregation, column) pairs, e.g. (("max", "total_cases"), ("mean", "total_deaths")).
+        rejects_path (pathlib.Path): Optional CSV file for the skipped rows.
+        use_column_cache (bool): Read the columns from the typed column cache
+            (see get_cached_columns) instead of parsing the text. Needs NumPy.
+
+    Returns:
+        dict: Group key (the value itself for one group column, else a tuple)
+            to a dict of metric name (see get_metric_name) to value, in file
+            order. A metric is None for a group with no values in its column.
+
+    Raises:
+        ValueError: If an aggregation is unknown or a column is missing from the header.
+    """
+    group_by = tuple(group_by)
+    for aggregation, _ in metrics:
+        if aggregation not in covid_aggregations:
+            raise ValueError(f"Unknown aggregation '{aggregation}'; expected one of {covid_aggregations}")
+    value_columns = tuple(dict.fromkeys(column for _, column in metrics))  # Each column parsed once
+    key_count = len(group_by)
+    bad_rows = BadRowTally(keep_rejects=rejects_path is not None, columns=group_by + value_columns)
+
+    groups = None
+    if use_column_cache:
+        groups = scan_groups_cached(file_path, group_by, value_columns, bad_rows)
+    if groups is None:
+        groups = scan_groups(file_path, group_by, value_columns, bad_rows)
+    report_bad_rows(bad_rows, file_path, rejects_path)
+
+    column_index = {column: index for index, column in enumerate(value_columns)}
+    results = {}
+    for key, accumulators in groups.items():
+        group_result = {}
+        for aggregation, column in metrics:
+            count, total, minimum, maximum = accumulators[column_index[column]]
+            group_result[get_metric_name(aggregation, column)] = {
+                "sum": total,
+                "min": minimum,
+                "max": maximum,
+                "mean": total / count if count else None,
+                "count": count,
+            }[aggregation]
+        results[key[0] if key_count == 1 else key] = group_result
+    return results
+
+
 def process_csv_file():
     """
     Read, analyze, and save the results.
     """
-    input_file = pathlib.Path(fetched_folder_name, "covid_19_data.csv")
+    input_file = find_data_file(pathlib.Path(fetched_folder_name, "covid_19_data.csv"))
     output_file = pathlib.Path(processed_folder_name, "covid_cases_by_continent.txt")
+    checkpoint_file = pathlib.Path(processed_folder_name, checkpoint_file_name)
 
-    stats = analyze_covid_data(input_file)
+    stats = analyze_covid_data_incremental(input_file, checkpoint_file)
     output_file.parent.mkdir(parents=True, exist_ok=True)
 
     with output_file.open('w', encoding='utf-8') as file:  # 'w' for overwrite, 'a' for append
@@ -89,4 +950,4 @@ def process_csv_file():
 if __name__ == "__main__":
     logger.info("Starting COVID-19 CSV processing...")
     process_csv_file()
-    logger.info("CSV processing complete.")
\ No newline at end of file
+    logger.info("CSV processing complete.")
@@ -8,9 +8,12 @@ and saves the result to a text file in data_processed.
 # Import Modules
 #####################################
 
+import heapq
 import pathlib
 import openpyxl  # Ensure we can process Excel files properly
 
+import utils_xlsx
+
 #####################################
 # Declare Global Variables
 #####################################
@@ -20,44 +23,118 @@ processed_folder_name = "data_processed"
 excel_file = "world_population.xlsx"
 output_filename = "top_3_worldpop.txt"
 
+# Header labels that mark the data region of the World Bank population sheet
+name_header = "Economy"
+population_header = "(thousands)"
+ranking_header = "Ranking"
+
+# Number of rows searched for the header row before giving up
+header_search_rows = 50
+
+# How worksheets are read: "xml" streams the sheet XML (utils_xlsx), "openpyxl" uses openpyxl read-only mode
+excel_readers = ("xml", "openpyxl")
+excel_reader = "xml"
+
 #####################################
 # Define Functions
 #####################################
 
-def get_top_3_population(file_path: pathlib.Path):
+def find_population_columns(rows) -> tuple:
     """
-    Extracts the top 3 most populated countries from the Excel file.
+    Read rows until the header row and return the indexes of the columns we need.
+
+    The header row is the first one with the name_header cell. Population
+    and ranking columns are found by their labels on the same row.
 
     Args:
-        file_path (pathlib.Path): Path to the Excel file.
+        rows: Iterator of row value tuples; it is left positioned after the header row.
 
     Returns:
-        list: List of tuples (Country Name, Population)
+        tuple: (name column, population column, ranking column) indexes.
+
+    Raises:
+        ValueError: If no header row is found in the first header_search_rows rows.
     """
-    try:
-        workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
-        sheet = workbook.active
+    for row_num, row in enumerate(rows, start=1):
+        if row and name_header in row:
+            labels = [str(value).strip() if value is not None else None for value in row]
+            try:
+                return (labels.index(name_header), labels.index(population_header), labels.index(ranking_header))
+            except ValueError:
+                raise ValueError(f"Header row {row_num} is missing '{population_header}' or '{ranking_header}'") from None
+        if row_num >= header_search_rows:
+            break
+    raise ValueError(f"No header row with '{name_header}' in the first {header_search_rows} rows")
+
+
+def iter_population_rows(rows):
+    """
+    Yield (Country Name, Population) for every ranked country after the header row.
+
+    Rows without a numeric ranking (blank rows, the World and regional
+    totals, footnotes) are skipped, so the whole sheet can be read
+    without fixed row bounds.
+
+    Args:
+        rows: Iterator of row value tuples, starting at the top of the sheet.
 
-        population_data = []  # List to store (Country, Population)
+    Yields:
+        tuple: (Country Name, Population)
+    """
+    name_col, population_col, ranking_col = find_population_columns(rows)
+    last_col = max(name_col, population_col, ranking_col)
+
+    for row in rows:
+        if row is None or len(row) <= last_col:
+            continue  # Skip empty or malformed rows
+
+        ranking = row[ranking_col]
+        if not isinstance(ranking, (int, float)) or isinstance(ranking, bool):
+            continue  # Only ranked economies, not aggregates
 
-        for row_num, row in enumerate(sheet.iter_rows(min_row=6, max_row=222, values_only=True), start=6):
-            if row is None or len(row) < 5:
-                continue  # Skip empty or malformed rows
+        country = row[name_col]
+        population = row[population_col]
 
-            country = row[3]  # Country name (Column D)
-            population = row[4]  # Population (Column E)
+        if country and population is not None:
+            try:
+                population_str = str(population).replace(",", "").strip()
+                yield (country, int(float(population_str)))  # Convert to int
+            except (ValueError, TypeError):
+                continue  # Skip invalid rows
 
-            if country and population is not None:
-                try:
-                    population_str = str(population).replace(",", "").strip()
-                    population_int = int(float(population_str))  # Convert to int
-                    population_data.append((country, population_int))
-                except (ValueError, TypeError):
-                    continue  # Skip invalid rows
 
-        # Sort by population in descending order and get the top 3
-        top_3 = sorted(population_data, key=lambda x: x[1], reverse=True)[:3]
-        return top_3
+def get_top_population(file_path: pathlib.Path, k: int = 3, reader: str = None, sheet_name: str = None):
+    """
+    Extracts the k most populated countries from the Excel file.
+
+    The sheet is streamed once and only the k largest entries are kept
+    (heapq.nlargest), so memory does not grow with the number of rows.
+    Ties keep their sheet order, as a stable sort would.
+
+    Args:
+        file_path (pathlib.Path): Path to the Excel file.
+        k (int): Number of countries to return.
+        reader (str): "xml" or "openpyxl" (see excel_readers); defaults to excel_reader.
+        sheet_name (str): Name of the sheet to read, or None for the active sheet.
+
+    Returns:
+        list: List of tuples (Country Name, Population), largest first
+    """
+    reader = reader or excel_reader
+    try:
+        if reader not in excel_readers:
+            raise ValueError(f"Unknown reader '{reader}'; expected one of {excel_readers}")
+        if reader == "xml":
+            rows = utils_xlsx.iter_sheet_rows(file_path, sheet_name=sheet_name)
+            return heapq.nlargest(k, iter_population_rows(rows), key=lambda x: x[1])
+
+        workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            sheet = workbook.active if sheet_name is None else workbook[sheet_name]
+            rows = sheet.iter_rows(values_only=True)
+            return heapq.nlargest(k, iter_population_rows(rows), key=lambda x: x[1])
+        finally:
+            workbook.close()
 
     except FileNotFoundError:
         print(f"Error: Excel file not found at {file_path}")
@@ -66,6 +143,18 @@ def get_top_3_population(file_path: pathlib.Path):
         print(f"Error processing Excel file: {e}")
         return None
 
+def get_top_3_population(file_path: pathlib.Path):
+    """
+    Extracts the top 3 most populated countries from the Excel file.
+
+    Args:
+        file_path (pathlib.Path): Path to the Excel file.
+
+    Returns:
+        list: List of tuples (Country Name, Population)
+    """
+    return get_top_population(file_path, k=3)
+
 def save_top_3_population():
     """
     Reads the Excel file, extracts the top 3 most populated countries, 
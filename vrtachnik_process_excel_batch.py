@@ -0,0 +1,156 @@
+"""
+This script runs a per-sheet Excel task over every sheet of every workbook
+matching a glob pattern, and merges the results.
+
+Each (workbook, sheet) pair is one unit of work handed to a process pool.
+Results come back in sorted workbook path order and, within a workbook,
+in sheet order, however the pool schedules them, so the merged result is
+the same from run to run and for any number of workers.
+
+Tasks:
+- top_population: the top K populations of each sheet (get_top_population),
+  merged into the overall top K.
+- word_count: occurrences of a word in a column of each sheet
+  (count_word_in_column), merged into a total.
+"""
+
+#####################################
+# Import Modules
+#####################################
+
+# Import from Python Standard Library
+import glob
+import heapq
+import os
+import pathlib
+from concurrent.futures import ProcessPoolExecutor
+
+# Import from local project modules
+from utils_logger import logger
+from utils_xlsx import list_sheet_names
+import example_process_excel
+import vrtachnik_process_excel
+
+#####################################
+# Declare Global Variables
+#####################################
+
+fetched_folder_name: str = "data"
+processed_folder_name: str = "data_processed"
+
+# Default number of worker processes
+max_batch_workers: int = os.cpu_count() or 1
+
+#####################################
+# Define Functions
+#####################################
+
+def top_population_task(file_path: pathlib.Path, sheet_name: str, k: int = 3) -> list:
+    """Return the top k (Country Name, Population) tuples of one sheet (None if it has no population table)."""
+    return vrtachnik_process_excel.get_top_population(file_path, k=k, sheet_name=sheet_name)
+
+
+def merge_top_population(results: list, k: int = 3, **options) -> list:
+    """Merge per-sheet top k lists into the overall top k (ties keep workbook and sheet order)."""
+    return heapq.nlargest(k, (entry for result in results if result for entry in result), key=lambda x: x[1])
+
+
+def word_count_task(file_path: pathlib.Path, sheet_name: str, column_letter: str = "A", word: str = "GitHub") -> int:
+    """Return the occurrences of word in a column of one sheet."""
+    return example_process_excel.count_word_in_column(file_path, column_letter, word, sheet_name=sheet_name)
+
+
+def merge_word_count(results: list, **options) -> int:
+    """Add up the per-sheet word counts."""
+    return sum(result for result in results if result)
+
+
+# Per-sheet function and merge function of each task
+sheet_tasks = {
+    "top_population": (top_population_task, merge_top_population),
+    "word_count": (word_count_task, merge_word_count),
+}
+
+
+def list_sheets(pattern: str) -> list:
+    """
+    List every (workbook, sheet) pair for the workbooks matching a glob pattern.
+
+    Returns:
+        list: (workbook path, sheet name) tuples in sorted path order, then sheet order.
+    """
+    units = []
+    for path in sorted(glob.glob(pattern, recursive=True)):
+        try:
+            units.extend((pathlib.Path(path), sheet_name) for sheet_name in list_sheet_names(path))
+        except Exception as e:
+            logger.error(f"Skipping unreadable workbook {path}: {e}")
+    return units
+
+
+def run_sheet_task(task: str, file_path: pathlib.Path, sheet_name: str, options: dict):
+    """Run one task on one sheet (in a worker process)."""
+    sheet_function, _ = sheet_tasks[task]
+    return sheet_function(file_path, sheet_name, **options)
+
+
+def process_workbooks(pattern: str, task: str, workers: int = None, **options) -> tuple:
+    """
+    Run a task over every sheet of every workbook matching pattern in a process pool.
+
+    Args:
+        pattern (str): Glob pattern of .xlsx files, e.g. "data/**/*.xlsx".
+        task (str): Name of a task in sheet_tasks.
+        workers (int): Number of worker processes (max_batch_workers by default);
+            1 runs everything in this process.
+        **options: Keyword arguments for the task (k, column_letter, word).
+
+    Returns:
+        tuple: (list of (workbook path, sheet name, result) in workbook and
+            sheet order, merged result)
+
+    Raises:
+        ValueError: If the task is unknown.
+    """
+    if task not in sheet_tasks:
+        raise ValueError(f"Unknown task '{task}'; expected one of {sorted(sheet_tasks)}")
+    workers = workers or max_batch_workers
+    units = list_sheets(pattern)
+    logger.info(f"Running {task} on {len(units)} sheets with {workers} workers")
+
+    if workers > 1 and len(units) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(units))) as executor:
+            futures = [executor.submit(run_sheet_task, task, path, sheet_name, options) for path, sheet_name in units]
+            results = [future.result() for future in futures]
+    else:
+        results = [run_sheet_task(task, path, sheet_name, options) for path, sheet_name in units]
+
+    _, merge_function = sheet_tasks[task]
+    merged = merge_function(results, **options)
+    return [(path, sheet_name, result) for (path, sheet_name), result in zip(units, results)], merged
+
+
+def save_batch_top_population(pattern: str, output_file: pathlib.Path, k: int = 3) -> None:
+    """
+    Find the top k populations over every sheet of every matching workbook and save them.
+    """
+    per_sheet, top = process_workbooks(pattern, "top_population", k=k)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    with output_file.open('w', encoding='utf-8') as file:
+        file.write(f"Top {k} Populations across {len(per_sheet)} sheets:\n")
+        file.write("=" * 50 + "\n")
+        for country, population in top:
+            file.write(f"{country}: {population:,} (thousands)\n")
+    logger.info(f"Batch top {k} populations saved to: {output_file}")
+
+#####################################
+# Main Execution
+#####################################
+
+if __name__ == "__main__":
+    logger.info("Starting batch Excel processing...")
+    save_batch_top_population(
+        str(pathlib.Path(fetched_folder_name, "*.xlsx")),
+        pathlib.Path(processed_folder_name, "batch_top_worldpop.txt"),
+    )
+    logger.info("Batch Excel processing complete.")
@@ -2,6 +2,24 @@
 This script reads a JSON file containing Premier League season tables,
 filters the performance of Manchester United in each season,
 and saves the results to a text file in the 'data_processed' folder.
+
+By default the file is streamed one season at a time (utils_json), and
+only the team's rows are kept, so memory does not grow with the number
+of seasons. json_reader = "load" switches back to json.load.
+
+get_team_index() reads the file once and keeps every team's season rows
+in a compact index next to it, so any team's history (get_team_history)
+is served without scanning the seasons again.
+
+The extractors return typed SeasonRecord objects (ints, not the strings
+stored in the file); the text report is only rendered when it is written.
+
+get_league_columns() converts the whole file once into a season x team
+table with one typed array per field, cached next to the file
+(utils_column_cache), so league-wide analytics such as points_per_season
+and best_goal_difference run as vectorized NumPy operations. These need
+the optional numpy package:
+    py -m pip install numpy
 """
 
 #####################################
@@ -10,6 +28,17 @@ and saves the results to a text file in the 'data_processed' folder.
 
 import pathlib
 import json
+import sys
+from dataclasses import dataclass
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from utils_column_cache import load_columns, parse_column_values, save_columns
+from utils_hash import get_source_stamp, read_source_meta, write_json_atomically
+from utils_json import iter_json_array
 
 #####################################
 # Declare Global Variables
@@ -21,49 +50,295 @@ json_file_name = "premier_league_table.json"  # ✅ Updated file name
 output_filename = "manchester_united_table.txt"
 team_name = "Manchester United"
 
+# How the JSON file is read: "stream" (one season at a time) or "load" (json.load)
+json_readers = ("stream", "load")
+json_reader = "stream"
+
+# Team index kept next to the JSON file, and the row fields it packs into lists
+team_index_suffix = ".teams.json"
+team_index_fields = (
+    "position", "played", "points", "goal_difference", "won", "draw", "loss", "goals_scored", "goals_against",
+)
+team_index_keys = {"team", *team_index_fields}
+
+# Team indexes already loaded in this process, by JSON file path
+loaded_team_indexes = {}
+
+# Columns of the season x team table: the season and team as text, every table field as a number
+league_columns = {"season": "text", "team": "text", **{field: "number" for field in team_index_fields}}
+
+#####################################
+# Define Classes
+#####################################
+
+@dataclass(slots=True)
+class SeasonRecord:
+    """
+    One team's final table row for one season, with int fields.
+
+    A field that is missing from the file (or not a whole number) is None
+    and is rendered as N/A.
+    """
+
+    season: str
+    team: str
+    position: int = None
+    played: int = None
+    points: int = None
+    goal_difference: int = None
+    won: int = None
+    draw: int = None
+    loss: int = None
+    goals_scored: int = None
+    goals_against: int = None
+
+    @classmethod
+    def from_row(cls, season_year, team_data: dict) -> "SeasonRecord":
+        """
+        Builds a record from a season year and a team's row of the season's table.
+        """
+        return cls(
+            sys.intern(str(season_year)),
+            sys.intern(team_data.get("team", "")),
+            *(parse_int(team_data.get(field)) for field in team_index_fields),
+        )
+
+    def format(self) -> str:
+        """
+        Renders the record as the text block of the season report.
+        """
+        return (
+            f"Season: {self.season}\n"
+            f"Position: {format_int(self.position)}\n"
+            f"Played: {format_int(self.played)}\n"
+            f"Points: {format_int(self.points)}\n"
+            f"Goal Difference: {format_int(self.goal_difference, signed=True)}\n"
+            f"Won: {format_int(self.won)}\n"
+            f"Draw: {format_int(self.draw)}\n"
+            f"Loss: {format_int(self.loss)}\n"
+            f"Goals Scored: {format_int(self.goals_scored)}\n"
+            f"Goals Against: {format_int(self.goals_against)}\n"
+            "==================================================\n"
+        )
+
 #####################################
 # Define Functions
 #####################################
 
-def get_manchester_united_table(file_path: pathlib.Path):
+def parse_int(value):
     """
-    Reads the JSON file and extracts Manchester United's performance each season.
+    Converts a table value such as "84" or "+36" to an int (None if missing or not a whole number).
+    """
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def format_int(value, signed: bool = False) -> str:
+    """
+    Renders an int field the way the file stores it ("+36", "-5" and "0" when signed), or N/A.
+    """
+    if value is None:
+        return "N/A"
+    if signed and value:
+        return f"{value:+d}"
+    return str(value)
+
+
+def iter_formatted_records(records):
+    """
+    Yields the text block of each record, rendering one record at a time.
+    """
+    for record in records:
+        yield record.format()
+
+
+def iter_team_seasons(seasons, team: str):
+    """
+    Yields (season year, team data) for every season row of one team.
+
+    Args:
+        seasons: Iterable of season objects (dicts with "season" and "table").
+        team (str): Name of the team to keep.
+
+    Yields:
+        tuple: (season year, the team's row of that season's table)
+    """
+    for season in seasons:  # Loop through each season
+        season_year = season.get("season", "Unknown Season")
+        table = season.get("table", [])
+
+        for team_data in table:  # Loop through each team's data
+            if team_data.get("team", "") == team:
+                yield season_year, team_data
+
+
+def get_team_index_path(file_path: pathlib.Path) -> pathlib.Path:
+    """
+    Returns the path of the team index kept next to the JSON file
+    (premier_league_table.json -> premier_league_table.json.teams.json).
+    """
+    return file_path.with_name(file_path.name + team_index_suffix)
+
+
+def pack_team_row(team_data: dict):
+    """
+    Packs a team's row for the index: a list of the team_index_fields values,
+    or the row itself (without the team) if its keys differ.
+    """
+    if team_data.keys() == team_index_keys:
+        return [team_data[field] for field in team_index_fields]
+    return {key: value for key, value in team_data.items() if key != "team"}
+
+
+def unpack_team_row(team: str, packed) -> dict:
+    """
+    Rebuilds a team's row from its packed index form.
+    """
+    if isinstance(packed, list):
+        return {"team": team, **dict(zip(team_index_fields, packed))}
+    return {"team": team, **packed}
+
+
+def build_team_index(file_path: pathlib.Path) -> dict:
+    """
+    Reads the JSON file once and saves every team's season rows next to it.
 
     Args:
         file_path (pathlib.Path): Path to the JSON file.
 
     Returns:
-        list: List of season records for Manchester United.
+        dict: The index (source size, modification time and SHA-256, the
+            packed row fields, and team -> list of [season, packed row] in
+            file order).
     """
+    stamp = get_source_stamp(file_path)  # Taken first, so a file replaced meanwhile never matches the index
+    teams = {}
+    with file_path.open('r', encoding="utf-8") as file:
+        for season in iter_json_array(file):
+            season_year = season.get("season", "Unknown Season")
+            for team_data in season.get("table", []):
+                team = team_data.get("team", "")
+                teams.setdefault(team, []).append([season_year, pack_team_row(team_data)])
+
+    index = {
+        **stamp,
+        "fields": list(team_index_fields),
+        "teams": teams,
+    }
+    write_team_index(file_path, index)
+    return index
+
+
+def write_team_index(file_path: pathlib.Path, index: dict) -> None:
+    """
+    Writes the team index next to the JSON file, replacing the old one in a single rename.
+    """
+    index_path = get_team_index_path(file_path)
     try:
+        write_json_atomically(index_path, index, separators=(",", ":"))
+    except IOError as io_err:
+        print(f"Warning: Could not write team index {index_path}: {io_err}")
+
+
+def load_team_index(file_path: pathlib.Path) -> dict:
+    """
+    Reads the team index of the JSON file if it still matches the file.
+
+    See utils_hash.read_source_meta; a refreshed modification time is
+    saved back to the index.
+
+    Args:
+        file_path (pathlib.Path): Path to the JSON file.
+
+    Returns:
+        dict: The index, or an empty dict if there is no valid index.
+    """
+    index = read_source_meta(
+        get_team_index_path(file_path),
+        file_path,
+        warn=lambda message: print(f"Warning: {message}"),
+        separators=(",", ":"),
+    )
+    if index.get("fields") != list(team_index_fields):
+        return {}
+    return index
+
+
+def get_team_index(file_path: pathlib.Path) -> dict:
+    """
+    Returns the team index of the JSON file, building it if it is missing or stale.
+
+    The index is kept in memory after the first call, for as long as the
+    file's size and modification time stay the same.
+    """
+    stat = file_path.stat()
+    index = loaded_team_indexes.get(file_path)
+    if not index or (index["size"], index["mtime_ns"]) != (stat.st_size, stat.st_mtime_ns):
+        index = load_team_index(file_path) or build_team_index(file_path)
+        loaded_team_indexes[file_path] = index
+    return index
+
+
+def list_teams(index: dict) -> list:
+    """
+    Returns the names of all teams in the index, sorted.
+    """
+    return sorted(index["teams"])
+
+
+def get_team_history(index: dict, team: str) -> list:
+    """
+    Returns (season year, team data) for every season of one team, from the index.
+
+    Args:
+        index (dict): The team index (see get_team_index).
+        team (str): Name of the team.
+
+    Returns:
+        list: (season year, row) tuples in file order; empty if the team is unknown.
+    """
+    return [(season_year, unpack_team_row(team, packed)) for season_year, packed in index["teams"].get(team, [])]
+
+
+def get_team_table(file_path: pathlib.Path, team: str, reader: str = None, use_index: bool = False):
+    """
+    Reads the JSON file and extracts one team's performance each season.
+
+    Args:
+        file_path (pathlib.Path): Path to the JSON file.
+        team (str): Name of the team.
+        reader (str): "stream" or "load" (see json_readers); defaults to json_reader.
+        use_index (bool): Answer from the team index next to the file
+            (built on first use) instead of scanning every season.
+
+    Returns:
+        list: SeasonRecord objects for the team, in file order.
+    """
+    try:
+        if use_index:
+            history = get_team_history(get_team_index(file_path), team)
+            return [SeasonRecord.from_row(season_year, team_data) for season_year, team_data in history]
+
+        reader = reader or json_reader
+        if reader not in json_readers:
+            raise ValueError(f"Unknown reader '{reader}'; expected one of {json_readers}")
+
         with file_path.open('r', encoding="utf-8") as file:
-            league_data = json.load(file)
+            if reader == "stream":
+                league_data = iter_json_array(file)  # One season decoded at a time
+            else:
+                league_data = json.load(file)
 
-        # Ensure the file contains season data
-        united_performance = []
+            team_performance = [
+                SeasonRecord.from_row(season_year, team_data)
+                for season_year, team_data in iter_team_seasons(league_data, team)
+            ]
 
-        for season in league_data:  # Loop through each season
-            season_year = season.get("season", "Unknown Season")
-            table = season.get("table", [])
-
-            for team_data in table:  # Loop through each team's data
-                if team_data.get("team", "") == team_name:
-                    record = (
-                        f"Season: {season_year}\n"
-                        f"Position: {team_data.get('position', 'N/A')}\n"
-                        f"Played: {team_data.get('played', 'N/A')}\n"
-                        f"Points: {team_data.get('points', 'N/A')}\n"
-                        f"Goal Difference: {team_data.get('goal_difference', 'N/A')}\n"
-                        f"Won: {team_data.get('won', 'N/A')}\n"
-                        f"Draw: {team_data.get('draw', 'N/A')}\n"
-                        f"Loss: {team_data.get('loss', 'N/A')}\n"
-                        f"Goals Scored: {team_data.get('goals_scored', 'N/A')}\n"
-                        f"Goals Against: {team_data.get('goals_against', 'N/A')}\n"
-                        "==================================================\n"
-                    )
-                    united_performance.append(record)
-
-        return united_performance
+        return team_performance
 
     except FileNotFoundError:
         print(f"Error: JSON file not found at {file_path}")
@@ -75,6 +350,100 @@ def get_manchester_united_table(file_path: pathlib.Path):
         print(f"Error processing JSON file: {e}")
         return None
 
+
+def get_manchester_united_table(file_path: pathlib.Path, reader: str = None, use_index: bool = False):
+    """
+    Reads the JSON file and extracts Manchester United's performance each season.
+
+    Args:
+        file_path (pathlib.Path): Path to the JSON file.
+        reader (str): "stream" or "load" (see json_readers); defaults to json_reader.
+        use_index (bool): Answer from the team index next to the file.
+
+    Returns:
+        list: SeasonRecord objects for Manchester United, in file order.
+    """
+    return get_team_table(file_path, team_name, reader=reader, use_index=use_index)
+
+def get_league_columns(file_path: pathlib.Path) -> dict:
+    """
+    Returns the season x team table of the JSON file as one typed array per field.
+
+    The first call reads the file once (one season at a time), converts
+    every value ("+36" -> 36.0, missing -> NaN) and saves the arrays next
+    to the file; later calls memory-map them until the file changes.
+
+    Args:
+        file_path (pathlib.Path): Path to the JSON file.
+
+    Returns:
+        dict: Column name (see league_columns) to its arrays: codes and
+            labels for season and team, values (float64) for the numbers.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+    """
+    if numpy is None:
+        raise ImportError("The league columns need numpy: py -m pip install numpy")
+
+    columns = load_columns(file_path, league_columns)
+    if columns is None:
+        stamp = get_source_stamp(file_path)
+        values = {column: [] for column in league_columns}
+        with file_path.open('r', encoding="utf-8") as file:
+            for season in iter_json_array(file):
+                season_year = str(season.get("season", "Unknown Season"))
+                for team_data in season.get("table", []):
+                    values["season"].append(season_year)
+                    values["team"].append(team_data.get("team", ""))
+                    for field in team_index_fields:
+                        value = team_data.get(field)
+                        values[field].append("" if value is None else str(value))
+        save_columns(
+            file_path,
+            {column: parse_column_values(values[column], kind) for column, kind in league_columns.items()},
+            len(values["season"]),
+            stamp,
+        )
+        columns = load_columns(file_path, league_columns)
+    return columns
+
+
+def points_per_season(columns: dict) -> dict:
+    """
+    Returns the league-wide total points of each season.
+
+    Args:
+        columns (dict): The league columns (see get_league_columns).
+
+    Returns:
+        dict: Season year to total points, in file order.
+    """
+    seasons = columns["season"]
+    points = numpy.nan_to_num(numpy.asarray(columns["points"]["values"]))
+    totals = numpy.bincount(seasons["codes"], weights=points, minlength=len(seasons["labels"]))
+    return {season: int(total) for season, total in zip(seasons["labels"], totals)}
+
+
+def best_goal_difference(columns: dict) -> tuple:
+    """
+    Returns the best goal difference of any team in any season.
+
+    Args:
+        columns (dict): The league columns (see get_league_columns).
+
+    Returns:
+        tuple: (season year, team, goal difference), the first in file order
+            on ties, or None if there are no goal differences.
+    """
+    goal_difference = numpy.asarray(columns["goal_difference"]["values"])
+    if numpy.isnan(goal_difference).all():
+        return None
+    row = int(numpy.nanargmax(goal_difference))
+    season = columns["season"]["labels"][columns["season"]["codes"][row]]
+    team = columns["team"]["labels"][columns["team"]["codes"][row]]
+    return season, team, int(goal_difference[row])
+
 def save_manchester_united_table():
     """
     Reads the JSON file, extracts Manchester United's performance, 
@@ -90,7 +459,7 @@ def save_manchester_united_table():
         with output_file.open('w', encoding="utf-8") as outfile:
             outfile.write("Manchester United Season Performance:\n")
             outfile.write("=" * 50 + "\n")
-            for record in united_performance:
+            for record in iter_formatted_records(united_performance):
                 outfile.write(record + "\n")
 
         print(f"SUCCESS: Manchester United season table saved to {output_file}")
@@ -2,6 +2,17 @@
 This script reads a text file containing the novel Moby Dick,
 counts occurrences of the word "Ahab" (case-insensitive),
 and saves the result to a text file in the 'data_processed' folder.
+
+count_words_occurrences() counts a whole vocabulary (character names,
+for example) in a single pass with the automaton in utils_text.
+
+With whole_word=True (used for the saved count), the file is streamed in
+blocks and only whole words match, compared with Unicode casefolding, so
+"Ahab's" counts but "Ahabs" does not and memory stays flat.
+
+With use_index=True, whole-word questions (counts, top words, words near
+a word) are answered from a word index saved next to the file
+(utils_word_index), built on first use and rebuilt when the file changes.
 """
 
 #####################################
@@ -10,6 +21,11 @@ and saves the result to a text file in the 'data_processed' folder.
 
 import pathlib
 
+# Import from local project modules
+from utils_compress import find_data_file, open_text
+from utils_text import count_terms, count_words
+from utils_word_index import get_word_index
+
 #####################################
 # Declare Global Variables
 #####################################
@@ -24,19 +40,26 @@ word_to_count = "Ahab"
 # Define Functions
 #####################################
 
-def count_word_occurrences(file_path: pathlib.Path, word: str) -> int:
+def count_word_occurrences(file_path: pathlib.Path, word: str, whole_word: bool = False, use_index: bool = False) -> int:
     """
     Count the occurrences of a specific word in a text file (case-insensitive).
 
     Args:
-        file_path (pathlib.Path): Path to the text file.
+        file_path (pathlib.Path): Path to the text file (plain, .gz or .zst).
         word (str): The word to count.
+        whole_word (bool): Stream the file and count only whole-word,
+            casefolded matches instead of every substring match.
+        use_index (bool): Answer from the saved word index (whole words).
 
     Returns:
         int: Number of times the word appears.
     """
     try:
-        with file_path.open('r', encoding="utf-8") as file:
+        if use_index:
+            return get_word_index(file_path).count(word)
+        with open_text(file_path) as file:
+            if whole_word:
+                return count_words(file, [word])[word]
             content = file.read()
             return content.lower().count(word.lower())
     except FileNotFoundError:
@@ -46,15 +69,71 @@ def count_word_occurrences(file_path: pathlib.Path, word: str) -> int:
         print(f"Error reading text file: {e}")
         return 0
 
+def count_words_occurrences(file_path: pathlib.Path, words: list, whole_word: bool = False, use_index: bool = False) -> dict:
+    """
+    Count the occurrences of many words in a text file in one pass (case-insensitive).
+
+    Each word is counted the same way count_word_occurrences counts it,
+    but the file is read once for all of them.
+
+    Args:
+        file_path (pathlib.Path): Path to the text file (plain, .gz or .zst).
+        words (list): The words to count.
+        whole_word (bool): Count only whole-word, casefolded matches.
+        use_index (bool): Answer from the saved word index (whole words).
+
+    Returns:
+        dict: Number of times each word appears (all 0 if the file cannot be read).
+    """
+    try:
+        if use_index:
+            index = get_word_index(file_path)
+            return {word: index.count(word) for word in words}
+        with open_text(file_path) as file:
+            return count_words(file, words) if whole_word else count_terms(file, words)
+    except FileNotFoundError:
+        print(f"Error: Text file not found at {file_path}")
+    except Exception as e:
+        print(f"Error reading text file: {e}")
+    return {word: 0 for word in words}
+
+def get_top_words(file_path: pathlib.Path, n: int = 10) -> list:
+    """
+    Return the n most frequent words of a text file from its saved word index.
+
+    Args:
+        file_path (pathlib.Path): Path to the text file (plain, .gz or .zst).
+        n (int): Number of words to return.
+
+    Returns:
+        list: (word, count) tuples, most frequent first (casefolded words).
+    """
+    return get_word_index(file_path).top(n)
+
+def get_words_near(file_path: pathlib.Path, word: str, distance: int = 5, n: int = 10) -> list:
+    """
+    Return the words seen most often within distance words of word, from the saved word index.
+
+    Args:
+        file_path (pathlib.Path): Path to the text file (plain, .gz or .zst).
+        word (str): The word to look around, such as "whale".
+        distance (int): Number of words on each side to look at.
+        n (int): Number of words to return.
+
+    Returns:
+        list: (word, count) tuples, most frequent first (casefolded words).
+    """
+    return get_word_index(file_path, positions=True).near(word, distance, n)
+
 def save_word_count():
     """
     Reads the text file, counts occurrences of "Ahab",
     and saves the result to a text file in 'data_processed'.
     """
-    input_file = pathlib.Path(fetched_folder_name) / text_file_name
+    input_file = find_data_file(pathlib.Path(fetched_folder_name) / text_file_name)
     output_file = pathlib.Path(processed_folder_name) / output_filename
 
-    word_count = count_word_occurrences(input_file, word_to_count)
+    word_count = count_word_occurrences(input_file, word_to_count, whole_word=True)
 
     output_file.parent.mkdir(parents=True, exist_ok=True)  # Ensure folder exists
     with output_file.open('w', encoding="utf-8") as outfile: